@@ -24,10 +24,31 @@ Main Features:
 
 """
 
-from ift_global.utils.read_yaml import ReadConfig
-from ift_global.connectors.minio_fileops import MinioFileSystemRepo
+if typing.TYPE_CHECKING:
+    from ift_global.connectors.minio_fileops import MinioFileSystemRepo
+    from ift_global.utils.read_yaml import ReadConfig
+
+# public attributes are imported on first access (PEP 562), so `import ift_global`
+# does not pull in boto3, pandas or pyarrow
+_LAZY_ATTRIBUTES = {
+    "ReadConfig": "ift_global.utils.read_yaml",
+    "MinioFileSystemRepo": "ift_global.connectors.minio_fileops",
+}
 
 __all__ = [
     "ReadConfig",
     "MinioFileSystemRepo",
-]
\ No newline at end of file
+]
+
+
+def __getattr__(name: str):
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list:
+    return sorted(set(globals()) | set(__all__))
\ No newline at end of file
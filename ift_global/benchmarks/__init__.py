@@ -0,0 +1,7 @@
+"""
+Benchmarks for the serialisers and MinioFileSystemRepo.
+
+Run with ``python -m ift_global.benchmarks --help``. Repository operations run against
+:class:`InMemoryS3Client`, an in-process stand-in for MinIO with simulated latency,
+so results are comparable across machines and no server is needed.
+"""
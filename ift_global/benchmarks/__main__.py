@@ -0,0 +1,94 @@
+import argparse
+import json
+import platform
+import sys
+from datetime import datetime, timezone
+
+import pandas as pd
+import pyarrow
+
+from ift_global import __version__
+from ift_global.benchmarks.import_time import check_import_budget
+from ift_global.benchmarks.memory import profile_memory
+from ift_global.benchmarks.repository import benchmark_file_io, benchmark_listing
+from ift_global.benchmarks.serialisers import FORMATS, benchmark_serialisers
+
+SUITES = ('serialisers', 'repository', 'memory', 'imports')
+
+
+def _environment() -> dict:
+    return {
+        'timestamp': datetime.now(timezone.utc).isoformat(),
+        'ift_global': __version__,
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'pandas': pd.__version__,
+        'pyarrow': pyarrow.__version__,
+    }
+
+
+def _parse_args(argv: list = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        prog='python -m ift_global.benchmarks',
+        description='Benchmark throughput and peak memory of the ift_global serialisers and MinioFileSystemRepo.',
+    )
+    parser.add_argument('--suite', choices=(*SUITES, 'all'), default='all', help='suite to run, defaults to all')
+    parser.add_argument('--rows', default='1000,10000,100000', help='comma separated dataset sizes in rows')
+    parser.add_argument('--columns', type=int, default=8, help='number of columns of the dataset')
+    parser.add_argument('--dtype-mix', choices=('mixed', 'numeric', 'string'), default='mixed')
+    parser.add_argument('--formats', default=','.join(FORMATS), help='comma separated file formats')
+    parser.add_argument('--files', type=int, default=500, help='number of objects for the listing benchmarks')
+    parser.add_argument('--latency', type=float, default=0.005, help='simulated seconds per request')
+    parser.add_argument('--bandwidth', type=float, default=None, help='simulated bytes per second')
+    parser.add_argument('--repeat', type=int, default=3, help='timed runs, the fastest is kept')
+    parser.add_argument('--import-budget', type=float, default=None,
+                        help='maximum import time in seconds of the statements used by short-lived tasks')
+    parser.add_argument('--output', default=None, help='JSON file for the results, defaults to stdout')
+    return parser.parse_args(argv)
+
+
+def main(argv: list = None) -> dict:
+    """
+    Run the benchmark suites and write the results as JSON.
+
+    When run as a script, the process exits with status 1 if an import statement is over budget.
+
+    :param argv: command line arguments, defaults to sys.argv
+    :type argv: list, optional
+    :return: dictionary with the `environment` and the list of `results`
+    :rtype: dict
+
+    :Example:
+        >>> python -m ift_global.benchmarks --suite serialisers --rows 10000 --output results.json
+    """
+    args = _parse_args(argv)
+    rows = tuple(int(x) for x in args.rows.split(','))
+    formats = tuple(x.strip() for x in args.formats.split(','))
+    results = []
+    if args.suite in ('serialisers', 'all'):
+        results += benchmark_serialisers(
+            rows=rows, n_columns=args.columns, formats=formats, dtype_mix=args.dtype_mix, repeat=args.repeat
+        )
+    if args.suite in ('repository', 'all'):
+        results += benchmark_file_io(
+            rows=rows, latency=args.latency, bandwidth=args.bandwidth, repeat=args.repeat
+        )
+        results += benchmark_listing(n_files=args.files, latency=args.latency, repeat=args.repeat)
+    if args.suite in ('memory', 'all'):
+        results += profile_memory(rows=rows, n_columns=args.columns, formats=formats, dtype_mix=args.dtype_mix)
+    if args.suite in ('imports', 'all'):
+        results += check_import_budget(budget_seconds=args.import_budget)
+    report = {'environment': _environment(), 'results': results}
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+    else:
+        json.dump(report, sys.stdout, indent=2)
+        sys.stdout.write('\n')
+    return report
+
+
+if __name__ == '__main__':
+    benchmark_report = main()
+    if not all(x.get('within_budget', True) for x in benchmark_report['results']):
+        sys.exit(1)
@@ -0,0 +1,77 @@
+import json
+
+import avro.schema
+import numpy as np
+import pandas as pd
+
+DTYPE_MIXES = ('mixed', 'numeric', 'string')
+CANCELLATION_RATE = 0.02
+
+_TICKERS = np.array(['AAPL', 'MSFT', 'AMZN', 'GOOGL', 'META', 'NVDA', 'JPM', 'BAC', 'HSBA', 'BARC', 'VOD', 'BP'])
+_CURRENCIES = np.array(['USD', 'GBP', 'EUR', 'JPY'])
+_SIDES = np.array(['BUY', 'SELL'])
+
+
+def make_trades(n_rows: int, n_columns: int = 8, dtype_mix: str = 'mixed', seed: int = 0) -> pd.DataFrame:
+    """
+    Synthetic Trades Dataset.
+
+    Generate a trade blotter like DataFrame with reproducible random values.
+
+    The `mixed` dataset has the columns trade_id, trade_date, ticker, side, currency,
+    quantity, price and is_cancelled; `numeric` keeps trade_id, quantity and price;
+    `string` keeps trade_date, ticker, side and currency. Additional float columns
+    named factor_<i> are appended up to `n_columns`.
+
+    :param n_rows: number of rows
+    :type n_rows: int
+    :param n_columns: minimum number of columns, defaults to 8
+    :type n_columns: int, optional
+    :param dtype_mix: one of `mixed`, `numeric` or `string`, defaults to 'mixed'
+    :type dtype_mix: str, optional
+    :param seed: random seed, defaults to 0
+    :type seed: int, optional
+    :raises ValueError: if dtype_mix is not accepted
+    :return: synthetic trades
+    :rtype: pd.DataFrame
+
+    :Example:
+        >>> trades = make_trades(1_000, n_columns=12)
+    """
+    if dtype_mix not in DTYPE_MIXES:
+        raise ValueError(f"dtype_mix incorrect, {', '.join(DTYPE_MIXES)} are accepted")
+    rng = np.random.default_rng(seed)
+    trade_dates = np.datetime64('2024-01-02') + rng.integers(0, 250, n_rows).astype('timedelta64[D]')
+    columns = {
+        'trade_id': np.arange(n_rows, dtype='int64'),
+        'trade_date': np.datetime_as_string(trade_dates, unit='D'),
+        'ticker': _TICKERS[rng.integers(0, len(_TICKERS), n_rows)],
+        'side': _SIDES[rng.integers(0, len(_SIDES), n_rows)],
+        'currency': _CURRENCIES[rng.integers(0, len(_CURRENCIES), n_rows)],
+        'quantity': rng.integers(1, 100_000, n_rows, dtype='int64'),
+        'price': np.round(rng.lognormal(4, 0.5, n_rows), 4),
+        'is_cancelled': rng.random(n_rows) < CANCELLATION_RATE,
+    }
+    selected = {
+        'mixed': list(columns),
+        'numeric': ['trade_id', 'quantity', 'price'],
+        'string': ['trade_date', 'ticker', 'side', 'currency'],
+    }[dtype_mix]
+    data = {name: columns[name] for name in selected}
+    for i in range(max(0, n_columns - len(data))):
+        data[f'factor_{i}'] = rng.standard_normal(n_rows)
+    return pd.DataFrame(data)
+
+
+def avro_schema_for(df: pd.DataFrame):
+    """
+    Build an Avro record schema matching the columns of a synthetic dataset.
+
+    :param df: dataset generated by :func:`make_trades`
+    :type df: pd.DataFrame
+    :return: parsed Avro schema
+    :rtype: avro.schema.Schema
+    """
+    avro_types = {'i': 'long', 'u': 'long', 'f': 'double', 'b': 'boolean'}
+    fields = [{'name': name, 'type': avro_types.get(dtype.kind, 'string')} for name, dtype in df.dtypes.items()]
+    return avro.schema.parse(json.dumps({'type': 'record', 'name': 'Trade', 'fields': fields}))
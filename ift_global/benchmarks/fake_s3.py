@@ -0,0 +1,241 @@
+# ruff: noqa: N803 - argument names follow the boto3 client API
+import hashlib
+import re
+import shutil
+import threading
+import time
+from datetime import datetime, timezone
+from io import BytesIO
+from typing import Optional
+
+from botocore.exceptions import ClientError
+
+from ift_global.connectors.minio_fileops import MinioFileSystemRepo
+
+_PAGE_SIZE = 1000
+
+
+class InMemoryS3Client:
+    """
+    In-Process S3 Client.
+
+    Implements the subset of the boto3 S3 client used by :class:`MinioFileSystemRepo`,
+    storing objects in a dictionary. Each request sleeps `latency` seconds, plus the time
+    needed to transfer the payload at `bandwidth` bytes per second, to simulate a remote server.
+
+    :param bucket_name: name of the only bucket served
+    :type bucket_name: str
+    :param latency: seconds added to each request, defaults to 0.0
+    :type latency: float, optional
+    :param bandwidth: bytes per second for payload transfers, defaults to None (unlimited)
+    :type bandwidth: float, optional
+
+    :ivar requests: number of requests served per method
+    :vartype requests: dict
+
+    :Example:
+        >>> client = InMemoryS3Client('benchmark', latency=0.005, bandwidth=100 * 1024**2)
+        >>> repo = in_memory_repo(client)
+    """
+
+    def __init__(self, bucket_name: str, latency: float = 0.0, bandwidth: Optional[float] = None):
+        """Constructor method."""
+        self.bucket_name = bucket_name
+        self.latency = latency
+        self.bandwidth = bandwidth
+        self.requests = {}
+        self._objects = {}
+        self._headers = {}
+        self._uploads = {}
+        self._lock = threading.Lock()
+
+    def _request(self, method: str, n_bytes: int = 0):
+        with self._lock:
+            self.requests[method] = self.requests.get(method, 0) + 1
+        delay = self.latency + (n_bytes / self.bandwidth if self.bandwidth else 0.0)
+        if delay > 0:
+            time.sleep(delay)
+
+    def _get(self, key: str) -> bytes:
+        with self._lock:
+            if key not in self._objects:
+                raise KeyError(f'NoSuchKey: {key}')
+            return self._objects[key]
+
+    def _put(self, key: str, body: bytes, headers: Optional[dict] = None):
+        with self._lock:
+            self._objects[key] = bytes(body)
+            self._headers[key] = {x: headers[x] for x in ('ContentType', 'ContentEncoding', 'Metadata')
+                                  if headers and x in headers}
+
+    def _check_etag(self, key: str, etag: Optional[str], operation_name: str):
+        """Raise the ClientError of S3 if the object does not have the ETag of an If-Match condition."""
+        if etag is not None and etag.strip('"') != hashlib.md5(self._get(key)).hexdigest():
+            raise ClientError(
+                {'Error': {'Code': 'PreconditionFailed', 'Message': 'At least one of the preconditions failed'},
+                 'ResponseMetadata': {'HTTPStatusCode': 412}},
+                operation_name
+            )
+
+    def _entries(self, prefix: str = '', start_after: str = '') -> list:
+        with self._lock:
+            keys = sorted(x for x in self._objects if x.startswith(prefix) and x > start_after)
+            return [{'Key': x, 'Size': len(self._objects[x]), 'ETag': hashlib.md5(self._objects[x]).hexdigest()}
+                    for x in keys]
+
+    def list_buckets(self) -> dict:
+        self._request('list_buckets')
+        return {'ResponseMetadata': {'HTTPStatusCode': 200}, 'Buckets': [{'Name': self.bucket_name}]}
+
+    def _list(self, prefix: str, delimiter: Optional[str], start_after: str = '') -> tuple:
+        if prefix == '/':
+            prefix = ''
+        contents, common_prefixes = [], []
+        for entry in self._entries(prefix, start_after):
+            sub_key = entry['Key'][len(prefix):]
+            if delimiter and delimiter in sub_key:
+                common_prefix = prefix + sub_key.split(delimiter, 1)[0] + delimiter
+                if not common_prefixes or common_prefixes[-1]['Prefix'] != common_prefix:
+                    common_prefixes.append({'Prefix': common_prefix})
+            else:
+                contents.append(entry)
+        return contents, common_prefixes
+
+    def list_objects(self, Bucket: str, Prefix: str = '', Delimiter: Optional[str] = None) -> dict:
+        self._request('list_objects')
+        contents, common_prefixes = self._list(Prefix, Delimiter)
+        response = {'ResponseMetadata': {'HTTPStatusCode': 200}}
+        if contents:
+            response['Contents'] = contents
+        if common_prefixes:
+            response['CommonPrefixes'] = common_prefixes
+        return response
+
+    def get_paginator(self, operation_name: str):
+        if operation_name != 'list_objects_v2':
+            raise NotImplementedError(f'Paginator {operation_name} not available')
+        return self
+
+    def paginate(self, Bucket: str, Prefix: str = '', Delimiter: Optional[str] = None, StartAfter: str = ''):
+        contents, common_prefixes = self._list(Prefix, Delimiter, StartAfter)
+        for first in range(0, max(len(contents), 1), _PAGE_SIZE):
+            self._request('list_objects_v2')
+            page = {'ResponseMetadata': {'HTTPStatusCode': 200}, 'Contents': contents[first:first + _PAGE_SIZE]}
+            if first == 0 and common_prefixes:
+                page['CommonPrefixes'] = common_prefixes
+            yield page
+
+    def head_object(self, Bucket: str, Key: str) -> dict:
+        self._request('head_object')
+        body = self._get(Key)
+        return {'ContentLength': len(body), 'ETag': hashlib.md5(body).hexdigest(),
+                'ContentType': 'binary/octet-stream', 'Metadata': {}, **self._headers.get(Key, {})}
+
+    def get_object(self, Bucket: str, Key: str, Range: Optional[str] = None, IfMatch: Optional[str] = None) -> dict:
+        self._check_etag(Key, IfMatch, 'GetObject')
+        body = self._get(Key)
+        response = {'ResponseMetadata': {'HTTPStatusCode': 200}}
+        if Range is not None:
+            first_byte, last_byte = map(int, re.match(r'bytes=(\d+)-(\d+)', Range).groups())
+            last_byte = min(last_byte, len(body) - 1)
+            # as S3, the total size follows the range served, which is empty past the end of the object
+            served = f'{first_byte}-{last_byte}' if first_byte <= last_byte else '*'
+            response = {'ResponseMetadata': {'HTTPStatusCode': 206}, 'ContentRange': f'bytes {served}/{len(body)}'}
+            body = body[first_byte:last_byte + 1]
+        self._request('get_object', len(body))
+        return {**response, 'ContentLength': len(body), 'Body': BytesIO(body)}
+
+    def put_object(self, Bucket: str, Key: str, Body, **kwargs) -> dict:
+        body = Body.encode('utf-8') if isinstance(Body, str) else bytes(Body)
+        self._request('put_object', len(body))
+        self._put(Key, body, kwargs)
+        return {'ResponseMetadata': {'HTTPStatusCode': 200}, 'ETag': hashlib.md5(body).hexdigest()}
+
+    def upload_file(self, Filename: str, Bucket: str, Key: str):
+        with open(Filename, 'rb') as f:
+            self.put_object(Bucket=Bucket, Key=Key, Body=f.read())
+
+    def download_file(self, Bucket: str, Key: str, Filename: str):
+        response = self.get_object(Bucket=Bucket, Key=Key)
+        with open(Filename, 'wb') as f:
+            shutil.copyfileobj(response['Body'], f)
+
+    def delete_object(self, Bucket: str, Key: str) -> dict:
+        self._request('delete_object')
+        with self._lock:
+            self._objects.pop(Key, None)
+            self._headers.pop(Key, None)
+        return {'ResponseMetadata': {'HTTPStatusCode': 204}}
+
+    def delete_objects(self, Bucket: str, Delete: dict) -> dict:
+        self._request('delete_objects')
+        keys = [x['Key'] for x in Delete['Objects']]
+        with self._lock:
+            for key in keys:
+                self._objects.pop(key, None)
+                self._headers.pop(key, None)
+        if Delete.get('Quiet'):
+            return {'ResponseMetadata': {'HTTPStatusCode': 200}}
+        return {'ResponseMetadata': {'HTTPStatusCode': 200}, 'Deleted': [{'Key': x} for x in keys]}
+
+    def copy_object(self, Bucket: str, Key: str, CopySource: dict) -> dict:
+        self._request('copy_object')
+        body = self._get(CopySource['Key'])
+        self._put(Key, body, self._headers.get(CopySource['Key']))
+        return {'ResponseMetadata': {'HTTPStatusCode': 200},
+                'CopyObjectResult': {'ETag': hashlib.md5(body).hexdigest(), 'LastModified': datetime.now(timezone.utc)}}
+
+    def create_multipart_upload(self, Bucket: str, Key: str, **kwargs) -> dict:
+        self._request('create_multipart_upload')
+        with self._lock:
+            upload_id = f'upload-{len(self._uploads) + 1}'
+            self._uploads[upload_id] = {'headers': kwargs}
+        return {'UploadId': upload_id}
+
+    def upload_part_copy(self, *, Bucket: str, Key: str, CopySource: dict,  # noqa: PLR0913
+                         CopySourceRange: str, PartNumber: int, UploadId: str,
+                         CopySourceIfMatch: Optional[str] = None) -> dict:
+        self._request('upload_part_copy')
+        self._check_etag(CopySource['Key'], CopySourceIfMatch, 'UploadPartCopy')
+        first_byte, last_byte = map(int, re.match(r'bytes=(\d+)-(\d+)', CopySourceRange).groups())
+        part = self._get(CopySource['Key'])[first_byte:last_byte + 1]
+        with self._lock:
+            self._uploads[UploadId][PartNumber] = part
+        return {'CopyPartResult': {'ETag': hashlib.md5(part).hexdigest()}}
+
+    def complete_multipart_upload(self, Bucket: str, Key: str, UploadId: str, MultipartUpload: dict) -> dict:
+        self._request('complete_multipart_upload')
+        with self._lock:
+            parts = self._uploads.pop(UploadId)
+        body = b''.join(parts[x['PartNumber']] for x in MultipartUpload['Parts'])
+        self._put(Key, body, parts['headers'])
+        # S3 does not use the md5 of the content as ETag of multipart objects, the fake does to match its listings
+        return {'ResponseMetadata': {'HTTPStatusCode': 200}, 'ETag': hashlib.md5(body).hexdigest()}
+
+    def abort_multipart_upload(self, Bucket: str, Key: str, UploadId: str) -> dict:
+        self._request('abort_multipart_upload')
+        with self._lock:
+            self._uploads.pop(UploadId, None)
+        return {'ResponseMetadata': {'HTTPStatusCode': 204}}
+
+
+def in_memory_repo(client: InMemoryS3Client, **kwargs) -> MinioFileSystemRepo:
+    """
+    MinioFileSystemRepo backed by an :class:`InMemoryS3Client`.
+
+    :param client: in-process client serving the bucket
+    :type client: InMemoryS3Client
+    :param kwargs: keyword arguments passed to MinioFileSystemRepo, i.e. listing_cache_ttl
+    :return: repository instance, no connection to a MinIO server is made
+    :rtype: MinioFileSystemRepo
+
+    :Example:
+        >>> repo = in_memory_repo(InMemoryS3Client('benchmark', latency=0.005))
+        >>> repo.write_file('/benchmark/data/trades.csv', trades, 'csv')
+    """
+    class InMemoryRepo(MinioFileSystemRepo):
+        def _get_client(self):
+            return client
+
+    return InMemoryRepo(client.bucket_name, user='benchmark', password='benchmark',
+                        endpoint_url='http://in-memory', **kwargs)
@@ -0,0 +1,100 @@
+import json
+import subprocess
+import sys
+from typing import Optional
+
+HEAVY_MODULES = (
+    'avro',
+    'boto3',
+    'botocore',
+    'cryptography',
+    'css_inline',
+    'jinja2',
+    'numpy',
+    'pandas',
+    'pyarrow',
+)
+
+# statements run by short-lived tasks, none of them should load the heavy modules
+BUDGET_STATEMENTS = (
+    'import ift_global',
+    'from ift_global import ReadConfig',
+    'from ift_global.utils.string_utils import trim_string',
+    'from ift_global.utils.logger import IFTLogger',
+    'import ift_global.connectors.file_serialiser',
+    'import ift_global.email.html_tools',
+    'import ift_global.utils.encryption',
+)
+
+_REPORT_MODULES = 'import json, sys; print(json.dumps(sorted(sys.modules)))'
+
+
+def import_profile(statement: str, python: Optional[str] = None) -> dict:
+    """
+    Profile an import statement in a fresh interpreter with ``python -X importtime``.
+
+    :param statement: python statement, i.e. `from ift_global import ReadConfig`
+    :type statement: str
+    :param python: python executable, defaults to sys.executable
+    :type python: str, optional
+    :raises subprocess.CalledProcessError: if the statement fails
+    :return: dictionary with the statement, import_seconds (sum of the self time of all imports),
+        modules (number of modules loaded) and heavy_modules (HEAVY_MODULES loaded)
+    :rtype: dict
+    """
+    completed = subprocess.run(
+        [python or sys.executable, '-X', 'importtime', '-c', f'{statement}\n{_REPORT_MODULES}'],
+        capture_output=True, text=True, check=True,
+    )
+    self_us = 0
+    for line in completed.stderr.splitlines():
+        if line.startswith('import time:') and not line.endswith('imported package'):
+            fields = line[len('import time:'):].split('|')
+            if fields[0].strip().isdigit():
+                self_us += int(fields[0])
+    modules = json.loads(completed.stdout.strip().splitlines()[-1])
+    return {
+        'statement': statement,
+        'import_seconds': self_us / 1e6,
+        'modules': len(modules),
+        'heavy_modules': [x for x in HEAVY_MODULES if x in modules],
+    }
+
+
+def check_import_budget(
+        statements: tuple = BUDGET_STATEMENTS,
+        budget_seconds: Optional[float] = None,
+        python: Optional[str] = None
+    ) -> list:
+    """
+    Check the import time budget of the statements used by short-lived tasks.
+
+    A statement is within budget if it loads none of HEAVY_MODULES and, when `budget_seconds`
+    is set, its imports take less than `budget_seconds`.
+
+    :param statements: import statements checked, defaults to BUDGET_STATEMENTS
+    :type statements: tuple, optional
+    :param budget_seconds: maximum import time per statement, defaults to None (not checked)
+    :type budget_seconds: float, optional
+    :param python: python executable, defaults to sys.executable
+    :type python: str, optional
+    :return: one result dictionary per statement, with `within_budget`
+    :rtype: list
+
+    :Example:
+        >>> [x['statement'] for x in check_import_budget(budget_seconds=0.2) if not x['within_budget']]
+        []
+    """
+    results = []
+    for statement in statements:
+        profile = import_profile(statement, python)
+        within_budget = not profile['heavy_modules'] and (
+            budget_seconds is None or profile['import_seconds'] <= budget_seconds
+        )
+        results.append({
+            'suite': 'imports',
+            **profile,
+            'budget_seconds': budget_seconds,
+            'within_budget': within_budget,
+        })
+    return results
@@ -0,0 +1,204 @@
+import gc
+import os
+import threading
+import time
+import tracemalloc
+from functools import partial
+from typing import Optional
+
+import pyarrow
+
+from ift_global.benchmarks.datasets import avro_schema_for, make_trades
+from ift_global.benchmarks.fake_s3 import InMemoryS3Client, in_memory_repo
+from ift_global.benchmarks.serialisers import FORMATS, _format_callables
+from ift_global.connectors.file_serialiser import deserialise_parquet
+from ift_global.connectors.minio_transfer import BufferBody
+
+BUCKET_NAME = 'memory'
+
+
+def current_rss() -> Optional[int]:
+    """
+    Resident set size of the current process.
+
+    :return: RSS in bytes, None if /proc/self/statm is not available (i.e. not on Linux)
+    :rtype: int, optional
+    """
+    try:
+        with open('/proc/self/statm', encoding='ascii') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError):
+        return None
+
+
+class MemorySampler:
+    """
+    Memory Sampler.
+
+    Samples the resident set size and the bytes allocated by the Arrow memory pool in a background
+    thread, keeping the peak above the values measured when the sampler is entered.
+    Arrow allocations are not seen by tracemalloc, so both are needed to account for a read or write.
+
+    :param interval: seconds between samples, defaults to 0.002
+    :type interval: float, optional
+
+    :Example:
+        >>> with MemorySampler() as sampler:
+        ...     df = deserialise_parquet(BufferBody(payload))
+        >>> sampler.rss_peak, sampler.arrow_peak
+    """
+
+    def __init__(self, interval: float = 0.002):
+        """Constructor method."""
+        self.interval = interval
+        self.rss_peak = None
+        self.arrow_peak = 0
+        self._rss_baseline = None
+        self._arrow_baseline = 0
+        self._stop = threading.Event()
+        self._thread = None
+
+    def _sample(self):
+        rss = current_rss()
+        if rss is not None:
+            self.rss_peak = max(self.rss_peak or 0, rss - self._rss_baseline)
+        self.arrow_peak = max(self.arrow_peak, pyarrow.total_allocated_bytes() - self._arrow_baseline)
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            self._sample()
+
+    def __enter__(self):
+        self._rss_baseline = current_rss()
+        self._arrow_baseline = pyarrow.total_allocated_bytes()
+        self._thread = threading.Thread(target=self._run, name='ift-memory-sampler', daemon=True)
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self._stop.set()
+        self._thread.join()
+        if self._rss_baseline is not None:
+            self._sample()
+
+
+def measure_memory(func, interval: float = 0.002) -> dict:
+    """
+    Measure the peak memory of a callable with tracemalloc and memory sampling.
+
+    :param func: callable without arguments
+    :type func: callable
+    :param interval: seconds between RSS samples, defaults to 0.002
+    :type interval: float, optional
+    :return: dictionary with seconds, tracemalloc_peak_bytes, arrow_peak_bytes and rss_peak_bytes,
+        peaks are measured above the memory in use before the call
+    :rtype: dict
+    """
+    gc.collect()
+    started = not tracemalloc.is_tracing()
+    if started:
+        tracemalloc.start()
+    tracemalloc.reset_peak()
+    baseline, _ = tracemalloc.get_traced_memory()
+    try:
+        with MemorySampler(interval) as sampler:
+            start = time.perf_counter()
+            result = func()
+            seconds = time.perf_counter() - start
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        if started:
+            tracemalloc.stop()
+    del result
+    return {
+        'seconds': seconds,
+        'tracemalloc_peak_bytes': peak - baseline,
+        'arrow_peak_bytes': sampler.arrow_peak,
+        'rss_peak_bytes': sampler.rss_peak,
+    }
+
+
+def _read_write_paths(file_format: str, df, client: InMemoryS3Client) -> tuple:
+    """Callables for each read/write path of a format keyed by (path, variant), and the payload size."""
+    serialise, deserialise = _format_callables(file_format, df)
+    payload = serialise()
+    schema = avro_schema_for(df) if file_format == 'avro' else None
+    path = f'/{BUCKET_NAME}/data/trades.{file_format}'
+    client.put_object(Bucket=BUCKET_NAME, Key=path.replace(f'/{BUCKET_NAME}/', ''), Body=payload)
+    repo = in_memory_repo(client, ranged_read_threshold=None)
+    ranged_repo = in_memory_repo(client, ranged_read_threshold=0)
+    paths = {
+        ('serialise', 'default'): serialise,
+        ('deserialise', 'default'): partial(deserialise, payload),
+        ('write_file', 'default'): partial(repo.write_file, f'{path}.copy', df, file_format, avro_schema=schema),
+        ('read_file', 'single_get'): partial(repo.read_file, path, file_type=file_format, avro_schema=schema),
+        ('read_file', 'ranged_get'): partial(ranged_repo.read_file, path, file_type=file_format, avro_schema=schema),
+    }
+    if file_format == 'parquet':
+        paths['deserialise', 'arrow_dtypes'] = lambda: deserialise_parquet(BufferBody(payload), 'pyarrow')
+    return paths, len(payload)
+
+
+def profile_memory(
+        rows: tuple = (100_000,),
+        *,
+        n_columns: int = 8,
+        formats: tuple = FORMATS,
+        dtype_mix: str = 'mixed',
+        interval: float = 0.002
+    ) -> list:
+    """
+    Profile the peak memory of the read and write paths of each format.
+
+    Each path runs once under tracemalloc while RSS and Arrow allocations are sampled, the peaks are
+    reported in bytes and as a ratio to the payload size, i.e. a `read_file` rss_ratio of 4 means
+    reading a 100MB object needs 400MB of memory on top of what the process was using.
+    Memory-saving variants are reported alongside the default path, i.e. parquet with Arrow dtypes.
+
+    .. note::
+        RSS is only sampled on Linux and memory released to the allocator may not be returned to
+        the operating system, run a single format per process for the most accurate RSS figures.
+
+    :param rows: dataset sizes in rows, defaults to (100_000,)
+    :type rows: tuple, optional
+    :param n_columns: number of columns, defaults to 8
+    :type n_columns: int, optional
+    :param formats: formats profiled, defaults to csv, parquet, pickle and avro
+    :type formats: tuple, optional
+    :param dtype_mix: column types, one of `mixed`, `numeric` or `string`, defaults to 'mixed'
+    :type dtype_mix: str, optional
+    :param interval: seconds between RSS samples, defaults to 0.002
+    :type interval: float, optional
+    :return: one result dictionary per format, size, path and variant
+    :rtype: list
+
+    :Example:
+        >>> results = profile_memory(rows=(1_000_000,), formats=('parquet',))
+        >>> {(x['path'], x['variant']): x['rss_ratio'] for x in results}
+    """
+    results = []
+    client = InMemoryS3Client(BUCKET_NAME)
+    for n_rows in rows:
+        df = make_trades(n_rows, n_columns=n_columns, dtype_mix=dtype_mix)
+        for file_format in formats:
+            paths, payload_bytes = _read_write_paths(file_format, df, client)
+            for (path, variant), func in paths.items():
+                measured = measure_memory(func, interval)
+                results.append({
+                    'suite': 'memory',
+                    'format': file_format,
+                    'path': path,
+                    'variant': variant,
+                    'rows': n_rows,
+                    'columns': df.shape[1],
+                    'payload_bytes': payload_bytes,
+                    **measured,
+                    'tracemalloc_ratio': measured['tracemalloc_peak_bytes'] / payload_bytes,
+                    'arrow_ratio': measured['arrow_peak_bytes'] / payload_bytes,
+                    'rss_ratio': None if measured['rss_peak_bytes'] is None
+                    else measured['rss_peak_bytes'] / payload_bytes,
+                })
+            client.delete_objects(Bucket=BUCKET_NAME, Delete={'Objects': [
+                {'Key': f'data/trades.{file_format}'}, {'Key': f'data/trades.{file_format}.copy'}
+            ]})
+    return results
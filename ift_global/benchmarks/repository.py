@@ -0,0 +1,141 @@
+from ift_global.benchmarks.datasets import make_trades
+from ift_global.benchmarks.fake_s3 import InMemoryS3Client, in_memory_repo
+from ift_global.benchmarks.serialisers import time_call
+from ift_global.connectors.minio_transfer import MB
+
+BUCKET_NAME = 'benchmark'
+FOOTER_BYTES = 64 * 1024
+
+
+def _run(client: InMemoryS3Client, func, repeat: int) -> tuple:
+    """Time a callable, returning the fastest run and the requests sent per run."""
+    requests_before = sum(client.requests.values())
+    seconds, result = time_call(func, repeat)
+    requests = (sum(client.requests.values()) - requests_before) / max(1, repeat)
+    return seconds, requests, result
+
+
+def _result(operation: str, seconds: float, requests: float, latency: float, **fields) -> dict:
+    result = {
+        'suite': 'repository',
+        'operation': operation,
+        'latency': latency,
+        'seconds': seconds,
+        'requests': requests,
+        **fields,
+    }
+    if 'payload_bytes' in fields:
+        result['mb_per_second'] = fields['payload_bytes'] / MB / seconds
+    return result
+
+
+def benchmark_file_io(  # noqa: PLR0913
+        rows: tuple = (10_000, 100_000),
+        *,
+        file_format: str = 'parquet',
+        latency: float = 0.005,
+        bandwidth: float = None,
+        repeat: int = 3,
+        max_concurrency: int = 10
+    ) -> list:
+    """
+    Benchmark write_file, read_file and open against an in-process S3 client.
+
+    `read_file` is measured with a single ``get_object`` and with concurrent ranged requests
+    of 1MB, `open` is measured reading the last 64KB of the object, i.e. a parquet footer.
+
+    :param rows: dataset sizes in rows, defaults to (10_000, 100_000)
+    :type rows: tuple, optional
+    :param file_format: file format written and read, defaults to 'parquet'
+    :type file_format: str, optional
+    :param latency: simulated seconds per request, defaults to 0.005
+    :type latency: float, optional
+    :param bandwidth: simulated bytes per second, defaults to None (unlimited)
+    :type bandwidth: float, optional
+    :param repeat: number of timed runs, defaults to 3
+    :type repeat: int, optional
+    :param max_concurrency: threads used for ranged reads, defaults to 10
+    :type max_concurrency: int, optional
+    :return: one result dictionary per operation and size
+    :rtype: list
+    """
+    client = InMemoryS3Client(BUCKET_NAME, latency=latency, bandwidth=bandwidth)
+    repos = {
+        'read_file': in_memory_repo(client, ranged_read_threshold=None),
+        'read_file_ranged': in_memory_repo(
+            client, ranged_read_threshold=0, ranged_read_chunksize=MB, max_concurrency=max_concurrency
+        ),
+    }
+    return [result for n_rows in rows for result in _file_io_results(client, repos, n_rows, file_format, repeat)]
+
+
+def _file_io_results(client: InMemoryS3Client, repos: dict, n_rows: int, file_format: str, repeat: int) -> list:
+    df = make_trades(n_rows)
+    path = f'/{BUCKET_NAME}/io/trades_{n_rows}.{file_format}'
+    key = path.replace(f'/{BUCKET_NAME}/', '')
+    latency = client.latency
+    seconds, requests, _ = _run(client, lambda: repos['read_file'].write_file(path, df, file_type=file_format), repeat)
+    payload_bytes = client.head_object(Bucket=BUCKET_NAME, Key=key)['ContentLength']
+    fields = {'format': file_format, 'rows': n_rows, 'payload_bytes': payload_bytes}
+    results = [_result('write_file', seconds, requests, latency, **fields)]
+    for operation, repo in repos.items():
+        seconds, requests, _ = _run(client, lambda repo=repo: repo.read_file(path, file_type=file_format), repeat)
+        results.append(_result(operation, seconds, requests, latency, **fields))
+
+    def read_footer():
+        with repos['read_file'].open(path, block_size=FOOTER_BYTES, read_ahead=0) as f:
+            f.seek(-min(payload_bytes, FOOTER_BYTES), 2)
+            return f.read()
+    seconds, requests, _ = _run(client, read_footer, repeat)
+    results.append(_result('open_read_footer', seconds, requests, latency, format=file_format, rows=n_rows))
+    return results
+
+
+def benchmark_listing(
+        n_files: int = 500,
+        *,
+        latency: float = 0.005,
+        repeat: int = 3,
+        max_workers: int = 10
+    ) -> list:
+    """
+    Benchmark listing, walk, copy and delete operations against an in-process S3 client.
+
+    Objects are laid out as `listing/<year>/<month>/file_<i>.csv`. Listing and walk are measured
+    without and with the listing cache, copy_prefix and delete_prefix are measured once.
+
+    :param n_files: number of objects, defaults to 500
+    :type n_files: int, optional
+    :param latency: simulated seconds per request, defaults to 0.005
+    :type latency: float, optional
+    :param repeat: number of timed runs, defaults to 3
+    :type repeat: int, optional
+    :param max_workers: threads used by walk, defaults to 10
+    :type max_workers: int, optional
+    :return: one result dictionary per operation
+    :rtype: list
+    """
+    client = InMemoryS3Client(BUCKET_NAME, latency=latency)
+    for i in range(n_files):
+        year, month = 2020 + (i // 12) % 5, i % 12 + 1
+        client.put_object(Bucket=BUCKET_NAME, Key=f'listing/{year}/{month:02d}/file_{i}.csv', Body=b'a,b\n1,2\n')
+    results = []
+    for cache_ttl in (None, 300):
+        repo = in_memory_repo(client, listing_cache_ttl=cache_ttl, max_concurrency=max_workers)
+        fields = {'files': n_files, 'listing_cache_ttl': cache_ttl}
+        operations = (
+            ('list_files', lambda repo=repo: repo.list_files(f'/{BUCKET_NAME}/listing/2020/01/')),
+            ('file_exists', lambda repo=repo: repo.file_exists(f'/{BUCKET_NAME}/listing/2020/01/file_0.csv')),
+            ('walk', lambda repo=repo: list(repo.walk(f'/{BUCKET_NAME}/listing/', max_workers=max_workers))),
+        )
+        for operation, func in operations:
+            seconds, requests, _ = _run(client, func, repeat)
+            results.append(_result(operation, seconds, requests, latency, **fields))
+    repo = in_memory_repo(client, max_concurrency=max_workers)
+    for operation, func in (
+            ('copy_prefix', lambda: repo.copy_prefix(f'/{BUCKET_NAME}/listing/', f'/{BUCKET_NAME}/copy/')),
+            ('delete_prefix', lambda: repo.delete_prefix(f'/{BUCKET_NAME}/copy/')),
+        ):
+        seconds, requests, _ = _run(client, func, 1)
+        results.append(_result(operation, seconds, requests, latency, files=n_files))
+    return results
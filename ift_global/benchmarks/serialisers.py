@@ -0,0 +1,123 @@
+import time
+import tracemalloc
+from functools import partial
+
+from ift_global.benchmarks.datasets import avro_schema_for, make_trades
+from ift_global.connectors.file_serialiser import abstraction_deserialiser, abstraction_serialiser
+from ift_global.connectors.minio_transfer import MB, BufferBody
+
+FORMATS = ('csv', 'parquet', 'pickle', 'avro')
+
+
+def time_call(func, repeat: int = 3) -> tuple:
+    """
+    Time a callable, keeping the fastest of `repeat` runs.
+
+    :param func: callable without arguments
+    :type func: callable
+    :param repeat: number of runs, defaults to 3
+    :type repeat: int, optional
+    :return: fastest duration in seconds and the result of the last run
+    :rtype: tuple
+    """
+    best, result = float('inf'), None
+    for _ in range(max(1, repeat)):
+        start = time.perf_counter()
+        result = func()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def peak_memory(func) -> int:
+    """
+    Peak memory allocated by the Python allocator while running a callable.
+
+    :param func: callable without arguments
+    :type func: callable
+    :return: peak traced memory in bytes, measured with tracemalloc
+    :rtype: int
+    """
+    started = not tracemalloc.is_tracing()
+    if started:
+        tracemalloc.start()
+    tracemalloc.reset_peak()
+    baseline, _ = tracemalloc.get_traced_memory()
+    try:
+        func()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        if started:
+            tracemalloc.stop()
+    return peak - baseline
+
+
+def _format_callables(file_format: str, df) -> tuple:
+    serialiser = abstraction_serialiser(file_format)
+    deserialiser = abstraction_deserialiser(file_format)
+    extra_args = (avro_schema_for(df),) if file_format == 'avro' else ()
+
+    def serialise() -> bytes:
+        payload = serialiser(df, *extra_args)
+        return payload.encode('utf-8') if isinstance(payload, str) else payload
+
+    def deserialise(payload: bytes):
+        return deserialiser(BufferBody(payload), *extra_args)
+
+    return serialise, deserialise
+
+
+def benchmark_serialisers(
+        rows: tuple = (1_000, 10_000, 100_000),
+        *,
+        n_columns: int = 8,
+        formats: tuple = FORMATS,
+        dtype_mix: str = 'mixed',
+        repeat: int = 3
+    ) -> list:
+    """
+    Benchmark the serialisers and deserialisers of `file_serialiser`.
+
+    For each format and dataset size, measures the fastest of `repeat` runs and the peak memory
+    of one serialise/deserialise round trip on a synthetic trades dataset.
+
+    :param rows: dataset sizes in rows, defaults to (1_000, 10_000, 100_000)
+    :type rows: tuple, optional
+    :param n_columns: number of columns, defaults to 8
+    :type n_columns: int, optional
+    :param formats: formats benchmarked, defaults to csv, parquet, pickle and avro
+    :type formats: tuple, optional
+    :param dtype_mix: column types, one of `mixed`, `numeric` or `string`, defaults to 'mixed'
+    :type dtype_mix: str, optional
+    :param repeat: number of timed runs, defaults to 3
+    :type repeat: int, optional
+    :return: one result dictionary per format and size
+    :rtype: list
+
+    :Example:
+        >>> results = benchmark_serialisers(rows=(10_000,), formats=('csv', 'parquet'))
+    """
+    results = []
+    for n_rows in rows:
+        df = make_trades(n_rows, n_columns=n_columns, dtype_mix=dtype_mix)
+        for file_format in formats:
+            serialise, deserialise = _format_callables(file_format, df)
+            serialise_seconds, payload = time_call(serialise, repeat)
+            deserialise_seconds, _ = time_call(partial(deserialise, payload), repeat)
+            payload_mb = len(payload) / MB
+            results.append({
+                'suite': 'serialisers',
+                'format': file_format,
+                'rows': n_rows,
+                'columns': df.shape[1],
+                'dtype_mix': dtype_mix,
+                'payload_bytes': len(payload),
+                'serialise_seconds': serialise_seconds,
+                'deserialise_seconds': deserialise_seconds,
+                'serialise_mb_per_second': payload_mb / serialise_seconds,
+                'deserialise_mb_per_second': payload_mb / deserialise_seconds,
+                'serialise_rows_per_second': n_rows / serialise_seconds,
+                'deserialise_rows_per_second': n_rows / deserialise_seconds,
+                'serialise_peak_memory_bytes': peak_memory(serialise),
+                'deserialise_peak_memory_bytes': peak_memory(partial(deserialise, payload)),
+            })
+    return results
@@ -0,0 +1,309 @@
+"""
+Vectorised business-day calendars.
+
+Exclusion dates are held per :class:`Country` as sorted, unique ``numpy.datetime64[D]`` arrays,
+and business-date maths runs on whole arrays of dates with the ``numpy.busday_*`` functions.
+The calendar of a country excludes its own dates and the dates of ``Country.ALL``.
+"""
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Iterable, Mapping, Optional, Union
+
+import numpy as np
+
+from ift_global.business_date.calendar_exclusions import COUNTRY_VALUES, CalendarExtract, Country
+
+DEFAULT_WEEKMASK = '1111100'
+
+# business day conventions of BusinessCalendar.adjust, by name of the numpy.busday_offset roll
+ROLL_CONVENTIONS = {
+    'following': 'following',
+    'modified_following': 'modifiedfollowing',
+    'preceding': 'preceding',
+    'modified_preceding': 'modifiedpreceding',
+}
+END_OF_MONTH = 'end_of_month'
+UNADJUSTED = 'unadjusted'
+
+
+def as_country(country: Union[Country, str]) -> Country:
+    """
+    Convert a country to :class:`Country`.
+
+    :param country: Country member, member name as 'US' or value as 'usa', case insensitive
+    :type country: Union[Country, str]
+    :raises ValueError: if country is not a :class:`Country`
+    :return: country
+    :rtype: Country
+    """
+    if isinstance(country, Country):
+        return country
+    country_key = str(country).strip()
+    if country_key.upper() in Country.__members__:
+        return Country[country_key.upper()]
+    if country_key.lower() in COUNTRY_VALUES:
+        return Country(country_key.lower())
+    raise ValueError(f'Unexpected country {country}, accepted {", ".join(x.name for x in Country)}')
+
+
+def as_countries(countries) -> frozenset:
+    """
+    Convert a country, or several countries of a combined calendar, to a frozenset of :class:`Country`.
+
+    :param countries: country or iterable of countries, as accepted by :func:`as_country`
+    :type countries: Union[Country, str, Iterable]
+    :return: countries
+    :rtype: frozenset
+    """
+    if isinstance(countries, (Country, str)):
+        return frozenset((as_country(countries),))
+    return frozenset(as_country(x) for x in countries)
+
+
+def as_dates(dates) -> np.ndarray:
+    """
+    Convert dates to a ``numpy.datetime64[D]`` array.
+
+    Timezone-aware dates are truncated to the day in their own timezone, not in UTC.
+
+    :param dates: date, iso string, numpy datetime64 or a list, array or pd.Series of them
+    :return: dates truncated to the day
+    :rtype: np.ndarray
+    """
+    if hasattr(dates, 'dt') and getattr(dates.dtype, 'tz', None) is not None:
+        dates = dates.dt.tz_localize(None)
+    elif getattr(dates, 'tz', None) is not None:
+        # pd.DatetimeIndex or pd.Timestamp
+        dates = dates.tz_localize(None)
+    elif isinstance(dates, datetime) and dates.tzinfo is not None:
+        dates = dates.replace(tzinfo=None)
+    if hasattr(dates, 'to_numpy'):
+        dates = dates.to_numpy()
+    elif not hasattr(dates, '__array__') and not isinstance(dates, (str, bytes)) and hasattr(dates, '__iter__'):
+        dates = list(dates)
+    return np.asarray(dates).astype('datetime64[D]')
+
+
+class BusinessCalendar:
+    """
+    Business Calendar.
+
+    Holds the exclusion dates of each :class:`Country`, and computes business days on arrays
+    of dates with ``numpy.busday_offset``, ``numpy.busday_count`` and ``numpy.is_busday``.
+    Business days are the weekdays of `weekmask` not excluded for the country or for ``Country.ALL``.
+    Where a country is expected, a tuple of countries gives their combined calendar, i.e.
+    ``(Country.US, Country.GB)`` for days which are business days in both.
+
+    Methods accept a single date or an array-like of dates (list, numpy array, pd.Series) and
+    return ``numpy.datetime64[D]`` values.
+
+    :param holidays: exclusion dates by country, defaults to no exclusions
+    :type holidays: Mapping[Union[Country, str], Iterable], optional
+    :param weekmask: working days from Monday to Sunday as in ``numpy.busdaycalendar``, defaults to '1111100'
+    :type weekmask: str, optional
+
+    :Example:
+        >>> calendar = BusinessCalendar({Country.US: ['2025-07-04'], Country.ALL: ['2025-12-25']})
+        >>> calendar.add_business_days(['2025-07-03', '2025-12-24'], 1, Country.US)
+        array(['2025-07-07', '2025-12-26'], dtype='datetime64[D]')
+        >>> trades['settle_date'] = calendar.add_business_days(trades['trade_date'], 2, 'US')
+        >>> calendar.add_business_days('2025-07-03', 1, (Country.US, Country.GB))
+        numpy.datetime64('2025-07-07')
+    """
+
+    def __init__(
+            self,
+            holidays: Optional[Mapping[Union[Country, str], Iterable]] = None,
+            weekmask: str = DEFAULT_WEEKMASK
+        ):
+        """Constructor method."""
+        self.weekmask = weekmask
+        self._holidays = {}
+        for country_key, dates in (holidays or {}).items():
+            country = as_country(country_key)
+            country_dates = as_dates(dates).ravel()
+            self._holidays[country] = np.union1d(self._holidays.get(country, country_dates), country_dates)
+        self._calendars = {}
+
+    @classmethod
+    def from_extracts(cls, extracts: Iterable[CalendarExtract], weekmask: str = DEFAULT_WEEKMASK):
+        """
+        Build a calendar from :class:`CalendarExtract` rows, rows of unexpected countries are skipped.
+
+        :param extracts: exclusion dates
+        :type extracts: Iterable[CalendarExtract]
+        :param weekmask: working days from Monday to Sunday, defaults to '1111100'
+        :type weekmask: str, optional
+        :return: calendar
+        :rtype: BusinessCalendar
+        """
+        holidays = {}
+        for extract in extracts:
+            try:
+                country = as_country(extract.country)
+            except ValueError:
+                continue
+            holidays.setdefault(country, []).append(extract.exclude_date.date())
+        return cls(holidays, weekmask=weekmask)
+
+    @property
+    def countries(self) -> list:
+        """Countries with exclusion dates."""
+        return list(self._holidays)
+
+    def holidays(self, country: Union[Country, str, Iterable] = Country.ALL) -> np.ndarray:
+        """
+        Exclusion dates of a country, including the dates of ``Country.ALL``.
+
+        :param country: country or iterable of countries, defaults to Country.ALL
+        :type country: Union[Country, str, Iterable], optional
+        :return: sorted unique dates
+        :rtype: np.ndarray
+        """
+        return self.busdaycalendar(country).holidays
+
+    def busdaycalendar(self, country: Union[Country, str, Iterable] = Country.ALL) -> np.busdaycalendar:
+        """
+        Numpy business day calendar of a country or countries combined, built once and cached.
+
+        :param country: country or iterable of countries, defaults to Country.ALL
+        :type country: Union[Country, str, Iterable], optional
+        :return: calendar usable with the ``numpy.busday_*`` functions
+        :rtype: np.busdaycalendar
+        """
+        countries = as_countries(country)
+        calendar = self._calendars.get(countries)
+        if calendar is None:
+            country_holidays = [self._holidays[x] for x in countries | {Country.ALL} if x in self._holidays]
+            holidays = (
+                np.unique(np.concatenate(country_holidays)) if country_holidays
+                else np.array([], dtype='datetime64[D]')
+            )
+            calendar = self._calendars[countries] = np.busdaycalendar(weekmask=self.weekmask, holidays=holidays)
+        return calendar
+
+    def is_business_day(self, dates, country: Union[Country, str, Iterable] = Country.ALL) -> np.ndarray:
+        """
+        Check which dates are business days.
+
+        :param dates: date or array-like of dates
+        :param country: country or iterable of countries, defaults to Country.ALL
+        :type country: Union[Country, str, Iterable], optional
+        :return: True for business days
+        :rtype: np.ndarray
+        """
+        return np.is_busday(as_dates(dates), busdaycal=self.busdaycalendar(country))
+
+    def add_business_days(
+            self,
+            dates,
+            days,
+            country: Union[Country, str, Iterable] = Country.ALL,
+            roll: str = 'following'
+        ) -> np.ndarray:
+        """
+        Add business days to dates.
+
+        Dates which are not business days are first rolled with `roll`, as in ``numpy.busday_offset``.
+
+        :param dates: date or array-like of dates
+        :param days: number of business days to add, negative to subtract, int or array-like broadcast with dates
+        :type days: Union[int, np.ndarray]
+        :param country: country or iterable of countries, defaults to Country.ALL
+        :type country: Union[Country, str, Iterable], optional
+        :param roll: 'following', 'preceding', 'modifiedfollowing', 'modifiedpreceding', 'forward',
+            'backward' or 'raise', defaults to 'following'
+        :type roll: str, optional
+        :return: shifted dates
+        :rtype: np.ndarray
+        """
+        return np.busday_offset(as_dates(dates), days, roll=roll, busdaycal=self.busdaycalendar(country))
+
+    def adjust(
+            self,
+            dates,
+            convention: str = 'following',
+            country: Union[Country, str, Iterable] = Country.ALL
+        ) -> np.ndarray:
+        """
+        Adjust dates to business days with a business day convention.
+
+        - 'following': next business day
+        - 'modified_following': next business day, unless in the next month, then previous business day
+        - 'preceding': previous business day
+        - 'modified_preceding': previous business day, unless in the previous month, then next business day
+        - 'end_of_month': last business day of the month of the date, for any date
+        - 'unadjusted': dates unchanged
+
+        Business days are left unchanged, except by 'end_of_month'.
+
+        :param dates: date or array-like of dates
+        :param convention: business day convention, defaults to 'following'
+        :type convention: str, optional
+        :param country: country or iterable of countries, defaults to Country.ALL
+        :type country: Union[Country, str, Iterable], optional
+        :raises ValueError: if convention is not expected
+        :return: adjusted dates
+        :rtype: np.ndarray
+
+        :Example:
+            >>> calendar.adjust(['2025-05-31', '2025-07-04'], 'modified_following', Country.US)
+            array(['2025-05-30', '2025-07-07'], dtype='datetime64[D]')
+        """
+        dates = as_dates(dates)
+        if convention == UNADJUSTED:
+            return dates
+        if convention == END_OF_MONTH:
+            month_ends = (dates.astype('datetime64[M]') + 1).astype('datetime64[D]') - np.timedelta64(1, 'D')
+            return np.busday_offset(month_ends, 0, roll='preceding', busdaycal=self.busdaycalendar(country))
+        if convention not in ROLL_CONVENTIONS:
+            accepted = ', '.join((*ROLL_CONVENTIONS, END_OF_MONTH, UNADJUSTED))
+            raise ValueError(f'Unexpected convention {convention}, accepted {accepted}')
+        return np.busday_offset(
+            dates, 0, roll=ROLL_CONVENTIONS[convention], busdaycal=self.busdaycalendar(country)
+        )
+
+    def business_days_between(
+            self,
+            start_dates,
+            end_dates,
+            country: Union[Country, str, Iterable] = Country.ALL
+        ) -> np.ndarray:
+        """
+        Count the business days from start dates, included, to end dates, excluded.
+
+        :param start_dates: date or array-like of dates
+        :param end_dates: date or array-like of dates, broadcast with start_dates
+        :param country: country or iterable of countries, defaults to Country.ALL
+        :type country: Union[Country, str, Iterable], optional
+        :return: number of business days, negative if end is before start. If a date is NaT, the
+            counts are floats and NaN where a date is missing.
+        :rtype: np.ndarray
+        """
+        start_dates, end_dates = np.broadcast_arrays(as_dates(start_dates), as_dates(end_dates))
+        missing = np.isnat(start_dates) | np.isnat(end_dates)
+        if not missing.any():
+            return np.busday_count(start_dates, end_dates, busdaycal=self.busdaycalendar(country))
+        counts = np.busday_count(
+            np.where(missing, np.datetime64(0, 'D'), start_dates),
+            np.where(missing, np.datetime64(0, 'D'), end_dates),
+            busdaycal=self.busdaycalendar(country)
+        )
+        return np.where(missing, np.nan, counts)[()]
+
+    def date_range(self, start_date, end_date, country: Union[Country, str, Iterable] = Country.ALL) -> np.ndarray:
+        """
+        Business days from start_date to end_date, both included.
+
+        :param start_date: first date
+        :param end_date: last date
+        :param country: country or iterable of countries, defaults to Country.ALL
+        :type country: Union[Country, str, Iterable], optional
+        :return: business days
+        :rtype: np.ndarray
+        """
+        calendar = self.busdaycalendar(country)
+        first_day = np.busday_offset(as_dates(start_date), 0, roll='forward', busdaycal=calendar)
+        n_days = np.busday_count(first_day, as_dates(end_date) + np.timedelta64(1, 'D'), busdaycal=calendar)
+        return np.busday_offset(first_day, np.arange(max(int(n_days), 0)), busdaycal=calendar)
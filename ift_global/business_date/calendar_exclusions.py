@@ -20,6 +20,10 @@ class Country(Enum):
     JP = "japan"
 
 
+# values of Country, built once to check the country of each calendar row
+COUNTRY_VALUES = frozenset(x.value for x in Country)
+
+
 @dataclass
 class CalendarExtract():
     """
@@ -31,5 +35,5 @@ class CalendarExtract():
 
     def __post_init__(self):
         self.exclude_date = datetime.datetime.strptime(self.exclude_date, '%Y-%m-%d')
-        if self.country.lower() not in [b1.value for b1 in Country]:
+        if self.country.lower() not in COUNTRY_VALUES:
             print("Unexpected country in calendar input file: Skipping", self.country)
\ No newline at end of file
@@ -0,0 +1,150 @@
+"""
+Bulk loader of calendar exclusion files.
+
+A calendar file is a csv with one exclusion date per row, in the columns of :class:`CalendarExtract`::
+
+    country,exclude_date
+    usa,2025-07-04
+    global,2025-12-25
+
+The file is parsed in one pass by the arrow csv reader, dates included, and indexed per
+:class:`Country` into a :class:`BusinessCalendar`. Calendars are cached by source, and read
+again only when the file changes: local files are checked by modification time and size,
+objects in MinIO by ETag.
+"""
+from __future__ import annotations
+
+import io
+import logging
+import os
+import threading
+from typing import TYPE_CHECKING, Optional
+
+import numpy as np
+
+from ift_global.business_date.business_calendar import DEFAULT_WEEKMASK, BusinessCalendar, as_country
+
+if TYPE_CHECKING:
+    from ift_global.connectors.minio_fileops import MinioFileSystemRepo
+
+logger = logging.getLogger(__name__)
+
+CALENDAR_COLUMNS = ('country', 'exclude_date')
+
+# calendars by source, as (version, calendar), version being (mtime_ns, size) or the ETag
+_calendar_cache = {}
+_calendar_cache_lock = threading.Lock()
+
+
+def clear_calendar_cache():
+    """Discard the calendars cached by :func:`load_calendar`."""
+    with _calendar_cache_lock:
+        _calendar_cache.clear()
+
+
+def parse_calendar(content: bytes, sep: str = ',', weekmask: str = DEFAULT_WEEKMASK) -> BusinessCalendar:
+    """
+    Parse the content of a calendar file.
+
+    Countries are matched by value or name of :class:`Country`, case insensitive, and the rows
+    of unexpected countries are skipped.
+
+    :param content: csv content, with country and exclude_date (YYYY-MM-DD) columns
+    :type content: bytes
+    :param sep: csv delimiter, defaults to ','
+    :type sep: str, optional
+    :param weekmask: working days from Monday to Sunday, defaults to '1111100'
+    :type weekmask: str, optional
+    :raises ValueError: if a column is missing or a date is not valid
+    :return: calendar
+    :rtype: BusinessCalendar
+    """
+    import pyarrow
+    from pyarrow import csv
+
+    if isinstance(content, str):
+        content = content.encode('utf-8')
+    try:
+        table = csv.read_csv(
+            io.BytesIO(content),
+            parse_options=csv.ParseOptions(delimiter=sep),
+            convert_options=csv.ConvertOptions(
+                column_types={'country': pyarrow.string(), 'exclude_date': pyarrow.date32()},
+                include_columns=list(CALENDAR_COLUMNS),
+            ),
+        )
+    except (pyarrow.ArrowInvalid, pyarrow.ArrowKeyError) as e:
+        raise ValueError(f'Cannot parse calendar file, columns {", ".join(CALENDAR_COLUMNS)} expected: {e}')
+
+    countries = np.asarray(table.column('country').to_numpy(zero_copy_only=False), dtype=object)
+    dates = table.column('exclude_date').to_numpy()
+    country_labels, country_index = np.unique(countries, return_inverse=True)
+    holidays, skipped = {}, []
+    for label_index, label in enumerate(country_labels):
+        try:
+            country = as_country(label)
+        except ValueError:
+            skipped.append(label)
+            continue
+        # labels as 'usa' and 'US' name the same country, their dates are merged by BusinessCalendar
+        holidays.setdefault(country, []).append(dates[country_index == label_index])
+    if skipped:
+        logger.warning('Unexpected countries in calendar input file: Skipping %s', ', '.join(map(str, skipped)))
+    return BusinessCalendar({x: np.concatenate(y) for x, y in holidays.items()}, weekmask=weekmask)
+
+
+def load_calendar(
+        path: str,
+        repo: Optional[MinioFileSystemRepo] = None,
+        sep: str = ',',
+        weekmask: str = DEFAULT_WEEKMASK,
+        use_cache: bool = True
+    ) -> BusinessCalendar:
+    """
+    Load a calendar file from the local disk, or from MinIO if repo is given.
+
+    The calendar is cached for the process, by source and version of the file, so loading
+    an unchanged file again costs a stat of the local file or a listing of the object.
+
+    :param path: local path, or /bucket/key path in repo
+    :type path: str
+    :param repo: repository holding the file, defaults to None (local file)
+    :type repo: MinioFileSystemRepo, optional
+    :param sep: csv delimiter, defaults to ','
+    :type sep: str, optional
+    :param weekmask: working days from Monday to Sunday, defaults to '1111100'
+    :type weekmask: str, optional
+    :param use_cache: if False, always read the file, defaults to True
+    :type use_cache: bool, optional
+    :raises FileNotFoundError: if the file does not exist
+    :return: calendar
+    :rtype: BusinessCalendar
+
+    :Example:
+        >>> calendar = load_calendar('/iftbigdata/reference/calendar.csv', repo=MinioFileSystemRepo('iftbigdata'))
+        >>> settle_dates = calendar.add_business_days(trade_dates, 2, (Country.US, Country.GB))
+    """
+    if repo is None:
+        real_path = os.path.realpath(os.path.expanduser(path))
+        file_stat = os.stat(real_path)
+        source, version = ('local', real_path), (file_stat.st_mtime_ns, file_stat.st_size)
+    else:
+        object_stat = repo.stat(path)
+        source, version = (repo.bucket_name, object_stat.get('Key')), object_stat.get('ETag')
+    cache_key = (source, sep, weekmask)
+    if use_cache and version is not None:
+        with _calendar_cache_lock:
+            cached = _calendar_cache.get(cache_key)
+        if cached is not None and cached[0] == version:
+            return cached[1]
+
+    if repo is None:
+        with open(real_path, 'rb') as f:
+            content = f.read()
+    else:
+        with repo.open(path) as f:
+            content = f.read()
+    calendar = parse_calendar(content, sep=sep, weekmask=weekmask)
+    with _calendar_cache_lock:
+        _calendar_cache[cache_key] = (version, calendar)
+    return calendar
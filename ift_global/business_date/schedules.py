@@ -0,0 +1,234 @@
+"""
+Vectorised periodic schedules.
+
+Schedules of many instruments are generated together: the dates of all instruments are held in
+flat ``numpy.datetime64[D]`` arrays, built with month arithmetic on ``datetime64[M]`` values, and
+adjusted to business days in one call of :meth:`BusinessCalendar.adjust`.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Iterable, Optional, Union
+
+import numpy as np
+
+from ift_global.business_date.business_calendar import BusinessCalendar, as_dates
+from ift_global.business_date.calendar_exclusions import Country
+
+# months between schedule dates by frequency, IMM schedules follow the IMM dates
+FREQUENCY_MONTHS = {
+    'monthly': 1,
+    'quarterly': 3,
+    'semiannual': 6,
+    'annual': 12,
+}
+IMM = 'imm'
+
+
+def _month_lengths(months: np.ndarray) -> np.ndarray:
+    """Number of days of ``datetime64[M]`` months."""
+    return ((months + 1).astype('datetime64[D]') - months.astype('datetime64[D]')).astype(np.int64)
+
+
+def is_month_end(dates) -> np.ndarray:
+    """
+    Check which dates are the last calendar day of their month.
+
+    :param dates: date or array-like of dates
+    :return: True for month ends
+    :rtype: np.ndarray
+    """
+    dates = as_dates(dates)
+    return (dates + np.timedelta64(1, 'D')).astype('datetime64[M]') != dates.astype('datetime64[M]')
+
+
+def add_months(dates, months, end_of_month: bool = False) -> np.ndarray:
+    """
+    Add calendar months to dates, keeping the day of the month.
+
+    Days past the end of the target month are moved to its last day, i.e. 2025-01-31 plus one
+    month is 2025-02-28.
+
+    :param dates: date or array-like of dates
+    :param months: number of months to add, negative to subtract, int or array-like broadcast with dates
+    :type months: Union[int, np.ndarray]
+    :param end_of_month: if True, month ends are moved to month ends, i.e. 2025-02-28 plus one month
+        is 2025-03-31, defaults to False
+    :type end_of_month: bool, optional
+    :return: shifted dates
+    :rtype: np.ndarray
+    """
+    dates = as_dates(dates)
+    month = dates.astype('datetime64[M]')
+    day = (dates - month.astype('datetime64[D]')).astype(np.int64)
+    target = month + np.asarray(months, dtype=np.int64)
+    last_day = _month_lengths(target) - 1
+    if end_of_month:
+        day = np.where(is_month_end(dates), last_day, day)
+    return target.astype('datetime64[D]') + np.minimum(day, last_day)
+
+
+def third_wednesday(months) -> np.ndarray:
+    """
+    Third Wednesday of months.
+
+    :param months: month or array-like of months, as dates or ``datetime64[M]``
+    :return: third Wednesday of each month
+    :rtype: np.ndarray
+    """
+    first_day = np.asarray(months).astype('datetime64[M]').astype('datetime64[D]')
+    # 1970-01-01, day 0 of datetime64, is a Thursday: weekday 0 is Monday
+    weekday = (first_day.astype(np.int64) + 3) % 7
+    return first_day + (2 - weekday) % 7 + 14
+
+
+def _imm_month(dates: np.ndarray) -> np.ndarray:
+    """IMM month, March, June, September or December, of the quarter of each date."""
+    month = dates.astype('datetime64[M]')
+    return month + (2 - month.astype(np.int64) % 12 % 3)
+
+
+def next_imm_date(dates, inclusive: bool = False) -> np.ndarray:
+    """
+    Next IMM date, the third Wednesday of March, June, September or December, after each date.
+
+    :param dates: date or array-like of dates
+    :param inclusive: if True, IMM dates are returned unchanged, else the next IMM date is returned,
+        defaults to False
+    :type inclusive: bool, optional
+    :return: IMM dates
+    :rtype: np.ndarray
+    """
+    dates = as_dates(dates)
+    month = _imm_month(dates)
+    imm_date = third_wednesday(month)
+    passed = imm_date < dates if inclusive else imm_date <= dates
+    return np.where(passed, third_wednesday(month + 3), imm_date)
+
+
+def imm_dates(start_date, end_date) -> np.ndarray:
+    """
+    IMM dates from start_date to end_date, both included.
+
+    :param start_date: first date
+    :param end_date: last date
+    :return: IMM dates
+    :rtype: np.ndarray
+    """
+    first_month = next_imm_date(start_date, inclusive=True).astype('datetime64[M]')
+    end_date = as_dates(end_date)
+    months = np.arange(first_month, end_date.astype('datetime64[M]') + 1, 3)
+    dates = third_wednesday(months)
+    return dates[dates <= end_date]
+
+
+@dataclass(frozen=True)
+class Schedule:
+    """
+    Schedules of several instruments, as flat arrays of the same length.
+
+    The dates of each instrument are contiguous and sorted, from its start date to its end date.
+
+    :param instrument: position of the instrument in the inputs of :func:`generate_schedules`
+    :type instrument: np.ndarray
+    :param unadjusted: schedule dates
+    :type unadjusted: np.ndarray
+    :param adjusted: schedule dates adjusted to business days
+    :type adjusted: np.ndarray
+    """
+
+    instrument: np.ndarray
+    unadjusted: np.ndarray
+    adjusted: np.ndarray
+
+    def __len__(self):
+        return len(self.instrument)
+
+    def split(self, adjusted: bool = True) -> list:
+        """
+        Dates of each instrument.
+
+        :param adjusted: if False, return the unadjusted dates, defaults to True
+        :type adjusted: bool, optional
+        :return: one array of dates per instrument
+        :rtype: list
+        """
+        boundaries = np.flatnonzero(np.diff(self.instrument)) + 1
+        return np.split(self.adjusted if adjusted else self.unadjusted, boundaries)
+
+
+def generate_schedules(  # noqa: PLR0913
+        start_dates,
+        end_dates,
+        frequency: str = 'quarterly',
+        calendar: Optional[BusinessCalendar] = None,
+        country: Union[Country, str, Iterable] = Country.ALL,
+        *,
+        convention: str = 'modified_following',
+        end_of_month: bool = False
+    ) -> Schedule:
+    """
+    Generate the periodic schedules of instruments, all in a few array operations.
+
+    Each schedule starts with the start date and steps forward by `frequency` to the end date,
+    with a short final period when the end date is not on the schedule. For 'imm', the dates
+    between start and end date are the IMM dates. All dates, start and end dates included,
+    are adjusted with `convention` to the business days of `country`.
+
+    :param start_dates: start date or array-like of start dates
+    :param end_dates: end date or array-like of end dates, broadcast with start_dates
+    :param frequency: 'monthly', 'quarterly', 'semiannual', 'annual' or 'imm', defaults to 'quarterly'
+    :type frequency: str, optional
+    :param calendar: business calendar, defaults to weekends only
+    :type calendar: BusinessCalendar, optional
+    :param country: country or iterable of countries, defaults to Country.ALL
+    :type country: Union[Country, str, Iterable], optional
+    :param convention: business day convention of :meth:`BusinessCalendar.adjust`, defaults to 'modified_following'
+    :type convention: str, optional
+    :param end_of_month: if True, schedules starting on a month end roll on month ends, defaults to False
+    :type end_of_month: bool, optional
+    :raises ValueError: if frequency is not expected or an end date is not after its start date
+    :return: schedules
+    :rtype: Schedule
+
+    :Example:
+        >>> schedule = generate_schedules(
+        ...     bonds['issue_date'], bonds['maturity_date'], 'semiannual', calendar, Country.US
+        ... )
+        >>> coupons = pd.DataFrame({'bond_id': bonds['bond_id'].to_numpy()[schedule.instrument],
+        ...                         'payment_date': schedule.adjusted})
+    """
+    if frequency != IMM and frequency not in FREQUENCY_MONTHS:
+        raise ValueError(f'Unexpected frequency {frequency}, accepted {", ".join((*FREQUENCY_MONTHS, IMM))}')
+    start_dates, end_dates = np.broadcast_arrays(np.atleast_1d(as_dates(start_dates)), as_dates(end_dates))
+    if np.any(end_dates <= start_dates):
+        raise ValueError('End dates must be after start dates')
+    end_months = end_dates.astype('datetime64[M]')
+
+    # number of dates strictly between start and end date: the last candidate in the month of
+    # the end date is dropped when it is not before the end date
+    if frequency == IMM:
+        first_months = next_imm_date(start_dates).astype('datetime64[M]')
+        last_index = (end_months - first_months).astype(np.int64) // 3
+        last_index -= third_wednesday(first_months + 3 * last_index) >= end_dates
+        n_inner = np.maximum(last_index + 1, 0)
+    else:
+        step = FREQUENCY_MONTHS[frequency]
+        n_inner = (end_months - start_dates.astype('datetime64[M]')).astype(np.int64) // step
+        n_inner -= add_months(start_dates, n_inner * step, end_of_month) >= end_dates
+
+    counts = n_inner + 2
+    instrument = np.repeat(np.arange(len(counts)), counts)
+    position = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+    unadjusted = start_dates[instrument]
+    inner = (position > 0) & (position < counts[instrument] - 1)
+    inner_instrument = instrument[inner]
+    if frequency == IMM:
+        unadjusted[inner] = third_wednesday(first_months[inner_instrument] + 3 * (position[inner] - 1))
+    else:
+        unadjusted[inner] = add_months(start_dates[inner_instrument], position[inner] * step, end_of_month)
+    last = position == counts[instrument] - 1
+    unadjusted[last] = end_dates[instrument[last]]
+
+    calendar = calendar if calendar is not None else BusinessCalendar()
+    return Schedule(instrument, unadjusted, calendar.adjust(unadjusted, convention, country))
@@ -1,21 +1,31 @@
+from __future__ import annotations
+
 import csv
-import pickle
-from io import BytesIO, StringIO
-from typing import Union
-import avro.schema
-from avro.datafile import DataFileWriter, DataFileReader
-from avro.io import DatumWriter, DatumReader
 import io
+import pickle
+import sys
+from io import StringIO
+from typing import TYPE_CHECKING, Union
+
+from ift_global.utils.tracing import traced
+
+# pandas, pyarrow and avro are imported by the functions using them, keeping the import
+# of this module cheap for callers that only need csv or pickle
+if TYPE_CHECKING:
+    import avro.schema
+    import pandas as pd
+    import pyarrow
 
 
-import pandas as pd
-import pyarrow
-from pyarrow import parquet
+def _is_dataframe(data) -> bool:
+    """Check if data is a pandas DataFrame, without importing pandas if it is not loaded yet."""
+    pandas = sys.modules.get('pandas')
+    return pandas is not None and isinstance(data, pandas.DataFrame)
 
 
 def check_data_structure(
           data_check: Union[list, dict, pd.DataFrame],
-          accepted_instances : tuple = Union[list, dict, pd.DataFrame]
+          accepted_instances : tuple = None
         ) -> bool:
     """
     Function to check data structure validity.
@@ -28,13 +38,18 @@ def check_data_structure(
     :return: True
     :rtype: bool
     """
-    if not isinstance(data_check, accepted_instances):
+    if accepted_instances is None:
+        is_valid = isinstance(data_check, (list, dict)) or _is_dataframe(data_check)
+    else:
+        is_valid = isinstance(data_check, accepted_instances)
+    if not is_valid:
           raise TypeError("""Accepted data structures 
                           are only lists, dictionaries 
                           or pd.DataFrames""")
     return True
 
 
+@traced()
 def serialise_csv(
           output_data: Union[list, dict, pd.DataFrame],
           sep = ','
@@ -60,7 +75,7 @@ def serialise_csv(
         >>> csv_repr = serialise_csv(output_data)
     """
     # check if df and convert to dict
-    if isinstance(output_data, pd.DataFrame):
+    if _is_dataframe(output_data):
         output_data = output_data.to_dict('list')
 
     csv_buffer=StringIO()
@@ -91,6 +106,7 @@ def serialise_csv(
     return csv_buffer.getvalue()
 
 
+@traced()
 def serialise_parquet(
           output_data: Union[list, dict, pd.DataFrame]
         ) -> str:
@@ -112,10 +128,12 @@ def serialise_parquet(
     if not check_data_structure(output_data):
         raise TypeError('Cannot serialise to parquet file')
 
+    import pyarrow
+    from pyarrow import parquet
 
-    if isinstance(output_data, pd.DataFrame):
-        output_data = output_data.to_dict('list')
-        output_table = pyarrow.Table.from_pydict(output_data)
+    if _is_dataframe(output_data):
+        # columns are handed to arrow without building python objects for every value
+        output_table = pyarrow.Table.from_pandas(output_data, preserve_index=False)
 
     if isinstance(output_data, list):
             output_table = pyarrow.Table.from_pylist(output_data)
@@ -129,6 +147,7 @@ def serialise_parquet(
     return body
 
 
+@traced()
 def serialise_avro(
         output_data: Union[list, dict, pd.DataFrame],
         schema: avro.schema.Schema
@@ -158,10 +177,13 @@ def serialise_avro(
         ...                {'a': 18, 'b': 9, 'c': 10}]
         >>> avro_bytes = serialise_avro(output_data, schema)
     """
-    if not isinstance(output_data, (list, dict, pd.DataFrame)):
+    if not (isinstance(output_data, (list, dict)) or _is_dataframe(output_data)):
         raise TypeError('Cannot serialise to Avro file. Input must be a list, dict, or DataFrame')
 
-    if isinstance(output_data, pd.DataFrame):
+    from avro.datafile import DataFileWriter
+    from avro.io import DatumWriter
+
+    if _is_dataframe(output_data):
         output_data = output_data.to_dict('records')
     elif isinstance(output_data, dict):
         output_data = [output_data]
@@ -176,6 +198,7 @@ def serialise_avro(
     return output_buffer.getvalue()
 
 
+@traced()
 def serialise_pickle(output_data: Union[list, dict, pd.DataFrame]) -> str:
     """
     Serialise python obj to pickle.
@@ -188,6 +211,7 @@ def serialise_pickle(output_data: Union[list, dict, pd.DataFrame]) -> str:
     return pickle.dumps(output_data)
 
 
+@traced()
 def deserialise_pickle(
           response_body : str,
           read_type : str = 'read' # TODO as for now defaults to read, maybe future can be improved
@@ -214,6 +238,7 @@ def deserialise_pickle(
     return deserial_object
 
 
+@traced()
 def deserialise_csv(response_body : str) -> list:
     """
     Deserialise body to python obj.
@@ -231,7 +256,7 @@ def deserialise_csv(response_body : str) -> list:
         ...                 input_data.get('Body')
         ...                 )
     """
-    lines = response_body.read().decode('utf-8').splitlines(True)
+    lines = str(response_body.read(), 'utf-8').splitlines(True)
     reader = csv.DictReader(lines)
     input_data = []
     for row in reader:
@@ -239,12 +264,16 @@ def deserialise_csv(response_body : str) -> list:
     return input_data
 
 
-def deserialise_parquet(response_body : str) -> pyarrow.lib.Table:
+@traced()
+def deserialise_parquet(response_body : str, dtype_backend : str = None) -> pyarrow.lib.Table:
     """
     Deserialise boto3 body response to python obj.
 
     :param response_body: body response from boto3 client get_object
     :type response_body: str
+    :param dtype_backend: if 'pyarrow', columns keep the arrow buffers as pandas ArrowDtype
+        instead of being converted to numpy, reducing peak memory, defaults to None
+    :type dtype_backend: str, optional
     :return: pyarrow table object can be conveerted to df as `.to_pandas`
     :rtype: pyarrow.lib.Table
     :Examples:
@@ -259,11 +288,17 @@ def deserialise_parquet(response_body : str) -> pyarrow.lib.Table:
         >>> pqt_obj.to_pydict()
         >>> pqt_obj.to_pylist()
     """
-    body = BytesIO(response_body.read())
+    import pandas as pd
+    import pyarrow
+
+    body = pyarrow.BufferReader(response_body.read())
+    if dtype_backend:
+        return pd.read_parquet(body, dtype_backend=dtype_backend)
     pq_df = pd.read_parquet(body)
     return pq_df
 
 
+@traced()
 def deserialise_avro(response_body: str, schema: avro.schema.Schema) -> list:
     """
     Deserialize boto3 body response containing Avro data to Python objects.
@@ -288,6 +323,9 @@ def deserialise_avro(response_body: str, schema: avro.schema.Schema) -> list:
         >>> for record in avro_records:
         ...     print(record)
     """
+    from avro.datafile import DataFileReader
+    from avro.io import DatumReader
+
     body = io.BytesIO(response_body.read())
     reader = DataFileReader(body, DatumReader(schema))
     return list(reader)
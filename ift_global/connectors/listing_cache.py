@@ -0,0 +1,205 @@
+import threading
+import time
+from typing import Optional
+
+
+class _TrieNode:
+    """Node of the key trie, one per directory level."""
+
+    __slots__ = ('dirs', 'files')
+
+    def __init__(self):
+        self.dirs = {}
+        self.files = {}
+
+
+class ListingCache:
+    """
+    Prefix Listing Cache.
+
+    In-memory trie of the object keys known under the prefixes listed so far.
+
+    A prefix is loaded once with a full recursive listing, after which any listing of that prefix,
+    or of a prefix below it, is answered from memory in the same shape as a ``list_objects``
+    response with ``Delimiter='/'``. Loaded prefixes expire after `ttl` seconds, the owner of the
+    cache is expected to list them again, in full or incrementally listing only the keys after
+    the last one seen.
+
+    .. note::
+        An incremental refresh only discovers keys sorting after the last key seen,
+        objects deleted or overwritten by other clients are only updated on a full refresh.
+
+    :param ttl: number of seconds a loaded prefix is considered fresh
+    :type ttl: float
+
+    :Example:
+        >>> cache = ListingCache(ttl=60)
+        >>> cache.load('data/', [{'Key': 'data/2024/a.csv', 'Size': 10}])
+        >>> cache.list_level('data/')
+        {'Contents': [], 'CommonPrefixes': [{'Prefix': 'data/2024/'}]}
+    """
+
+    def __init__(self, ttl: float):
+        """Constructor method."""
+        self.ttl = ttl
+        self._root = _TrieNode()
+        self._prefixes = {}
+        self._lock = threading.RLock()
+
+    @property
+    def prefixes(self) -> list:
+        """
+        Loaded prefixes.
+
+        :return: list of the prefixes currently loaded
+        :rtype: list
+        """
+        with self._lock:
+            return list(self._prefixes)
+
+    def covering_prefix(self, prefix: str) -> Optional[str]:
+        """
+        Loaded prefix containing `prefix`.
+
+        :param prefix: prefix to look up, i.e. data/2024/
+        :type prefix: str
+        :return: the longest loaded prefix `prefix` starts with, None if not loaded
+        :rtype: str, optional
+        """
+        with self._lock:
+            candidates = [x for x in self._prefixes if prefix.startswith(x)]
+            return max(candidates, key=len) if candidates else None
+
+    def is_fresh(self, prefix: str) -> bool:
+        """
+        Check if a loaded prefix was refreshed within the last `ttl` seconds.
+
+        :param prefix: a loaded prefix
+        :type prefix: str
+        :return: True if fresh, False if expired or not loaded
+        :rtype: bool
+        """
+        with self._lock:
+            state = self._prefixes.get(prefix)
+            return state is not None and time.monotonic() - state['loaded_at'] < self.ttl
+
+    def last_key(self, prefix: str) -> Optional[str]:
+        """
+        Last key seen listing a loaded prefix, used as `StartAfter` on incremental refresh.
+
+        :param prefix: a loaded prefix
+        :type prefix: str
+        :return: last key listed under prefix, None if the prefix was empty or not loaded
+        :rtype: str, optional
+        """
+        with self._lock:
+            return self._prefixes.get(prefix, {}).get('last_key')
+
+    def load(self, prefix: str, entries: list, full: bool = True):
+        """
+        Record the listing of a prefix.
+
+        :param prefix: prefix listed, ending with '/'
+        :type prefix: str
+        :param entries: object entries as returned in ``list_objects`` `Contents`
+        :type entries: list
+        :param full: if True, entries are the full content of prefix and replace what is known,
+            if False, entries are the keys listed after `last_key` and are added, defaults to True
+        :type full: bool, optional
+        """
+        with self._lock:
+            last_key = None if full else self.last_key(prefix)
+            if full:
+                node = self._node(prefix, create=True)
+                node.dirs.clear()
+                node.files.clear()
+                for sub_prefix in [x for x in self._prefixes if x.startswith(prefix)]:
+                    del self._prefixes[sub_prefix]
+            for entry in entries:
+                self._insert(entry)
+                if last_key is None or entry.get('Key') > last_key:
+                    last_key = entry.get('Key')
+            self._prefixes[prefix] = {'loaded_at': time.monotonic(), 'last_key': last_key}
+
+    def add(self, entry: dict):
+        """
+        Add or replace an object entry, if the key falls under a loaded prefix.
+
+        :param entry: object entry with at least the `Key` field
+        :type entry: dict
+        """
+        with self._lock:
+            if self.covering_prefix(entry.get('Key')) is not None:
+                self._insert(entry)
+
+    def discard(self, key: str):
+        """
+        Remove an object key, pruning directories left empty.
+
+        :param key: object key
+        :type key: str
+        """
+        with self._lock:
+            *dir_names, file_name = key.split('/')
+            path = [self._root]
+            for dir_name in dir_names:
+                node = path[-1].dirs.get(dir_name)
+                if node is None:
+                    return
+                path.append(node)
+            path[-1].files.pop(file_name, None)
+            pruned = zip(reversed(dir_names), reversed(path[:-1]), reversed(path[1:]), strict=True)
+            for dir_name, parent, node in pruned:
+                if node.dirs or node.files:
+                    break
+                del parent.dirs[dir_name]
+
+    def invalidate(self, prefix: Optional[str] = None):
+        """
+        Forget a loaded prefix and the prefixes below it, or everything if prefix is None.
+
+        :param prefix: prefix to forget, defaults to None
+        :type prefix: str, optional
+        """
+        with self._lock:
+            if prefix is None:
+                self._root = _TrieNode()
+                self._prefixes.clear()
+                return
+            for loaded_prefix in [x for x in self._prefixes if x.startswith(prefix)]:
+                del self._prefixes[loaded_prefix]
+
+    def list_level(self, prefix: str) -> dict:
+        """
+        List one level of a loaded prefix.
+
+        :param prefix: prefix ending with '/'
+        :type prefix: str
+        :return: dictionary shaped as a ``list_objects`` response with ``Delimiter='/'``,
+            with the `Contents` and `CommonPrefixes` fields sorted by key.
+        :rtype: dict
+        """
+        with self._lock:
+            node = self._node(prefix)
+            if node is None:
+                return {'Contents': [], 'CommonPrefixes': []}
+            return {
+                'Contents': [node.files[x] for x in sorted(node.files)],
+                'CommonPrefixes': [{'Prefix': f'{prefix}{x}/'} for x in sorted(node.dirs)],
+            }
+
+    def _node(self, prefix: str, create: bool = False) -> Optional[_TrieNode]:
+        node = self._root
+        for dir_name in prefix.split('/')[:-1]:
+            child = node.dirs.get(dir_name)
+            if child is None:
+                if not create:
+                    return None
+                child = node.dirs[dir_name] = _TrieNode()
+            node = child
+        return node
+
+    def _insert(self, entry: dict):
+        key = entry.get('Key')
+        node = self._node(key, create=True)
+        node.files[key.rsplit('/', 1)[-1]] = entry
@@ -0,0 +1,238 @@
+import json
+import threading
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+
+DEFAULT_LATENCY_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+
+class OperationRecord:
+    """
+    Measurement of a single operation.
+
+    Yielded by :meth:`MetricsCollector.measure`, the caller fills in the bytes
+    transferred and the retries reported by botocore while the operation runs.
+    """
+
+    __slots__ = ('operation', 'bytes_in', 'bytes_out', 'retries')
+
+    def __init__(self, operation: str):
+        """Constructor method."""
+        self.operation = operation
+        self.bytes_in = 0
+        self.bytes_out = 0
+        self.retries = 0
+
+
+def retry_attempts(response: dict) -> int:
+    """
+    Retries performed by botocore for a request.
+
+    :param response: boto3 client response
+    :type response: dict
+    :return: value of `ResponseMetadata.RetryAttempts`, 0 if missing
+    :rtype: int
+    """
+    if not isinstance(response, dict):
+        return 0
+    return response.get('ResponseMetadata', {}).get('RetryAttempts', 0)
+
+
+class MetricsCollector:
+    """
+    Metrics Collector.
+
+    Instrumentation surface for :class:`BaseMinioConnection` and :class:`MinioFileSystemRepo`.
+
+    Each network call and each (de)serialisation is measured as an operation, one of
+    `list`, `head`, `get`, `put`, `copy`, `multipart`, `delete`, `serialise` and `deserialise`.
+    Serialisation is measured separately from the request, so CPU time can be told apart from I/O.
+
+    This base class discards all measurements and is the default collector.
+    Subclasses implement :meth:`record` to plug in their own backend.
+
+    :Example:
+        >>> class StatsdCollector(MetricsCollector):
+        ...     def record(self, operation, latency, bytes_in=0, bytes_out=0, retries=0, error=False):
+        ...         statsd.timing(f'minio.{operation}', latency * 1000)
+        >>> minio_repo = MinioFileSystemRepo('iftbigdata', metrics=StatsdCollector())
+    """
+
+    @contextmanager
+    def measure(self, operation: str):
+        """
+        Measure the latency of the block of code as one operation.
+
+        :param operation: name of the operation
+        :type operation: str
+        :return: context manager yielding an :class:`OperationRecord`
+        """
+        record = OperationRecord(operation)
+        error = False
+        start = time.perf_counter()
+        try:
+            yield record
+        except Exception:
+            error = True
+            raise
+        finally:
+            self.record(
+                operation,
+                time.perf_counter() - start,
+                bytes_in=record.bytes_in,
+                bytes_out=record.bytes_out,
+                retries=record.retries,
+                error=error,
+            )
+
+    def record(  # noqa: PLR0913
+            self,
+            operation: str,
+            latency: float,
+            *,
+            bytes_in: int = 0,
+            bytes_out: int = 0,
+            retries: int = 0,
+            error: bool = False
+        ):
+        """
+        Record one operation.
+
+        :param operation: name of the operation
+        :type operation: str
+        :param latency: duration of the operation in seconds
+        :type latency: float
+        :param bytes_in: bytes received, defaults to 0
+        :type bytes_in: int, optional
+        :param bytes_out: bytes sent, defaults to 0
+        :type bytes_out: int, optional
+        :param retries: retries performed by botocore, defaults to 0
+        :type retries: int, optional
+        :param error: True if the operation raised an exception, defaults to False
+        :type error: bool, optional
+        """
+        pass
+
+
+class InMemoryCollector(MetricsCollector):
+    """
+    In-Process Metrics Collector.
+
+    Aggregates count, latency histogram, bytes in/out, retries and errors per operation
+    in memory, and exports them in Prometheus text format or JSON.
+
+    :param buckets: upper bounds of the latency histogram buckets in seconds,
+        defaults to DEFAULT_LATENCY_BUCKETS
+    :type buckets: tuple, optional
+
+    :Example:
+        >>> collector = InMemoryCollector()
+        >>> minio_repo = MinioFileSystemRepo('iftbigdata', metrics=collector)
+        >>> minio_repo.read_file('/iftbigdata/input/trades.parquet', 'parquet')
+        >>> print(collector.to_prometheus())
+    """
+
+    def __init__(self, buckets: tuple = DEFAULT_LATENCY_BUCKETS):
+        """Constructor method."""
+        self.buckets = tuple(sorted(buckets))
+        self._lock = threading.Lock()
+        self._operations = {}
+
+    def record(  # noqa: PLR0913
+            self,
+            operation: str,
+            latency: float,
+            *,
+            bytes_in: int = 0,
+            bytes_out: int = 0,
+            retries: int = 0,
+            error: bool = False
+        ):
+        with self._lock:
+            stats = self._operations.get(operation)
+            if stats is None:
+                stats = self._operations[operation] = {
+                    'count': 0,
+                    'errors': 0,
+                    'retries': 0,
+                    'bytes_in': 0,
+                    'bytes_out': 0,
+                    'latency_sum': 0.0,
+                    'latency_buckets': [0] * (len(self.buckets) + 1),
+                }
+            stats['count'] += 1
+            stats['errors'] += int(error)
+            stats['retries'] += retries
+            stats['bytes_in'] += bytes_in
+            stats['bytes_out'] += bytes_out
+            stats['latency_sum'] += latency
+            stats['latency_buckets'][bisect_left(self.buckets, latency)] += 1
+
+    def snapshot(self) -> dict:
+        """
+        Copy of the metrics collected so far.
+
+        :return: dictionary keyed by operation, latency buckets are cumulative and keyed by upper bound
+        :rtype: dict
+        """
+        with self._lock:
+            operations = {k: dict(v, latency_buckets=list(v['latency_buckets'])) for k, v in self._operations.items()}
+        result = {}
+        for operation, stats in sorted(operations.items()):
+            cumulative, buckets = 0, {}
+            for upper_bound, bucket_count in zip((*self.buckets, '+Inf'), stats.pop('latency_buckets'), strict=True):
+                cumulative += bucket_count
+                buckets[str(upper_bound)] = cumulative
+            result[operation] = {**stats, 'latency_buckets': buckets}
+        return result
+
+    def reset(self):
+        """Discard all metrics collected."""
+        with self._lock:
+            self._operations.clear()
+
+    def to_json(self, **kwargs) -> str:
+        """
+        Export the metrics as JSON.
+
+        :param kwargs: keyword arguments passed to `json.dumps`
+        :return: JSON representation of :meth:`snapshot`
+        :rtype: str
+        """
+        return json.dumps(self.snapshot(), **kwargs)
+
+    def to_prometheus(self, namespace: str = 'ift_minio') -> str:
+        """
+        Export the metrics in Prometheus text exposition format.
+
+        :param namespace: prefix of the metric names, defaults to 'ift_minio'
+        :type namespace: str, optional
+        :return: metrics in Prometheus text format
+        :rtype: str
+        """
+        snapshot = self.snapshot()
+        lines = [
+            f'# HELP {namespace}_operation_latency_seconds Latency of the operations in seconds.',
+            f'# TYPE {namespace}_operation_latency_seconds histogram',
+        ]
+        for operation, stats in snapshot.items():
+            for upper_bound, bucket_count in stats['latency_buckets'].items():
+                lines.append(
+                    f'{namespace}_operation_latency_seconds_bucket{{operation="{operation}",le="{upper_bound}"}} '
+                    f'{bucket_count}'
+                )
+            lines.append(f'{namespace}_operation_latency_seconds_sum{{operation="{operation}"}} {stats["latency_sum"]}')
+            lines.append(f'{namespace}_operation_latency_seconds_count{{operation="{operation}"}} {stats["count"]}')
+        counters = (
+            ('errors', 'Operations failed with an exception.'),
+            ('retries', 'Retries performed by botocore.'),
+            ('bytes_in', 'Bytes received.'),
+            ('bytes_out', 'Bytes sent.'),
+        )
+        for field, help_text in counters:
+            lines.append(f'# HELP {namespace}_operation_{field}_total {help_text}')
+            lines.append(f'# TYPE {namespace}_operation_{field}_total counter')
+            for operation, stats in snapshot.items():
+                lines.append(f'{namespace}_operation_{field}_total{{operation="{operation}"}} {stats[field]}')
+        return '\n'.join(lines) + '\n'
@@ -1,9 +1,12 @@
+from contextlib import contextmanager
 from typing import Optional
 
 import boto3
 from botocore.exceptions import ClientError, HTTPClientError, ParamValidationError
 
+from ift_global.connectors.metrics import MetricsCollector
 from ift_global.credentials.minio_cr import MinioCredentials
+from ift_global.utils import tracing
 
 
 class BaseMinioConnection:
@@ -20,8 +23,11 @@ class BaseMinioConnection:
     :type password: str, optional
     :param endpoint_url: URL for Minio, defaults to os.getenv('MINIO_URL')
     :type endpoint_url: str, optional
+    :param metrics: collector receiving per-operation metrics, defaults to a no-op MetricsCollector
+    :type metrics: MetricsCollector, optional
 
     :ivar bucket_name: Name of the Minio bucket
+    :ivar metrics: Metrics collector instance
     :ivar _client: Boto3 S3 client instance
     :vartype _client: boto3.client
 
@@ -34,7 +40,9 @@ class BaseMinioConnection:
         >>> buckets = client.list_buckets()
     """
 
-    def __init__(self, bucket_name: str, user: Optional[str] = None, password: Optional[str] = None, endpoint_url: Optional[str] = None):
+    def __init__(self, bucket_name: str, user: Optional[str] = None, password: Optional[str] = None,
+                 endpoint_url: Optional[str] = None, metrics: Optional[MetricsCollector] = None):
+        self.metrics = metrics or MetricsCollector()
         self._credentials = MinioCredentials(user=user,
                                              password=password,
                                              url=endpoint_url)
@@ -79,6 +87,20 @@ class BaseMinioConnection:
         if self.bucket_name not in bucket_names:
             raise ParamValidationError('Bucket provided does not exist')
 
+    @contextmanager
+    def _measure(self, operation: str, span_name: str):
+        """
+        Measure a request as one operation and trace it as a span.
+
+        :param operation: metrics operation name, i.e. get
+        :type operation: str
+        :param span_name: tracing span name, i.e. get_object
+        :type span_name: str
+        :return: context manager yielding an :class:`OperationRecord`
+        """
+        with tracing.span(span_name, bucket=self.bucket_name), self.metrics.measure(operation) as record:
+            yield record
+
     @property
     def get_client(self):
         """
@@ -0,0 +1,204 @@
+import io
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
+
+from botocore.exceptions import ClientError
+
+from ift_global.connectors.metrics import MetricsCollector, retry_attempts
+from ift_global.connectors.minio_transfer import (
+    MB,
+    ObjectSizeChangedError,
+    content_range_size,
+    precondition_failed,
+)
+from ift_global.utils import tracing
+
+
+class MinioObjectReader(io.RawIOBase):
+    """
+    Seekable Object Reader.
+
+    Read-only, seekable file-like object backed by byte-range ``get_object`` requests.
+
+    The object is split in blocks of `block_size` bytes, fetched only when a read touches them
+    and kept in a least-recently-used cache of `cache_blocks` blocks. When reads are sequential,
+    the following `read_ahead` blocks, at most `cache_blocks`, are fetched in background threads.
+    With `etag`, all blocks are requested with ``IfMatch`` so that they come from the same version
+    of the object.
+
+    This is the raw layer, :meth:`MinioFileSystemRepo.open` wraps it in an :class:`io.BufferedReader`.
+
+    :param client: boto3 S3 client
+    :type client: boto3.client
+    :param bucket_name: name of the bucket
+    :type bucket_name: str
+    :param key: object key within the bucket
+    :type key: str
+    :param size: size of the object in bytes, if None it is retrieved with ``head_object``
+    :type size: int, optional
+    :param etag: ETag of the object, if None and size is None it is retrieved with ``head_object``
+    :type etag: str, optional
+    :param block_size: size of each ranged request in bytes, defaults to 4MB
+    :type block_size: int, optional
+    :param cache_blocks: maximum number of blocks held in memory, defaults to 16
+    :type cache_blocks: int, optional
+    :param read_ahead: number of blocks fetched ahead on sequential reads, defaults to 2.
+        If 0, read-ahead is disabled.
+    :type read_ahead: int, optional
+    :param metrics: collector receiving one `get` operation per block fetched, defaults to no-op
+    :type metrics: MetricsCollector, optional
+    :raises ObjectSizeChangedError: on reads, if the object was overwritten since its size or ETag was taken
+
+    :Example:
+        >>> raw = MinioObjectReader(client, 'iftbigdata', 'data/trades.zip')
+        >>> raw.seek(-22, io.SEEK_END)
+        >>> end_of_central_dir = raw.read(22)
+    """
+
+    def __init__(  # noqa: PLR0913
+            self,
+            client,
+            bucket_name: str,
+            key: str,
+            size: Optional[int] = None,
+            *,
+            etag: Optional[str] = None,
+            block_size: int = 4 * MB,
+            cache_blocks: int = 16,
+            read_ahead: int = 2,
+            metrics: Optional[MetricsCollector] = None
+        ):
+        """Constructor method."""
+        super().__init__()
+        if block_size <= 0:
+            raise ValueError('block_size must be a positive integer')
+        self._client = client
+        self._metrics = metrics or MetricsCollector()
+        self.bucket_name = bucket_name
+        self.key = key
+        self.name = f'/{bucket_name}/{key}'
+        if size is None:
+            head_response = client.head_object(Bucket=bucket_name, Key=key)
+            size = head_response.get('ContentLength')
+            etag = etag or head_response.get('ETag')
+        self.size = size
+        self.etag = etag
+        self.block_size = block_size
+        self.cache_blocks = max(1, cache_blocks)
+        self.read_ahead = max(0, min(read_ahead, self.cache_blocks))
+        self._position = 0
+        self._last_block = -1
+        self._cache = OrderedDict()
+        self._pending = {}
+        self._executor = ThreadPoolExecutor(max_workers=self.read_ahead) if self.read_ahead else None
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self._position
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        self._checkClosed()
+        if whence == io.SEEK_SET:
+            position = offset
+        elif whence == io.SEEK_CUR:
+            position = self._position + offset
+        elif whence == io.SEEK_END:
+            position = self.size + offset
+        else:
+            raise ValueError(f'Invalid whence ({whence})')
+        if position < 0:
+            raise ValueError(f'Negative seek position {position}')
+        self._position = position
+        return self._position
+
+    def readinto(self, buffer) -> int:
+        """
+        Read bytes into a pre-allocated, writable bytes-like object.
+
+        :param buffer: writable buffer
+        :type buffer: Union[bytearray, memoryview]
+        :return: number of bytes read, 0 at end of object
+        :rtype: int
+        """
+        self._checkClosed()
+        view = memoryview(buffer).cast('B')
+        written = 0
+        while written < len(view) and self._position < self.size:
+            block_index, block_offset = divmod(self._position, self.block_size)
+            block = self._get_block(block_index)
+            n_bytes = min(len(view) - written, len(block) - block_offset)
+            if n_bytes <= 0:
+                # a short block would never move the position forward
+                raise ObjectSizeChangedError(self.key, self.size)
+            view[written:written + n_bytes] = block[block_offset:block_offset + n_bytes]
+            written += n_bytes
+            self._position += n_bytes
+        return written
+
+    def close(self):
+        if not self.closed:
+            for future in self._pending.values():
+                future.cancel()
+            if self._executor:
+                self._executor.shutdown(wait=False)
+            self._pending.clear()
+            self._cache.clear()
+        super().close()
+
+    def _fetch_block(self, block_index: int) -> bytes:
+        first_byte = block_index * self.block_size
+        last_byte = min(first_byte + self.block_size, self.size) - 1
+        pin_version = {'IfMatch': self.etag} if self.etag else {}
+        with tracing.span('get_object', key=self.key), self._metrics.measure('get') as record:
+            try:
+                response = self._client.get_object(
+                    Bucket=self.bucket_name,
+                    Key=self.key,
+                    Range=f'bytes={first_byte}-{last_byte}',
+                    **pin_version
+                )
+            except ClientError as error:
+                if error.response.get('Error', {}).get('Code') == 'InvalidRange' or precondition_failed(error):
+                    raise ObjectSizeChangedError(self.key, self.size) from error
+                raise
+            object_size = content_range_size(response.get('ContentRange'))
+            if object_size is not None and object_size != self.size:
+                raise ObjectSizeChangedError(self.key, self.size, object_size)
+            block = response.get('Body').read()
+            record.bytes_in = len(block)
+            record.retries = retry_attempts(response)
+        if len(block) != last_byte - first_byte + 1:
+            raise ObjectSizeChangedError(self.key, self.size)
+        return block
+
+    def _get_block(self, block_index: int) -> bytes:
+        block = self._cache.get(block_index)
+        if block is not None:
+            self._cache.move_to_end(block_index)
+        else:
+            pending = self._pending.pop(block_index, None)
+            block = pending.result() if pending else self._fetch_block(block_index)
+            self._cache[block_index] = block
+            while len(self._cache) > self.cache_blocks:
+                self._cache.popitem(last=False)
+        if block_index == self._last_block + 1:
+            self._schedule_read_ahead(block_index)
+        self._last_block = block_index
+        return block
+
+    def _schedule_read_ahead(self, block_index: int):
+        if not self._executor:
+            return
+        last_index = min(block_index + self.read_ahead, (self.size - 1) // self.block_size)
+        # blocks outside the window, behind the reader or left by an earlier seek, are dropped
+        for stale_index in [x for x in self._pending if not block_index < x <= last_index]:
+            self._pending.pop(stale_index).cancel()
+        for next_index in range(block_index + 1, last_index + 1):
+            if next_index not in self._cache and next_index not in self._pending:
+                self._pending[next_index] = tracing.submit(self._executor, self._fetch_block, next_index)
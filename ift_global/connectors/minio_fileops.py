@@ -1,13 +1,35 @@
-from typing import Union, Optional
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Union, Optional
+import io
 import os
+import queue
+import threading
+import time
+from datetime import datetime, timezone
+from concurrent.futures import ThreadPoolExecutor
 from botocore.exceptions import ClientError
 
-import pandas as pd
-
 from ift_global.connectors.file_serialiser import abstraction_deserialiser, abstraction_serialiser
 from ift_global.connectors.filesystem_registry import FileSystemRepository
+from ift_global.connectors.listing_cache import ListingCache
+from ift_global.connectors.metrics import retry_attempts
+from ift_global.connectors.minio_file import MinioObjectReader
 from ift_global.connectors.minio_boto import BaseMinioConnection
-from ift_global.utils.file_operations import check_path, extract_file_name
+from ift_global.connectors.minio_transfer import (
+    MB,
+    BufferBody,
+    ObjectSizeChangedError,
+    batched,
+    delete_object_batch,
+    multipart_copy_object,
+    ranged_get_object,
+)
+from ift_global.utils import tracing
+from ift_global.utils.file_operations import ObjectPath
+
+if TYPE_CHECKING:
+    import pandas as pd
 
 
 class MinioFileSystemRepo(BaseMinioConnection, FileSystemRepository):
@@ -19,6 +41,9 @@ class MinioFileSystemRepo(BaseMinioConnection, FileSystemRepository):
     This class extends the BaseMinioConnection to utilize its minio connection
     and session management based on boto3. It provides methods to execute specific tasks, including
     selecting, reading and writing files from minio.
+
+    Paths are given as /bucket/key strings or as :class:`ObjectPath`, and are parsed once with
+    :meth:`ObjectPath.parse`. A path without the bucket is read as a key within the bucket.
     """
 
     def __init__(self, bucket_name, **kwargs):
@@ -29,13 +54,32 @@ class MinioFileSystemRepo(BaseMinioConnection, FileSystemRepository):
         :param str user: Username for MinIO. If empty, defaults to os.getenv('MINIO_USER').
         :param str password: Password for MinIO. If empty, defaults to os.getenv('MINIO_PASSWORD').
         :param str endpoint_url: URL for MinIO. If empty, defaults to os.getenv('MINIO_URL').
+        :param int ranged_read_threshold: objects larger than this number of bytes are read with
+            concurrent byte-range requests, defaults to 64MB. If None, ranged reads are disabled.
+        :param int ranged_read_chunksize: size in bytes of each byte-range request, defaults to 8MB.
+        :param int max_concurrency: maximum number of concurrent requests per operation, defaults to 10.
+        :param int multipart_copy_threshold: objects larger than this number of bytes are copied
+            with server side multipart copy, defaults to 512MB.
+        :param int multipart_copy_partsize: size in bytes of each multipart copy part, defaults to 64MB.
+        :param float listing_cache_ttl: if set, listings are cached in memory and listed again in full
+            after this number of seconds, see :class:`ListingCache`. Defaults to None, no cache.
+        :param MetricsCollector metrics: collector receiving per-operation metrics, defaults to no-op.
         """
         super().__init__(bucket_name,
                          user=kwargs.get('user'),
                          password=kwargs.get('password'),
-                         endpoint_url=kwargs.get('endpoint_url'))
-
-
+                         endpoint_url=kwargs.get('endpoint_url'),
+                         metrics=kwargs.get('metrics'))
+        self.ranged_read_threshold = kwargs.get('ranged_read_threshold', 64 * MB)
+        self.ranged_read_chunksize = kwargs.get('ranged_read_chunksize', 8 * MB)
+        self.max_concurrency = kwargs.get('max_concurrency', 10)
+        self.multipart_copy_threshold = kwargs.get('multipart_copy_threshold', 512 * MB)
+        self.multipart_copy_partsize = kwargs.get('multipart_copy_partsize', 64 * MB)
+        listing_cache_ttl = kwargs.get('listing_cache_ttl')
+        self._listing_cache = ListingCache(ttl=listing_cache_ttl) if listing_cache_ttl is not None else None
+
+
+    @tracing.traced('list_files')
     def list_files(self, path : str, full_path : bool = True) -> list:
         """
         List all files in a given object folder.
@@ -48,8 +92,8 @@ class MinioFileSystemRepo(BaseMinioConnection, FileSystemRepository):
         :return: a list containing all files in a given path directory.
             An empty string is generated if directory is empty or does not exists.
         """
-        norm_path = check_path(path, self.bucket_name)
-        obj = self._client.list_objects(Bucket=self.bucket_name, Prefix=norm_path, Delimiter='/')
+        norm_path = self._object_path(path).as_dir().key
+        obj = self._list_level(norm_path)
         if not obj.get('Contents'):
             return []
         all_files = [f"/{self.bucket_name}/{x.get('Key')}" for x in obj.get('Contents')]
@@ -60,8 +104,9 @@ class MinioFileSystemRepo(BaseMinioConnection, FileSystemRepository):
             all_files = [f"/{self.bucket_name}/{x.get('Key')}" for x in obj.get('Contents')]
             return all_files
         else:
-            return [x.get('Key').replace(path, '') for x in obj.get('Contents')]
+            return [x.get('Key')[len(norm_path):] for x in obj.get('Contents')]
 
+    @tracing.traced('list_dirs')
     def list_dirs(self, path : str, full_path : bool =False) -> list:
         """
         List all directories in a given object folder.
@@ -75,8 +120,8 @@ class MinioFileSystemRepo(BaseMinioConnection, FileSystemRepository):
         :return: a list containing all directories in a given path directory. 
                 An empty string is generated if directory is empty or does not exists.
         """
-        path = check_path(path, self.bucket_name)
-        obj = self._client.list_objects(Bucket=self.bucket_name, Prefix=path, Delimiter='/')
+        path = self._object_path(path).as_dir().key
+        obj = self._list_level(path)
 
         if not obj.get('CommonPrefixes') and not obj.get('Contents'):
             print(obj.get('CommonPrefixes')  is True)
@@ -100,6 +145,84 @@ class MinioFileSystemRepo(BaseMinioConnection, FileSystemRepository):
             relative_dirs.append(last_dir)
         return relative_dirs
 
+    def walk(self, path : str, max_depth : Optional[int] = None, max_workers : Optional[int] = None):
+        """
+        Walk Directory Tree.
+
+        generate the directories below a path, in the spirit of `os.walk`. Sub-directories
+        are listed concurrently and each page of a listing is yielded as soon as it arrives,
+        so the order is not deterministic. A directory listed over several pages is yielded
+        once per page, with the subdirs and files of that page.
+
+        As in `os.walk`, the caller can remove entries from `subdirs` in place to skip them.
+
+        :param str path: a regular path including bucket location as /ift-bigdata-dev/input/'.
+        :param int max_depth: maximum depth to descend below path, 0 lists path only. Defaults to None, no limit.
+        :param int max_workers: maximum number of concurrent listings, defaults to `max_concurrency`.
+
+        :return: generator of tuples (dir_path, subdirs, files), dir_path as /ift-bigdata-dev/input/,
+            subdirs and files as names relative to dir_path.
+
+        :Examples:
+            >>> for dir_path, subdirs, files in minio_repo.walk('/ift-bigdata-dev/input/', max_depth=2):
+            ...     print(dir_path, len(files))
+        """
+        root = self._object_path(path).as_dir().key
+        # pages of all listings, as (prefix, depth, page), page is None when the listing of prefix ends
+        pages = queue.Queue()
+        stopped = threading.Event()
+
+        def list_level(prefix_key, depth):
+            try:
+                for page in self._walk_level(prefix_key):
+                    if stopped.is_set():
+                        return
+                    pages.put((prefix_key, depth, page))
+            except Exception as e:
+                pages.put((prefix_key, depth, e))
+            finally:
+                pages.put((prefix_key, depth, None))
+
+        executor = ThreadPoolExecutor(max_workers=max_workers or self.max_concurrency)
+        tracing.submit(executor, list_level, root, 0)
+        listings = 1
+        try:
+            while listings:
+                prefix, depth, page = pages.get()
+                if page is None:
+                    listings -= 1
+                    continue
+                if isinstance(page, Exception):
+                    raise page
+                subdirs, files = page
+                yield f"/{self.bucket_name}/{prefix}", subdirs, files
+                if max_depth is not None and depth >= max_depth:
+                    continue
+                for subdir in subdirs:
+                    tracing.submit(executor, list_level, f"{prefix}{subdir}/", depth + 1)
+                    listings += 1
+        finally:
+            stopped.set()
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def _walk_level(self, prefix_key : str):
+        """
+        List one directory level, page by page.
+
+        :param str prefix_key: prefix ending with '/', or empty string for the bucket root.
+
+        :return: generator of tuples (subdirs, files), one per page, with names relative to prefix_key.
+        """
+        if self._listing_cache is not None and prefix_key:
+            pages = [self._list_level(prefix_key)]
+        else:
+            pages = self._paginate(Prefix=prefix_key, Delimiter='/')
+        for page in pages:
+            subdirs = [x.get('Prefix')[len(prefix_key):-1] for x in page.get('CommonPrefixes', [])]
+            files = [x.get('Key')[len(prefix_key):] for x in page.get('Contents', []) if x.get('Key') != prefix_key]
+            yield subdirs, files
+
+    @tracing.traced('dir_exists')
     def dir_exists(self, path: str) -> bool:
         """
         Directory Exists.
@@ -115,6 +238,7 @@ class MinioFileSystemRepo(BaseMinioConnection, FileSystemRepository):
             return False
         return any([path in x for x in all_dirs])
 
+    @tracing.traced('file_exists')
     def file_exists(self, path : str) -> bool:
         """
         File Exists.
@@ -126,15 +250,137 @@ class MinioFileSystemRepo(BaseMinioConnection, FileSystemRepository):
         :return: bool `True` is dir exists else `False`
 
         """
-        file_path, file_name = extract_file_name(file_path=path)
-        norm_path = check_path(file_path, self.bucket_name)
-        obj = self._client.list_objects(Bucket=self.bucket_name, Prefix=norm_path, Delimiter='/')
+        return self._stat_object(path) is not None
 
-        if not obj.get('Contents'):
-            return False
-        all_files = [f"/{self.bucket_name}/{x.get('Key')}" for x in obj.get('Contents')]
-        return f'/{self.bucket_name}/{norm_path}{file_name}' in all_files
+    def stat(self, path : Union[str, ObjectPath]) -> dict:
+        """
+        Object metadata.
+
+        :param path: path to the object, /ift-bigdata-dev/globals/test.csv.
+        :type path: Union[str, ObjectPath]
+        :raises FileNotFoundError: if the object does not exist.
+        :return: the `list_objects` entry for the object, with Key, Size, ETag and LastModified.
+        :rtype: dict
+        """
+        object_stat = self._stat_object(path)
+        if not object_stat:
+            raise FileNotFoundError(f"The file {path} does not exist.")
+        return object_stat
 
+    def _stat_object(self, path : str, use_cache : bool = True) -> Optional[dict]:
+        """
+        Object listing entry.
+
+        :param str path: path to the object, /ift-bigdata-dev/globals/test.csv.
+        :param bool use_cache: if False, list the object from MinIO and update the listing cache, defaults to True.
+
+        :return: the `list_objects` entry for the object (Key, Size, ETag, ...) or None if it does not exist.
+        """
+        object_path = self._object_path(path)
+        obj = self._list_level(object_path.prefix, use_cache=use_cache)
+
+        object_stat = next((x for x in obj.get('Contents') or [] if x.get('Key') == object_path.key), None)
+        if not use_cache:
+            if object_stat is None:
+                self._cache_discard([object_path.key])
+            elif self._listing_cache is not None:
+                self._listing_cache.add(object_stat)
+        return object_stat
+
+    def refresh_listing(self, path : Optional[str] = None, full : bool = False):
+        """
+        Refresh Listing Cache.
+
+        refresh the cached listings, no-op if the repo was created without `listing_cache_ttl`.
+
+        :param str path: prefix to refresh as /ift-bigdata-dev/input/, if None all cached prefixes are refreshed.
+        :param bool full: if True the prefix is listed again from scratch, dropping keys deleted
+            by other clients. If False only keys after the last one seen are listed.
+        """
+        if self._listing_cache is None:
+            return
+        if path is None:
+            prefixes = self._listing_cache.prefixes
+        else:
+            prefix_key = self._object_path(path).as_dir().key
+            prefixes = [self._listing_cache.covering_prefix(prefix_key) or prefix_key]
+        for prefix in prefixes:
+            self._load_listing(prefix, full=full)
+
+    def _list_level(self, norm_path : str, use_cache : bool = True) -> dict:
+        """
+        List one level of a prefix, from the listing cache when enabled.
+
+        :param str norm_path: prefix key ending with '/', or empty string for the bucket root.
+        :param bool use_cache: if False, list from MinIO even if the listing cache is enabled, defaults to True.
+
+        :return: `list_objects` response with `Contents` and `CommonPrefixes`.
+        """
+        if self._listing_cache is None or not norm_path or not use_cache:
+            with self._measure('list', 'list_objects') as record:
+                response = self._client.list_objects(Bucket=self.bucket_name, Prefix=norm_path, Delimiter='/')
+                record.retries = retry_attempts(response)
+            return response
+        cached_prefix = self._listing_cache.covering_prefix(norm_path)
+        if cached_prefix is None:
+            self._load_listing(norm_path, full=True)
+        elif not self._listing_cache.is_fresh(cached_prefix):
+            # listed in full, an incremental listing would miss deleted and overwritten keys
+            self._load_listing(cached_prefix, full=True)
+        return self._listing_cache.list_level(norm_path)
+
+    def _load_listing(self, prefix_key : str, full : bool = True):
+        paginate_kwargs = {'Prefix': prefix_key}
+        start_after = None if full else self._listing_cache.last_key(prefix_key)
+        if start_after:
+            paginate_kwargs['StartAfter'] = start_after
+        entries = [x for page in self._paginate(**paginate_kwargs) for x in page.get('Contents', [])]
+        self._listing_cache.load(prefix_key, entries, full=full or start_after is None)
+
+    def _paginate(self, **kwargs):
+        """
+        Iterate over the pages of a `list_objects_v2` listing, measuring each request.
+
+        :param kwargs: arguments of `list_objects_v2` other than Bucket.
+
+        :return: generator of `list_objects_v2` responses.
+        """
+        pages = iter(self._client.get_paginator('list_objects_v2').paginate(Bucket=self.bucket_name, **kwargs))
+        while True:
+            start = time.perf_counter()
+            try:
+                page = next(pages, None)
+            except Exception:
+                self.metrics.record('list', time.perf_counter() - start, error=True)
+                raise
+            if page is None:
+                return
+            self.metrics.record('list', time.perf_counter() - start, retries=retry_attempts(page))
+            yield page
+
+    def _cache_add(self, key : str, size : Optional[int] = None, response : Optional[dict] = None):
+        """
+        Add an object written by this repo to the listing cache.
+
+        :param str key: object key.
+        :param int size: size of the object in bytes.
+        :param dict response: response of the write, its ETag and LastModified are kept in the entry.
+            LastModified defaults to the time of the write, as put_object does not return it.
+        """
+        if self._listing_cache is None:
+            return
+        entry = {'Key': key, 'Size': size, 'LastModified': datetime.now(timezone.utc)}
+        if isinstance(response, dict):
+            result = response.get('CopyObjectResult', response)
+            entry.update({x: result[x] for x in ('ETag', 'LastModified') if result.get(x) is not None})
+        self._listing_cache.add(entry)
+
+    def _cache_discard(self, keys : list):
+        if self._listing_cache is not None:
+            for key in keys:
+                self._listing_cache.discard(key)
+
+    @tracing.traced('read_file')
     def read_file(
             self,
             path : str,
@@ -146,30 +392,117 @@ class MinioFileSystemRepo(BaseMinioConnection, FileSystemRepository):
         
         read csv, parquet or pickle from minio.
 
+        Objects larger than `ranged_read_threshold` are fetched with concurrent byte-range
+        requests into a single buffer, which is handed to the deserialiser without copies.
+        The ranges are pinned to the ETag of the listing: if the object was overwritten since
+        it was listed, i.e. in the listing cache, the object is listed again and read once more.
+
         :param path (str): a regular path including bucket location as /ift-bigdata-dev/input/'.
         
         :return: list of dictionaries.
         """
-        file_path, file_name = extract_file_name(file_path=path)
-        norm_path = check_path(file_path, self.bucket_name)
-
-        if not self.file_exists(path=path):
+        object_stat = self._stat_object(path=path)
+        if not object_stat:
             raise FileExistsError
 
         if file_type not in ('parquet', 'csv', 'pickle', 'avro'):
             raise TypeError('file type not accepted, only parquet, csv and pickle file are allowed.')
-        if avro_schema:
-            funct_des = abstraction_deserialiser(file_type, avro_schema)
-        else:
-            funct_des = abstraction_deserialiser(file_type)
-        response = self._client.get_object(
-            Bucket=self.bucket_name,
-            Key=''.join((norm_path, file_name))
-            )
-        body_obj = response.get('Body')  #.read().decode('utf-8').splitlines(True)
-        input_data = funct_des(body_obj)
-        return input_data
+        funct_des = abstraction_deserialiser(file_type)
+        try:
+            payload = self._get_payload(object_stat)
+        except ObjectSizeChangedError:
+            object_stat = self._stat_object(path=path, use_cache=False)
+            if not object_stat:
+                raise FileExistsError
+            payload = self._get_payload(object_stat)
+        with self.metrics.measure('deserialise') as record:
+            record.bytes_in = len(payload)
+            if avro_schema:
+                return funct_des(BufferBody(payload), avro_schema)
+            return funct_des(BufferBody(payload))
+
+    def _get_payload(self, object_stat : dict):
+        """
+        Get the content of an object, with ranged requests if larger than `ranged_read_threshold`.
+
+        :param dict object_stat: listing entry of the object, with Key, Size and ETag.
+        :raises ObjectSizeChangedError: if the object is read with ranged requests and was overwritten.
 
+        :return: content of the object.
+        """
+        object_key = object_stat.get('Key')
+        object_size = object_stat.get('Size', 0)
+        with self._measure('get', 'get_object') as record:
+            if self.ranged_read_threshold is not None and object_size > self.ranged_read_threshold:
+                payload = ranged_get_object(
+                    self._client,
+                    self.bucket_name,
+                    object_key,
+                    size=object_size,
+                    chunk_size=self.ranged_read_chunksize,
+                    max_concurrency=self.max_concurrency,
+                    etag=object_stat.get('ETag'),
+                )
+            else:
+                response = self._client.get_object(
+                    Bucket=self.bucket_name,
+                    Key=object_key
+                    )
+                payload = response.get('Body').read()
+                record.retries = retry_attempts(response)
+            record.bytes_in = len(payload)
+        return payload
+
+    @tracing.traced('open')
+    def open(
+            self,
+            path : str,
+            mode : str = 'rb',
+            block_size : int = 4 * MB,
+            cache_blocks : int = 16,
+            read_ahead : int = 2
+        ) -> io.BufferedReader:
+        """
+        Open File.
+
+        open an object as a read-only, seekable binary file backed by byte-range requests.
+        Only the blocks touched by the reader are downloaded, i.e. the footer of a parquet
+        file or the central directory of a zip archive.
+
+        :param str path: a regular path including bucket location as /ift-bigdata-dev/input/test.parquet'.
+        :param str mode: only 'rb' is supported.
+        :param int block_size: size in bytes of each ranged request, defaults to 4MB.
+        :param int cache_blocks: maximum number of blocks held in memory, defaults to 16.
+        :param int read_ahead: number of blocks fetched ahead on sequential reads, defaults to 2.
+        :raises ValueError: if mode is not 'rb'.
+        :raises FileNotFoundError: if the object does not exist.
+        :raises ObjectSizeChangedError: on reads, if the object was overwritten after it was opened.
+
+        :return: buffered binary file object.
+
+        :Examples:
+            >>> with minio_repo.open('/ift-bigdata-dev/input/test.parquet') as f:
+            ...     trades = pd.read_parquet(f, columns=['trade_id'])
+        """
+        if mode != 'rb':
+            raise ValueError(f"Mode {mode} not supported, only 'rb' is accepted.")
+        object_stat = self._stat_object(path)
+        if not object_stat:
+            raise FileNotFoundError(f"The file {path} does not exist.")
+        raw = MinioObjectReader(
+            self._client,
+            self.bucket_name,
+            object_stat.get('Key'),
+            size=object_stat.get('Size'),
+            etag=object_stat.get('ETag'),
+            block_size=block_size,
+            cache_blocks=cache_blocks,
+            read_ahead=read_ahead,
+            metrics=self.metrics,
+        )
+        return io.BufferedReader(raw, buffer_size=min(block_size, io.DEFAULT_BUFFER_SIZE))
+
+    @tracing.traced('write_file')
     def write_file(self,
                    path : str,
                    output_data: Union[dict, list, pd.DataFrame],
@@ -187,19 +520,48 @@ class MinioFileSystemRepo(BaseMinioConnection, FileSystemRepository):
         
         :return: minio response metadata JSON representation
         """
-        norm_path = path.replace('/'+self.bucket_name+'/', '')
+        norm_path = self._object_path(path).key
         serial_file = abstraction_serialiser(file_type)
-        if avro_schema:
-            text_body = serial_file(output_data, avro_schema)
-        else:
-            text_body = serial_file(output_data)
-        response = self._client.put_object(
-            Bucket=self.bucket_name,
-            Key=norm_path,
-            Body=text_body
-            )
+        with self.metrics.measure('serialise') as record:
+            if avro_schema:
+                text_body = serial_file(output_data, avro_schema)
+            else:
+                text_body = serial_file(output_data)
+            record.bytes_out = len(text_body)
+        return self.put_object(norm_path, text_body)
+
+    @tracing.traced('put_object')
+    def put_object(self, path : Union[str, ObjectPath], body : Union[bytes, str], **kwargs) -> dict:
+        """
+        Write bytes to an object as they are, without serialising.
+
+        :param path: a regular path including bucket location as /ift-bigdata-dev/logs/batch.jsonl.gz
+        :type path: Union[str, ObjectPath]
+        :param body: content of the object
+        :type body: Union[bytes, str]
+        :param kwargs: other boto3 put_object arguments, i.e. ContentType or ContentEncoding
+        :return: minio response metadata JSON representation
+        :rtype: dict
+        :Examples:
+            >>> minio_repo.put_object('/iftbigdata/logs/batch.jsonl.gz', gzip.compress(lines),
+            ...                       ContentType='application/x-ndjson', ContentEncoding='gzip')
+        """
+        norm_path = self._object_path(path).key
+        # str bodies are sent utf-8 encoded
+        n_bytes = len(body.encode('utf-8')) if isinstance(body, str) else len(body)
+        with self._measure('put', 'put_object') as record:
+            response = self._client.put_object(
+                Bucket=self.bucket_name,
+                Key=norm_path,
+                Body=body,
+                **kwargs
+                )
+            record.bytes_out = n_bytes
+            record.retries = retry_attempts(response)
+        self._cache_add(norm_path, n_bytes, response)
         return response
     
+    @tracing.traced('upload_file')
     def upload_file(self, local_file_path: str, remote_file_path: Optional[str] = None):
         """
         Upload a file from the local file system to the MinIO bucket.
@@ -215,18 +577,22 @@ class MinioFileSystemRepo(BaseMinioConnection, FileSystemRepository):
             raise FileNotFoundError(f"The file {local_file_path} does not exist.")
         
         if remote_file_path:
-            remote_file_path = remote_file_path.replace('/'+self.bucket_name+'/', '')
+            remote_file_path = self._object_path(remote_file_path).key
 
         if not remote_file_path:
             remote_file_path = os.path.basename(local_file_path)
 
         try:
-            self._client.upload_file(local_file_path, self.bucket_name, remote_file_path)
+            with self._measure('put', 'upload_file') as record:
+                self._client.upload_file(local_file_path, self.bucket_name, remote_file_path)
+                record.bytes_out = os.path.getsize(local_file_path)
+            self._cache_add(remote_file_path, os.path.getsize(local_file_path))
             print(f"File {local_file_path} uploaded to bucket {self.bucket_name} as {remote_file_path}.")
         except ClientError as error:
             print(f"Failed to upload {local_file_path} to {self.bucket_name}: {error}")
             raise
 
+    @tracing.traced('download_file')
     def download_file(self, remote_file_path: str, local_file_path: str):
         """
         Download an object from the MinIO bucket to the local file system.
@@ -237,14 +603,255 @@ class MinioFileSystemRepo(BaseMinioConnection, FileSystemRepository):
         :type local_file_path: str
         :raises ClientError: If there is an error during download.
         """
-        object_name = remote_file_path.replace('/'+self.bucket_name+'/', '')
+        object_name = self._object_path(remote_file_path).key
         try:
-            self._client.download_file(self.bucket_name, object_name, local_file_path)
+            with self._measure('get', 'download_file') as record:
+                self._client.download_file(self.bucket_name, object_name, local_file_path)
+                record.bytes_in = os.path.getsize(local_file_path)
             print(f"Object {object_name} downloaded from bucket {self.bucket_name} to {local_file_path}.")
         except ClientError as error:
             print(f"Failed to download {object_name} from {self.bucket_name}: {error}")
             raise
 
+    @tracing.traced('delete_files')
+    def delete_files(self, paths : list) -> dict:
+        """
+        Delete Files.
+
+        delete objects with `delete_objects` requests of up to 1000 keys, sent concurrently.
+
+        :param list paths: paths to delete as /ift-bigdata-dev/test/test.csv.
+
+        :return: dictionary with `Deleted`, the list of keys deleted,
+            and `Errors`, the error entries for the keys that could not be deleted.
+        """
+        keys = [self._object_path(path).key for path in paths]
+        return self._delete_keys(batched(keys, 1000))
+
+    @tracing.traced('delete_prefix')
+    def delete_prefix(self, prefix : str) -> dict:
+        """
+        Delete Prefix.
+
+        delete all objects under a prefix, each listing page of up to 1000 keys
+        is deleted with one `delete_objects` request while the listing continues.
+
+        :param str prefix: a regular path including bucket location as /ift-bigdata-dev/test/.
+        :raises ValueError: if the prefix resolves to the root of the bucket.
+
+        :return: dictionary with `Deleted`, the list of keys deleted,
+            and `Errors`, the error entries for the keys that could not be deleted.
+        """
+        norm_prefix = self._prefix_key(prefix)
+        return self._delete_keys(
+            [x.get('Key') for x in page] for page in self._iter_object_pages(norm_prefix)
+        )
+
+    @tracing.traced('copy')
+    def copy(self, source_path : str, destination_path : str) -> dict:
+        """
+        Copy File.
+
+        server side copy of an object, objects larger than `multipart_copy_threshold`
+        are copied with concurrent multipart copy requests.
+
+        :param str source_path: path of the object to copy as /ift-bigdata-dev/test/test.csv.
+        :param str destination_path: path of the copy as /ift-bigdata-dev/archive/test.csv.
+
+        :return: minio response metadata JSON representation
+        """
+        source_key = self._object_path(source_path).key
+        destination_key = self._object_path(destination_path).key
+        return self._copy_key(source_key, destination_key)
+
+    @tracing.traced('copy_files')
+    def copy_files(self, file_pairs : Union[dict, list]) -> list:
+        """
+        Copy Files.
+
+        server side copy of many objects, running concurrently.
+
+        :param file_pairs: mapping source path -> destination path or list of (source, destination) tuples.
+        :type file_pairs: Union[dict, list]
+
+        :return: list of destination paths.
+        """
+        pairs = list(file_pairs.items()) if isinstance(file_pairs, dict) else list(file_pairs)
+        key_pairs = [(self._object_path(src).key, self._object_path(dst).key) for src, dst in pairs]
+        with ThreadPoolExecutor(max_workers=self.max_concurrency) as executor:
+            futures = [tracing.submit(executor, self._copy_key, src, dst) for src, dst in key_pairs]
+            for future in futures:
+                future.result()
+        return [f"/{self.bucket_name}/{dst}" for _, dst in key_pairs]
+
+    @tracing.traced('copy_prefix')
+    def copy_prefix(self, source_prefix : str, destination_prefix : str) -> list:
+        """
+        Copy Prefix.
+
+        server side copy of all objects under a prefix to a new prefix, keeping the relative paths.
+        A destination under the source, as /ift-bigdata-dev/test/archive/, is excluded from the copy.
+
+        :param str source_prefix: prefix to copy as /ift-bigdata-dev/test/.
+        :param str destination_prefix: prefix to copy to as /ift-bigdata-dev/archive/test/.
+        :raises ValueError: if the destination is the source prefix.
+
+        :return: list of source keys copied.
+        """
+        return [src for src, _ in self._copy_prefix_keys(source_prefix, destination_prefix)]
+
+    @tracing.traced('move')
+    def move(self, source_path : str, destination_path : str) -> dict:
+        """
+        Move File.
+
+        server side copy of an object followed by the deletion of the source.
+
+        :param str source_path: path of the object to move as /ift-bigdata-dev/test/test.csv.
+        :param str destination_path: new path of the object as /ift-bigdata-dev/archive/test.csv.
+        :raises ValueError: if source and destination are the same object.
+
+        :return: minio response metadata JSON representation of the copy
+        """
+        response = self.copy(source_path, destination_path)
+        source_key = self._object_path(source_path).key
+        with self._measure('delete', 'delete_object') as record:
+            record.retries = retry_attempts(self._client.delete_object(Bucket=self.bucket_name, Key=source_key))
+        self._cache_discard([source_key])
+        return response
+
+    @tracing.traced('move_files')
+    def move_files(self, file_pairs : Union[dict, list]) -> list:
+        """
+        Move Files.
+
+        server side copy of many objects, followed by a batched deletion of the sources.
+
+        :param file_pairs: mapping source path -> destination path or list of (source, destination) tuples.
+        :type file_pairs: Union[dict, list]
+
+        :return: list of destination paths.
+        """
+        pairs = list(file_pairs.items()) if isinstance(file_pairs, dict) else list(file_pairs)
+        destinations = self.copy_files(pairs)
+        self._raise_delete_errors(self.delete_files([src for src, _ in pairs]))
+        return destinations
+
+    @tracing.traced('move_prefix')
+    def move_prefix(self, source_prefix : str, destination_prefix : str) -> list:
+        """
+        Move Prefix.
+
+        server side copy of all objects under a prefix to a new prefix, followed by a batched
+        deletion of the objects copied. Objects written under the source prefix while the copy
+        runs are left in place, as are the objects of a destination under the source.
+
+        :param str source_prefix: prefix to move as /ift-bigdata-dev/test/.
+        :param str destination_prefix: new prefix as /ift-bigdata-dev/archive/test/.
+        :raises ValueError: if the destination is the source prefix.
+
+        :return: list of source keys moved.
+        """
+        source_keys = [src for src, _ in self._copy_prefix_keys(source_prefix, destination_prefix)]
+        self._raise_delete_errors(self._delete_keys(batched(source_keys, 1000)))
+        return source_keys
+
+    def _object_path(self, path : Union[str, ObjectPath]) -> ObjectPath:
+        return ObjectPath.parse(path, self.bucket_name)
+
+    def _prefix_key(self, prefix : Union[str, ObjectPath]) -> str:
+        norm_prefix = self._object_path(prefix).as_dir().key
+        if not norm_prefix:
+            raise ValueError('Prefix resolves to the bucket root, operations on the whole bucket are not allowed.')
+        return norm_prefix
+
+    def _iter_object_pages(self, prefix_key : str):
+        for page in self._paginate(Prefix=prefix_key):
+            yield page.get('Contents', [])
+
+    def _delete_keys(self, key_batches) -> dict:
+        result = {'Deleted': [], 'Errors': []}
+        with ThreadPoolExecutor(max_workers=self.max_concurrency) as executor:
+            futures = [
+                tracing.submit(executor, self._delete_batch, keys)
+                for keys in key_batches if keys
+            ]
+            for future in futures:
+                batch_result = future.result()
+                result['Deleted'].extend(batch_result.get('Deleted'))
+                result['Errors'].extend(batch_result.get('Errors'))
+        self._cache_discard(result['Deleted'])
+        return result
+
+    def _delete_batch(self, keys : list) -> dict:
+        with self._measure('delete', 'delete_objects'):
+            return delete_object_batch(self._client, self.bucket_name, keys)
+
+    @staticmethod
+    def _raise_delete_errors(delete_result : dict):
+        if delete_result.get('Errors'):
+            failed_keys = ', '.join(x.get('Key', '') for x in delete_result.get('Errors'))
+            raise IOError(f"Objects copied but could not delete the sources: {failed_keys}")
+
+    def _copy_key(self, source_key : str, destination_key : str, size : Optional[int] = None) -> dict:
+        if source_key == destination_key:
+            raise ValueError(f'Cannot copy {source_key} onto itself.')
+        head_response = None
+        if size is None:
+            with self._measure('head', 'head_object') as record:
+                head_response = self._client.head_object(Bucket=self.bucket_name, Key=source_key)
+                record.retries = retry_attempts(head_response)
+            size = head_response.get('ContentLength', 0)
+        if size > self.multipart_copy_threshold:
+            with self._measure('multipart', 'multipart_copy'):
+                response = multipart_copy_object(
+                    self._client,
+                    self.bucket_name,
+                    source_key,
+                    destination_key,
+                    size,
+                    part_size=self.multipart_copy_partsize,
+                    max_concurrency=self.max_concurrency,
+                    source_head=head_response,
+                )
+        else:
+            with self._measure('copy', 'copy_object') as record:
+                response = self._client.copy_object(
+                    Bucket=self.bucket_name,
+                    Key=destination_key,
+                    CopySource={'Bucket': self.bucket_name, 'Key': source_key}
+                )
+                record.retries = retry_attempts(response)
+        self._cache_add(destination_key, size, response)
+        return response
+
+    def _copy_prefix_keys(self, source_prefix : str, destination_prefix : str) -> list:
+        source_key_prefix = self._prefix_key(source_prefix)
+        destination_key_prefix = self._object_path(destination_prefix).as_dir().key
+        if destination_key_prefix == source_key_prefix:
+            raise ValueError(f'Cannot copy prefix {source_key_prefix} onto itself.')
+        pages = self._iter_object_pages(source_key_prefix)
+        if destination_key_prefix.startswith(source_key_prefix):
+            # the copies would be listed with the source, which is listed in full first,
+            # skipping the objects already under the destination
+            pages = [
+                [x for page in pages for x in page if not x.get('Key').startswith(destination_key_prefix)]
+            ]
+        copied = []
+        with ThreadPoolExecutor(max_workers=self.max_concurrency) as executor:
+            futures = []
+            for page in pages:
+                for obj in page:
+                    source_key = obj.get('Key')
+                    destination_key = destination_key_prefix + source_key[len(source_key_prefix):]
+                    futures.append(
+                        tracing.submit(executor, self._copy_key, source_key, destination_key, obj.get('Size'))
+                    )
+                    copied.append((source_key, destination_key))
+            for future in futures:
+                future.result()
+        return copied
+
 
 
 FileSystemRepository.register_repository('minio', MinioFileSystemRepo)
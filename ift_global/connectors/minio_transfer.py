@@ -0,0 +1,329 @@
+from concurrent.futures import ThreadPoolExecutor
+from http import HTTPStatus
+from typing import Optional
+
+from botocore.exceptions import ClientError
+
+from ift_global.utils import tracing
+
+MB = 1024 ** 2
+
+
+class ObjectSizeChangedError(IOError):
+    """
+    Raised by :func:`ranged_get_object` when the object does not have the size or ETag given.
+
+    The size and ETag usually come from a listing taken before the object was overwritten.
+
+    :param key: object key within the bucket
+    :type key: str
+    :param expected_size: size the ranges were planned for
+    :type expected_size: int
+    :param size: size of the object reported by the ranged responses, None if unknown
+    :type size: int, optional
+    """
+
+    def __init__(self, key: str, expected_size: int, size: Optional[int] = None):
+        """Constructor method."""
+        super().__init__(f'{key} changed: expected {expected_size} bytes, got {size}')
+        self.key = key
+        self.expected_size = expected_size
+        self.size = size
+
+
+def content_range_size(content_range: Optional[str]) -> Optional[int]:
+    """
+    Total size of an object from the ContentRange of a ranged response.
+
+    :param content_range: ContentRange header, i.e. 'bytes 0-99/1000'
+    :type content_range: str, optional
+    :return: size in bytes, None if the header is missing or the size unknown
+    :rtype: int, optional
+
+    :Example:
+        >>> content_range_size('bytes 0-99/1000')
+        1000
+    """
+    if not content_range or '/' not in content_range:
+        return None
+    size = content_range.rsplit('/', 1)[1]
+    return int(size) if size.isdigit() else None
+
+
+def precondition_failed(error: ClientError) -> bool:
+    """
+    Check if a request failed on an ``If-Match`` condition, i.e. the object was overwritten.
+
+    :param error: error raised by the boto3 client
+    :type error: ClientError
+    :return: True for a 412 Precondition Failed response
+    :rtype: bool
+    """
+    return (error.response.get('Error', {}).get('Code') == 'PreconditionFailed'
+            or error.response.get('ResponseMetadata', {}).get('HTTPStatusCode') == HTTPStatus.PRECONDITION_FAILED)
+
+
+class BufferBody:
+    """
+    In-Memory Response Body.
+
+    Wraps a preallocated buffer with the ``read`` interface of a boto3 ``StreamingBody``,
+    so that the deserialisers in :mod:`ift_global.connectors.file_serialiser` can consume
+    it as if it was a regular ``get_object`` response body.
+
+    ``read`` returns :class:`memoryview` slices of the underlying buffer, no bytes are copied.
+
+    :param buffer: a bytes-like object holding the full object payload
+    :type buffer: Union[bytes, bytearray, memoryview]
+
+    :Example:
+        >>> body = BufferBody(bytearray(b'a,b,c'))
+        >>> bytes(body.read(3))
+        b'a,b'
+    """
+
+    def __init__(self, buffer):
+        """Constructor method."""
+        self._view = memoryview(buffer)
+        self._position = 0
+
+    def __len__(self):
+        return len(self._view)
+
+    def read(self, amt: Optional[int] = None) -> memoryview:
+        """
+        Read up to `amt` bytes from the buffer, all remaining bytes if `amt` is None.
+
+        :param amt: number of bytes to read, defaults to None
+        :type amt: int, optional
+        :return: a zero-copy view on the bytes read
+        :rtype: memoryview
+        """
+        start = self._position
+        end = len(self._view) if amt is None or amt < 0 else min(start + amt, len(self._view))
+        self._position = end
+        return self._view[start:end]
+
+
+def byte_ranges(size: int, chunk_size: int) -> list:
+    """
+    Split an object of `size` bytes in contiguous ranges of at most `chunk_size` bytes.
+
+    :param size: total size of the object in bytes
+    :type size: int
+    :param chunk_size: maximum size of each range in bytes
+    :type chunk_size: int
+    :raises ValueError: if chunk_size is not a positive integer
+    :return: list of tuples (first_byte, last_byte), both inclusive as in HTTP Range headers
+    :rtype: list
+
+    :Example:
+        >>> byte_ranges(10, 4)
+        [(0, 3), (4, 7), (8, 9)]
+    """
+    if chunk_size <= 0:
+        raise ValueError('chunk_size must be a positive integer')
+    return [(start, min(start + chunk_size, size) - 1) for start in range(0, size, chunk_size)]
+
+
+def ranged_get_object(  # noqa: PLR0913
+        client,
+        bucket_name: str,
+        key: str,
+        size: int,
+        *,
+        chunk_size: int = 8 * MB,
+        max_concurrency: int = 10,
+        etag: Optional[str] = None
+    ) -> memoryview:
+    """
+    Parallel Ranged Get.
+
+    Fetch an object with concurrent byte-range ``get_object`` requests, each writing
+    its slice straight into one preallocated buffer. With `etag`, every range is requested
+    with ``IfMatch`` so that all ranges come from the same version of the object.
+
+    :param client: boto3 S3 client
+    :type client: boto3.client
+    :param bucket_name: name of the bucket
+    :type bucket_name: str
+    :param key: object key within the bucket
+    :type key: str
+    :param size: size of the object in bytes, as returned by ``list_objects`` or ``head_object``
+    :type size: int
+    :param chunk_size: size of each ranged request in bytes, defaults to 8MB
+    :type chunk_size: int, optional
+    :param max_concurrency: maximum number of concurrent requests, defaults to 10
+    :type max_concurrency: int, optional
+    :param etag: ETag of the object, as returned by ``list_objects`` or ``head_object``, defaults to None
+    :type etag: str, optional
+    :raises ObjectSizeChangedError: if the ranged responses report another size or ETag, i.e. the object
+        was overwritten since it was listed
+    :raises IOError: if a ranged response does not return the number of bytes requested
+    :return: a view on the buffer holding the full object
+    :rtype: memoryview
+    """
+    buffer = bytearray(size)
+    view = memoryview(buffer)
+    pin_version = {'IfMatch': etag} if etag else {}
+
+    def _fetch_range(first_byte, last_byte):
+        try:
+            response = client.get_object(
+                Bucket=bucket_name, Key=key, Range=f'bytes={first_byte}-{last_byte}', **pin_version
+            )
+        except ClientError as error:
+            if error.response.get('Error', {}).get('Code') == 'InvalidRange' or precondition_failed(error):
+                raise ObjectSizeChangedError(key, size) from error
+            raise
+        object_size = content_range_size(response.get('ContentRange'))
+        if object_size is not None and object_size != size:
+            raise ObjectSizeChangedError(key, size, object_size)
+        body = response.get('Body')
+        offset = first_byte
+        expected_end = last_byte + 1
+        while offset < expected_end:
+            chunk = body.read(min(MB, expected_end - offset))
+            if not chunk:
+                break
+            view[offset:offset + len(chunk)] = chunk
+            offset += len(chunk)
+        if offset != expected_end:
+            raise IOError(f'Incomplete range read for {key}: '
+                          f'expected bytes {first_byte}-{last_byte}, got up to {offset - 1}')
+
+    ranges = byte_ranges(size, chunk_size)
+    with ThreadPoolExecutor(max_workers=max(1, min(max_concurrency, len(ranges)))) as executor:
+        futures = [tracing.submit(executor, _fetch_range, first_byte, last_byte) for first_byte, last_byte in ranges]
+        for future in futures:
+            future.result()
+    return view
+
+
+def batched(items: list, batch_size: int):
+    """
+    Yield successive batches of at most `batch_size` items.
+
+    :param items: items to split in batches
+    :type items: list
+    :param batch_size: maximum size of each batch
+    :type batch_size: int
+    :return: generator of lists
+
+    :Example:
+        >>> list(batched(['a', 'b', 'c'], 2))
+        [['a', 'b'], ['c']]
+    """
+    items = list(items)
+    for start in range(0, len(items), batch_size):
+        yield items[start:start + batch_size]
+
+
+def delete_object_batch(client, bucket_name: str, keys: list) -> dict:
+    """
+    Delete up to 1000 keys with one ``delete_objects`` request.
+
+    :param client: boto3 S3 client
+    :type client: boto3.client
+    :param bucket_name: name of the bucket
+    :type bucket_name: str
+    :param keys: object keys to delete, at most 1000
+    :type keys: list
+    :return: dictionary with the keys `Deleted` (list of keys) and `Errors` (list of error entries)
+    :rtype: dict
+    """
+    response = client.delete_objects(
+        Bucket=bucket_name,
+        Delete={'Objects': [{'Key': key} for key in keys], 'Quiet': True}
+    )
+    errors = response.get('Errors', [])
+    failed_keys = {x.get('Key') for x in errors}
+    return {'Deleted': [key for key in keys if key not in failed_keys], 'Errors': errors}
+
+
+# object headers kept by copy_object, set again on the multipart upload of a copy
+COPIED_HEADERS = ('ContentType', 'ContentEncoding', 'ContentDisposition', 'ContentLanguage', 'CacheControl')
+
+
+def multipart_copy_object(  # noqa: PLR0913
+        client,
+        bucket_name: str,
+        source_key: str,
+        destination_key: str,
+        size: int,
+        *,
+        part_size: int = 64 * MB,
+        max_concurrency: int = 10,
+        source_head: Optional[dict] = None
+    ) -> dict:
+    """
+    Server Side Multipart Copy.
+
+    Copy an object within the bucket with concurrent ``upload_part_copy`` requests,
+    no object bytes are transferred to the client. Required for objects larger than 5GB.
+
+    The part size is increased if needed to stay within the 10,000 parts allowed by S3.
+    As ``copy_object``, the copy keeps the content type and user metadata of the source,
+    and every part is copied from the version of the source seen by ``head_object``.
+
+    :param client: boto3 S3 client
+    :type client: boto3.client
+    :param bucket_name: name of the bucket
+    :type bucket_name: str
+    :param source_key: key of the object to copy
+    :type source_key: str
+    :param destination_key: key of the copy
+    :type destination_key: str
+    :param size: size of the source object in bytes
+    :type size: int
+    :param part_size: size of each part in bytes, defaults to 64MB
+    :type part_size: int, optional
+    :param max_concurrency: maximum number of concurrent requests, defaults to 10
+    :type max_concurrency: int, optional
+    :param source_head: ``head_object`` response of the source, requested if not given
+    :type source_head: dict, optional
+    :raises ClientError: if any part fails, i.e. the source was overwritten during the copy,
+        after the multipart upload has been aborted
+    :return: ``complete_multipart_upload`` response
+    :rtype: dict
+    """
+    part_size = max(part_size, -(-size // 10000))
+    if source_head is None:
+        source_head = client.head_object(Bucket=bucket_name, Key=source_key)
+    upload_kwargs = {x: source_head[x] for x in COPIED_HEADERS if source_head.get(x)}
+    upload_kwargs['Metadata'] = source_head.get('Metadata') or {}
+    # parts are only copied from the version of the source headed
+    pin_source = {'CopySourceIfMatch': source_head['ETag']} if source_head.get('ETag') else {}
+    upload_id = client.create_multipart_upload(
+        Bucket=bucket_name, Key=destination_key, **upload_kwargs
+    ).get('UploadId')
+
+    def _copy_part(part_number, first_byte, last_byte):
+        response = client.upload_part_copy(
+            Bucket=bucket_name,
+            Key=destination_key,
+            UploadId=upload_id,
+            PartNumber=part_number,
+            CopySource={'Bucket': bucket_name, 'Key': source_key},
+            CopySourceRange=f'bytes={first_byte}-{last_byte}',
+            **pin_source
+        )
+        return {'ETag': response.get('CopyPartResult', {}).get('ETag'), 'PartNumber': part_number}
+
+    ranges = byte_ranges(size, part_size)
+    try:
+        with ThreadPoolExecutor(max_workers=max(1, min(max_concurrency, len(ranges)))) as executor:
+            futures = [
+                tracing.submit(executor, _copy_part, part_number, first_byte, last_byte)
+                for part_number, (first_byte, last_byte) in enumerate(ranges, 1)
+            ]
+            parts = [future.result() for future in futures]
+    except Exception:
+        client.abort_multipart_upload(Bucket=bucket_name, Key=destination_key, UploadId=upload_id)
+        raise
+    return client.complete_multipart_upload(
+        Bucket=bucket_name,
+        Key=destination_key,
+        UploadId=upload_id,
+        MultipartUpload={'Parts': parts}
+    )
@@ -1,11 +1,13 @@
-from typing import Union
+from __future__ import annotations
 
-import css_inline
-import pandas as pd
-from jinja2 import Environment, FileSystemLoader, select_autoescape
+from typing import TYPE_CHECKING, Union
 
 from ift_global.email.css_stylesheets.footer import footer
 
+# jinja2, css_inline and pandas are imported by the functions using them
+if TYPE_CHECKING:
+    import pandas as pd
+
 
 def jinja_to_html(template_dir: str, template_name: str, stylesheet: str, loc_vars) -> str:
     """
@@ -32,6 +34,9 @@ def jinja_to_html(template_dir: str, template_name: str, stylesheet: str, loc_va
             ...     loc_var=vars()
             ... )
     """
+    import css_inline
+    from jinja2 import Environment, FileSystemLoader, select_autoescape
+
     env = Environment(
         loader=FileSystemLoader(template_dir),
         autoescape=select_autoescape(['html', 'htm', 'xml'])  # Enable autoescaping for HTML and XML files
@@ -90,7 +95,7 @@ def build_html_table(input_data: Union[list, dict, pd.DataFrame]) -> str:
     if class_type not in ('dict', 'list', 'DataFrame'):
         raise TypeError(f'Class type must be dict, list, or pd DataFrame; you provided {class_type}')
 
-    if isinstance(input_data, pd.DataFrame):
+    if class_type == 'DataFrame':
         input_data = input_data.to_dict('list')
 
     if isinstance(input_data, dict):
@@ -138,6 +143,8 @@ def inject_stylesheet(html_string: str, style_sheet: str) -> str:
     else:
         html_enriched = html_enriched.replace('</html>', ''.join([footer, '</html>']))
 
+    import css_inline
+
     inliner = css_inline.CSSInliner(keep_style_tags=True)
 
     return inliner.inline(html_enriched)
@@ -0,0 +1,63 @@
+import json
+
+import pandas as pd
+import pytest
+
+from ift_global.benchmarks.__main__ import main
+from ift_global.benchmarks.datasets import make_trades
+from ift_global.benchmarks.fake_s3 import InMemoryS3Client, in_memory_repo
+from ift_global.benchmarks.memory import measure_memory, profile_memory
+from ift_global.benchmarks.serialisers import benchmark_serialisers
+
+
+def test_make_trades_shape_and_seed():
+    df = make_trades(50, n_columns=10)
+    assert df.shape == (50, 10)
+    pd.testing.assert_frame_equal(df, make_trades(50, n_columns=10))
+    assert list(make_trades(5, dtype_mix='numeric').columns[:3]) == ['trade_id', 'quantity', 'price']
+
+
+def test_make_trades_invalid_dtype_mix():
+    with pytest.raises(ValueError):
+        make_trades(5, dtype_mix='binary')
+
+
+def test_in_memory_repo_round_trip():
+    client = InMemoryS3Client('benchmark')
+    repo = in_memory_repo(client, listing_cache_ttl=60)
+    df = make_trades(100)
+    repo.write_file('/benchmark/data/2024/trades.parquet', df, 'parquet')
+    pd.testing.assert_frame_equal(repo.read_file('/benchmark/data/2024/trades.parquet', 'parquet'), df)
+    assert repo.list_files('/benchmark/data/2024/') == ['/benchmark/data/2024/trades.parquet']
+    repo.copy_prefix('/benchmark/data/', '/benchmark/copy/')
+    assert repo.file_exists('/benchmark/copy/2024/trades.parquet')
+    repo.delete_prefix('/benchmark/copy/')
+    assert not repo.file_exists('/benchmark/copy/2024/trades.parquet')
+    assert client.requests['put_object'] == 1
+
+
+def test_benchmark_serialisers():
+    results = benchmark_serialisers(rows=(100,), formats=('csv', 'avro'), repeat=1)
+    assert [x['format'] for x in results] == ['csv', 'avro']
+    assert all(x['payload_bytes'] > 0 and x['deserialise_mb_per_second'] > 0 for x in results)
+
+
+def test_main_writes_json(tmp_path):
+    output = tmp_path / 'results.json'
+    main(['--rows', '100', '--files', '10', '--latency', '0', '--repeat', '1', '--output', str(output)])
+    report = json.loads(output.read_text())
+    assert {x['suite'] for x in report['results']} == {'serialisers', 'repository', 'memory', 'imports'}
+    assert 'python' in report['environment']
+
+
+def test_profile_memory_reports_ratios():
+    results = profile_memory(rows=(1_000,), formats=('parquet',))
+    paths = {(x['path'], x['variant']) for x in results}
+    assert ('deserialise', 'arrow_dtypes') in paths
+    assert ('read_file', 'ranged_get') in paths
+    assert all(x['tracemalloc_ratio'] >= 0 and x['payload_bytes'] > 0 for x in results)
+
+
+def test_measure_memory_tracks_python_allocations():
+    measured = measure_memory(lambda: bytearray(4 * 1024**2))
+    assert measured['tracemalloc_peak_bytes'] >= 4 * 1024**2
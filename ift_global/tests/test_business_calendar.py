@@ -0,0 +1,103 @@
+import datetime
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from ift_global.business_date.business_calendar import BusinessCalendar, as_country, as_dates
+from ift_global.business_date.calendar_exclusions import CalendarExtract, Country
+
+
+@pytest.fixture
+def calendar():
+    return BusinessCalendar({
+        Country.US: ['2025-07-04', '2025-11-27'],
+        Country.GB: ['2025-08-25'],
+        Country.ALL: ['2025-12-25', '2026-01-01'],
+    })
+
+
+def test_as_country():
+    assert as_country(Country.US) is Country.US
+    assert as_country('US') is Country.US
+    assert as_country('england') is Country.GB
+    assert as_country(' Usa ') is Country.US
+    with pytest.raises(ValueError):
+        as_country('italy')
+
+
+def test_as_dates():
+    expected = np.array(['2025-01-02', '2025-01-03'], dtype='datetime64[D]')
+    np.testing.assert_array_equal(as_dates(['2025-01-02', '2025-01-03']), expected)
+    np.testing.assert_array_equal(as_dates([datetime.date(2025, 1, 2), datetime.datetime(2025, 1, 3, 10)]), expected)
+    np.testing.assert_array_equal(as_dates(pd.Series(pd.to_datetime(['2025-01-02 09:30', '2025-01-03 17:00']))), expected)
+
+
+def test_as_dates_timezone_aware():
+    # 08:00 in Tokyo is the day before in UTC
+    tokyo = pd.to_datetime(['2025-07-03 08:00', '2025-07-04 23:30']).tz_localize('Asia/Tokyo')
+    expected = np.array(['2025-07-03', '2025-07-04'], dtype='datetime64[D]')
+    np.testing.assert_array_equal(as_dates(pd.Series(tokyo)), expected)
+    np.testing.assert_array_equal(as_dates(tokyo), expected)
+    assert as_dates(tokyo[0]) == expected[0]
+    assert as_dates(tokyo[0].to_pydatetime()) == expected[0]
+
+
+def test_holidays_include_all(calendar):
+    np.testing.assert_array_equal(
+        calendar.holidays(Country.US),
+        np.array(['2025-07-04', '2025-11-27', '2025-12-25', '2026-01-01'], dtype='datetime64[D]')
+    )
+    np.testing.assert_array_equal(calendar.holidays('JP'), calendar.holidays(Country.ALL))
+    assert calendar.busdaycalendar('US') is calendar.busdaycalendar(Country.US)
+
+
+def test_is_business_day(calendar):
+    dates = ['2025-07-04', '2025-08-25', '2025-12-25', '2025-07-05', '2025-07-07']
+    assert calendar.is_business_day(dates, Country.US).tolist() == [False, True, False, False, True]
+    assert calendar.is_business_day(dates, Country.GB).tolist() == [True, False, False, False, True]
+
+
+def test_add_business_days(calendar):
+    trade_dates = pd.Series(pd.to_datetime(['2025-07-02', '2025-07-03', '2025-12-23', '2025-07-05']))
+    settle_dates = calendar.add_business_days(trade_dates, 2, Country.US)
+    np.testing.assert_array_equal(
+        settle_dates, np.array(['2025-07-07', '2025-07-08', '2025-12-26', '2025-07-09'], dtype='datetime64[D]')
+    )
+    np.testing.assert_array_equal(
+        calendar.add_business_days(['2025-07-07'], -1, 'US'), np.array(['2025-07-03'], dtype='datetime64[D]')
+    )
+
+
+def test_business_days_between(calendar):
+    counts = calendar.business_days_between(['2025-07-01', '2025-12-22'], ['2025-07-08', '2026-01-05'], 'US')
+    assert counts.tolist() == [4, 8]
+
+
+
+def test_business_days_between_missing_dates(calendar):
+    counts = calendar.business_days_between(
+        pd.Series(pd.to_datetime(['2025-07-01', None, '2025-12-22'])), ['2025-07-08', '2025-07-08', None], 'US'
+    )
+    assert counts[0] == 4
+    assert np.isnan(counts[1:]).all()
+
+
+def test_date_range(calendar):
+    np.testing.assert_array_equal(
+        calendar.date_range('2025-07-03', '2025-07-08', Country.US),
+        np.array(['2025-07-03', '2025-07-07', '2025-07-08'], dtype='datetime64[D]')
+    )
+    assert calendar.date_range('2025-07-05', '2025-07-06', Country.US).size == 0
+
+
+def test_from_extracts():
+    extracts = [
+        CalendarExtract(country='usa', exclude_date='2025-07-04'),
+        CalendarExtract(country='global', exclude_date='2025-12-25'),
+        CalendarExtract(country='italy', exclude_date='2025-08-15'),
+    ]
+    calendar = BusinessCalendar.from_extracts(extracts)
+    assert set(calendar.countries) == {Country.US, Country.ALL}
+    assert not calendar.is_business_day('2025-07-04', Country.US)
+    assert calendar.is_business_day('2025-07-04', Country.GB)
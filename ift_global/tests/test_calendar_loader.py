@@ -0,0 +1,86 @@
+import os
+
+import numpy as np
+import pytest
+
+from ift_global.benchmarks.fake_s3 import InMemoryS3Client, in_memory_repo
+from ift_global.business_date import calendar_loader
+from ift_global.business_date.calendar_exclusions import Country
+from ift_global.business_date.calendar_loader import clear_calendar_cache, load_calendar, parse_calendar
+
+CALENDAR_CSV = (
+    'country,exclude_date\n'
+    'usa,2025-07-04\n'
+    'US,2025-11-27\n'
+    'england,2025-08-25\n'
+    'global,2025-12-25\n'
+    'italy,2025-08-15\n'
+)
+
+
+@pytest.fixture
+def calendar_file(tmp_path):
+    clear_calendar_cache()
+    calendar_path = tmp_path / 'calendar.csv'
+    calendar_path.write_text(CALENDAR_CSV)
+    return str(calendar_path)
+
+
+def test_parse_calendar(caplog):
+    calendar = parse_calendar(CALENDAR_CSV.encode())
+    assert set(calendar.countries) == {Country.US, Country.GB, Country.ALL}
+    np.testing.assert_array_equal(
+        calendar.holidays(Country.US), np.array(['2025-07-04', '2025-11-27', '2025-12-25'], dtype='datetime64[D]')
+    )
+    assert [x.levelname for x in caplog.records] == ['WARNING']
+    assert 'italy' in caplog.records[0].getMessage()
+
+
+def test_parse_calendar_invalid():
+    with pytest.raises(ValueError):
+        parse_calendar(b'country\nusa\n')
+    with pytest.raises(ValueError):
+        parse_calendar(b'country,exclude_date\nusa,07/04/2025\n')
+
+
+def test_load_calendar_local_cache(calendar_file, mocker):
+    parse_spy = mocker.spy(calendar_loader, 'parse_calendar')
+    first = load_calendar(calendar_file)
+    assert load_calendar(calendar_file) is first
+    assert parse_spy.call_count == 1
+    with open(calendar_file, 'a') as f:
+        f.write('japan,2025-01-13\n')
+    os.utime(calendar_file, ns=(os.stat(calendar_file).st_mtime_ns + 10 ** 9,) * 2)
+    reloaded = load_calendar(calendar_file)
+    assert reloaded is not first
+    assert not reloaded.is_business_day('2025-01-13', Country.JP)
+
+
+def test_load_calendar_repo_etag_cache(mocker):
+    clear_calendar_cache()
+    client = InMemoryS3Client('reference')
+    client.put_object(Bucket='reference', Key='calendars/calendar.csv', Body=CALENDAR_CSV)
+    repo = in_memory_repo(client)
+    parse_spy = mocker.spy(calendar_loader, 'parse_calendar')
+    first = load_calendar('/reference/calendars/calendar.csv', repo=repo)
+    assert load_calendar('/reference/calendars/calendar.csv', repo=repo) is first
+    assert parse_spy.call_count == 1
+    assert client.requests['get_object'] == 1
+    client.put_object(Bucket='reference', Key='calendars/calendar.csv', Body=CALENDAR_CSV + 'japan,2025-01-13\n')
+    assert load_calendar('/reference/calendars/calendar.csv', repo=repo) is not first
+
+
+def test_load_calendar_missing_file(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        load_calendar(str(tmp_path / 'missing.csv'))
+
+
+def test_union_calendar(calendar_file):
+    calendar = load_calendar(calendar_file)
+    cross_border = (Country.US, Country.GB)
+    np.testing.assert_array_equal(
+        calendar.holidays(cross_border),
+        np.array(['2025-07-04', '2025-08-25', '2025-11-27', '2025-12-25'], dtype='datetime64[D]')
+    )
+    assert calendar.busdaycalendar(['GB', 'US']) is calendar.busdaycalendar(cross_border)
+    assert calendar.add_business_days('2025-08-22', 1, cross_border) == np.datetime64('2025-08-26')
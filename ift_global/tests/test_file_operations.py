@@ -0,0 +1,71 @@
+import pickle
+
+import pytest
+
+from ift_global.utils.file_operations import ObjectPath, check_path
+
+
+@pytest.mark.parametrize('path', [
+    '/test-bucket/data/2024/a.csv',
+    'test-bucket/data/2024/a.csv',
+    's3://test-bucket/data/2024/a.csv',
+    'data/2024/a.csv',
+])
+def test_parse_forms(path):
+    object_path = ObjectPath.parse(path, 'test-bucket')
+    assert object_path == ObjectPath('test-bucket', 'data/2024/a.csv')
+    assert object_path.key == check_path(path, 'test-bucket', path_with_file=True)
+
+
+def test_parse_bucket_from_path():
+    object_path = ObjectPath.parse('/test-bucket/data/')
+    assert (object_path.bucket, object_path.key) == ('test-bucket', 'data/')
+    with pytest.raises(ValueError):
+        ObjectPath.parse('/')
+
+
+def test_parse_is_cached():
+    assert ObjectPath.parse('/test-bucket/data/a.csv') is ObjectPath.parse('/test-bucket/data/a.csv')
+
+
+def test_parse_object_path_other_bucket():
+    with pytest.raises(ValueError):
+        ObjectPath.parse(ObjectPath('other-bucket', 'a.csv'), 'test-bucket')
+
+
+def test_components():
+    object_path = ObjectPath.parse('/test-bucket/data/2024/trades.tar.gz')
+    assert object_path.name == 'trades.tar.gz'
+    assert object_path.suffix == '.gz'
+    assert object_path.stem == 'trades.tar'
+    assert object_path.prefix == 'data/2024/'
+    assert object_path.parent == ObjectPath('test-bucket', 'data/2024/')
+    assert not object_path.is_dir
+    assert str(object_path) == '/test-bucket/data/2024/trades.tar.gz'
+
+
+def test_directory_and_root():
+    directory = ObjectPath.parse('/test-bucket/data/2024/')
+    assert directory.is_dir and directory.name == '2024' and directory.suffix == ''
+    assert directory.prefix == 'data/2024/'
+    root = ObjectPath.parse('/test-bucket/')
+    assert root.key == '' and root.is_dir and root.parent == root
+    assert ObjectPath.parse('/test-bucket/data').as_dir().key == 'data/'
+
+
+def test_join_and_relative_to():
+    base = ObjectPath.parse('/test-bucket/data')
+    assert (base / '2024' / 'a.csv').key == 'data/2024/a.csv'
+    assert (base / '/2024/').key == 'data/2024/'
+    assert (base / '2024' / 'a.csv').relative_to(base) == '2024/a.csv'
+    with pytest.raises(ValueError):
+        base.relative_to('archive/')
+
+
+def test_immutable_hashable_picklable():
+    object_path = ObjectPath('test-bucket', 'data/a.csv')
+    with pytest.raises(AttributeError):
+        object_path.key = 'other.csv'
+    assert {object_path: 1}[ObjectPath('test-bucket', 'data/a.csv')] == 1
+    assert pickle.loads(pickle.dumps(object_path)) == object_path
+    assert not hasattr(object_path, '__dict__')
@@ -16,6 +16,7 @@ from ift_global.connectors.file_serialiser import (
     serialise_parquet,
     serialise_avro,
     deserialise_avro,
+    deserialise_parquet,
 )
 
 @pytest.fixture
@@ -88,6 +89,20 @@ def test_serialise_parquet_dataframe():
         'z': [True, False, True]
     }
 
+def test_deserialise_parquet_dataframe_round_trip():
+    input_data = pd.DataFrame({
+        'x': [1, 2, 3],
+        'y': [0.5, 1.5, 2.5],
+    })
+    result = deserialise_parquet(io.BytesIO(serialise_parquet(input_data)))
+    pd.testing.assert_frame_equal(result, input_data)
+
+def test_deserialise_parquet_arrow_dtypes():
+    input_data = pd.DataFrame({'x': [1, 2, 3]})
+    result = deserialise_parquet(io.BytesIO(serialise_parquet(input_data)), dtype_backend='pyarrow')
+    assert isinstance(result['x'].dtype, pd.ArrowDtype)
+    assert result['x'].tolist() == [1, 2, 3]
+
 @pytest.fixture
 def sample_schema():
     return avro.schema.parse(json.dumps({
@@ -0,0 +1,36 @@
+import subprocess
+import sys
+
+import pytest
+
+from ift_global.benchmarks.import_time import BUDGET_STATEMENTS, check_import_budget, import_profile
+
+
+@pytest.mark.parametrize('statement', BUDGET_STATEMENTS)
+def test_statement_does_not_load_heavy_modules(statement):
+    assert import_profile(statement)['heavy_modules'] == []
+
+
+def test_lazy_attributes_resolve():
+    code = (
+        'import sys, ift_global\n'
+        'assert "pandas" not in sys.modules\n'
+        'from ift_global import MinioFileSystemRepo\n'
+        'from ift_global.connectors.minio_fileops import MinioFileSystemRepo as repo\n'
+        'assert MinioFileSystemRepo is repo\n'
+        'assert "MinioFileSystemRepo" in dir(ift_global)\n'
+    )
+    subprocess.run([sys.executable, '-c', code], check=True)
+
+
+def test_unknown_attribute_raises():
+    import ift_global
+    with pytest.raises(AttributeError):
+        ift_global.NotAnAttribute
+
+
+def test_check_import_budget_flags_slow_statement():
+    results = check_import_budget(statements=('import ift_global',), budget_seconds=0.0)
+    assert results[0]['within_budget'] is False
+    results = check_import_budget(statements=('import ift_global',))
+    assert results[0]['within_budget'] is True
@@ -0,0 +1,82 @@
+import pytest
+
+from ift_global.connectors.listing_cache import ListingCache
+
+
+@pytest.fixture
+def cache():
+    cache = ListingCache(ttl=60)
+    cache.load('data/', [
+        {'Key': 'data/a.csv', 'Size': 1},
+        {'Key': 'data/2024/b.csv', 'Size': 2},
+        {'Key': 'data/2024/01/c.csv', 'Size': 3},
+        {'Key': 'data/2023/d.csv', 'Size': 4},
+    ])
+    return cache
+
+
+def test_list_level(cache):
+    assert cache.list_level('data/') == {
+        'Contents': [{'Key': 'data/a.csv', 'Size': 1}],
+        'CommonPrefixes': [{'Prefix': 'data/2023/'}, {'Prefix': 'data/2024/'}],
+    }
+    assert cache.list_level('data/2024/') == {
+        'Contents': [{'Key': 'data/2024/b.csv', 'Size': 2}],
+        'CommonPrefixes': [{'Prefix': 'data/2024/01/'}],
+    }
+
+
+def test_list_level_unknown_prefix(cache):
+    assert cache.list_level('data/2025/') == {'Contents': [], 'CommonPrefixes': []}
+
+
+def test_covering_prefix(cache):
+    assert cache.covering_prefix('data/2024/01/') == 'data/'
+    assert cache.covering_prefix('other/') is None
+    assert cache.prefixes == ['data/']
+
+
+def test_last_key(cache):
+    assert cache.last_key('data/') == 'data/a.csv'
+
+
+def test_is_fresh(cache):
+    assert cache.is_fresh('data/')
+    assert not cache.is_fresh('other/')
+    expired = ListingCache(ttl=0)
+    expired.load('data/', [])
+    assert not expired.is_fresh('data/')
+
+
+def test_incremental_load(cache):
+    cache.load('data/', [{'Key': 'data/b.csv', 'Size': 5}], full=False)
+    assert [x['Key'] for x in cache.list_level('data/')['Contents']] == ['data/a.csv', 'data/b.csv']
+    assert cache.last_key('data/') == 'data/b.csv'
+
+
+def test_full_load_replaces_content(cache):
+    cache.load('data/', [{'Key': 'data/z.csv', 'Size': 5}])
+    assert cache.list_level('data/') == {'Contents': [{'Key': 'data/z.csv', 'Size': 5}], 'CommonPrefixes': []}
+
+
+def test_add_only_under_loaded_prefix(cache):
+    cache.add({'Key': 'data/2025/e.csv', 'Size': 6})
+    cache.add({'Key': 'other/f.csv', 'Size': 7})
+    assert {'Prefix': 'data/2025/'} in cache.list_level('data/')['CommonPrefixes']
+    assert cache.list_level('other/') == {'Contents': [], 'CommonPrefixes': []}
+
+
+def test_discard_prunes_empty_dirs(cache):
+    cache.discard('data/2024/01/c.csv')
+    assert cache.list_level('data/2024/')['CommonPrefixes'] == []
+    cache.discard('data/2023/d.csv')
+    assert cache.list_level('data/')['CommonPrefixes'] == [{'Prefix': 'data/2024/'}]
+    cache.discard('missing/key.csv')
+
+
+def test_invalidate(cache):
+    cache.invalidate('data/')
+    assert cache.covering_prefix('data/') is None
+    cache.load('data/', [])
+    cache.invalidate()
+    assert cache.prefixes == []
@@ -1,7 +1,26 @@
 import pytest
 import logging
 import datetime
-from ift_global.utils.logger import IFTLogger
+import gzip
+import inspect
+import json
+import logging.handlers
+import sys
+import threading
+import time
+from ift_global.benchmarks.fake_s3 import InMemoryS3Client, in_memory_repo
+from ift_global.utils.logger import (
+    BatchUploadHandler,
+    CallSiteRateLimiter,
+    FileOptions,
+    GzipRotatingFileHandler,
+    IFTLogger,
+    JsonFormatter,
+    QueueOptions,
+    RateLimitOptions,
+    RemoteOptions,
+    _json_dumps,
+)
 
 
 test_logger = IFTLogger(app_name='IFT_LOGGER', service_name='logger_info', log_level='info')
@@ -74,4 +93,384 @@ def test_IFT_logger_get_log_level():
     assert logger._get_log_level() == logging.ERROR
 
     logger = IFTLogger(app_name='test_app', service_name='test_service', log_level='critical')
-    assert logger._get_log_level() == logging.CRITICAL
\ No newline at end of file
+    assert logger._get_log_level() == logging.CRITICAL
+
+def test_async_logger_writes_on_close(tmp_path):
+    logger = IFTLogger(app_name='async_app', service_name='pricing', log_path=str(tmp_path),
+                       write_file=True, async_mode=True)
+    assert isinstance(logger.logger.handlers[-1], logging.handlers.QueueHandler)
+    for i in range(10):
+        logger.logger.info('priced %s', i)
+    logger.close()
+    lines = (tmp_path / 'async_app.log').read_text().splitlines()
+    assert len([x for x in lines if 'priced' in x]) == 10
+    assert lines[-1].endswith('priced 9')
+    assert logger.dropped_messages == 0
+
+
+def test_async_logger_drop_policy_counts_dropped(tmp_path):
+    logger = IFTLogger(app_name='drop_app', service_name='pricing', log_path=str(tmp_path),
+                       write_file=True, async_mode=True,
+                       queue_options=QueueOptions(size=1, policy='drop'))
+    release = threading.Event()
+    slow_handler = logging.Handler()
+    slow_handler.emit = lambda record: release.wait(5)
+    logger._listener.handlers = (slow_handler, *logger._listener.handlers)
+    for i in range(50):
+        logger.logger.info('message %s', i)
+    assert logger.dropped_messages > 0
+    release.set()
+    logger.close()
+    assert 'log messages dropped' in (tmp_path / 'drop_app.log').read_text()
+
+
+def test_async_logger_block_policy_keeps_all(tmp_path):
+    with IFTLogger(app_name='block_app', service_name='pricing', log_path=str(tmp_path),
+                   write_file=True, async_mode=True,
+                   queue_options=QueueOptions(size=2, policy='block')) as logger:
+        for i in range(200):
+            logger.logger.info('message %s', i)
+    assert logger.dropped_messages == 0
+    lines = [x for log_file in tmp_path.glob('block_app.log*') for x in log_file.read_text().splitlines()]
+    assert len([x for x in lines if 'message' in x]) == 200
+
+
+def test_async_logger_close_keeps_shared_queue(tmp_path):
+    first = IFTLogger(app_name='sibling_app', service_name='pricing', log_path=str(tmp_path),
+                      write_file=True, async_mode=True)
+    second = IFTLogger(app_name='sibling_app', service_name='pricing', log_path=str(tmp_path),
+                       write_file=True, async_mode=True, log_level='info')
+    assert first._queue_handler is second._queue_handler
+    first.info('before close')
+    first.close()
+    assert 'before close' in (tmp_path / 'sibling_app.log').read_text()
+    assert second._listener._thread is not None
+    second.info('after sibling closed')
+    second.close()
+    assert second._queue_handler is None
+    assert 'after sibling closed' in (tmp_path / 'sibling_app.log').read_text()
+
+
+def test_async_logger_writes_after_close(tmp_path):
+    logger = IFTLogger(app_name='closed_app', service_name='pricing', log_path=str(tmp_path),
+                       write_file=True, async_mode=True)
+    logger.info('before close')
+    logger.close()
+    assert logger._queue_handler is None
+    logger.info('after close')
+    logger.warning('warning after close')
+    logger.close()
+    text = (tmp_path / 'closed_app.log').read_text()
+    assert 'after close' in text and 'warning after close' in text
+    assert len(text.splitlines()) == 3
+
+
+def test_async_logger_updates_listener_sinks(tmp_path):
+    console_only = IFTLogger(app_name='sinks_app', service_name='pricing', async_mode=True)
+    with IFTLogger(app_name='sinks_app', service_name='pricing', log_path=str(tmp_path),
+                   write_file=True, async_mode=True) as file_logger:
+        file_logger.info('written to file')
+    console_only.close()
+    assert 'written to file' in (tmp_path / 'sinks_app.log').read_text()
+
+
+def test_async_logger_invalid_policy():
+    with pytest.raises(ValueError):
+        IFTLogger(app_name='test_app', service_name='test_service', async_mode=True,
+                  queue_options=QueueOptions(policy='wait'))
+
+
+def test_logger_records_caller_file_and_line(caplog):
+    logger = IFTLogger(app_name='caller_app', service_name='test_service', log_level='debug')
+    logger.logger.addHandler(caplog.handler)
+    expected_line = inspect.currentframe().f_lineno + 1
+    logger.info('priced %s trades', 3)
+    record = caplog.records[-1]
+    assert record.filename == 'test_logger.py'
+    assert record.lineno == expected_line
+    assert record.getMessage() == 'priced 3 trades'
+    assert 'test_logger.py | line: ' in logger.logger.handlers[0].format(record)
+
+
+def test_logger_disabled_level_is_not_formatted():
+    class Expensive:
+        def __str__(self):
+            raise AssertionError('message built for a disabled level')
+
+    logger = IFTLogger(app_name='lazy_app', service_name='test_service', log_level='warning')
+    logger.debug('state %s', Expensive())
+    logger.info('state %s', Expensive())
+
+
+def test_logger_instances_share_handlers(tmp_path):
+    loggers = [
+        IFTLogger(app_name='shared_app', service_name='pricing', log_path=str(tmp_path), write_file=True)
+        for _ in range(5)
+    ]
+    assert loggers[0].logger is loggers[-1].logger
+    assert loggers[0].logger.name == 'ift_global.utils.logger.shared_app.pricing'
+    assert len(loggers[0].logger.handlers) == 2
+    loggers[2].info('priced book')
+    lines = (tmp_path / 'shared_app.log').read_text().splitlines()
+    assert len([x for x in lines if 'priced book' in x]) == 1
+
+
+def test_logger_instances_with_other_options_replace_handlers(tmp_path):
+    text_logger = IFTLogger(app_name='options_app', service_name='pricing', log_path=str(tmp_path),
+                            write_file=True)
+    text_logger.info('text line')
+    old_file_handler = text_logger.logger.handlers[-1]
+    json_logger = IFTLogger(app_name='options_app', service_name='pricing', log_path=str(tmp_path),
+                            write_file=True, log_format='json',
+                            file_options=FileOptions(max_bytes=1024, buffer_capacity=10))
+    assert len(json_logger.logger.handlers) == 2
+    assert old_file_handler not in json_logger.logger.handlers
+    assert old_file_handler.stream is None
+    assert isinstance(json_logger.logger.handlers[0].formatter, JsonFormatter)
+    buffer_handler = json_logger.logger.handlers[-1]
+    assert isinstance(buffer_handler, logging.handlers.MemoryHandler)
+    assert buffer_handler.target.maxBytes == 1024
+    json_logger.info('json line')
+    json_logger.close()
+    lines = (tmp_path / 'options_app.log').read_text().splitlines()
+    assert lines[0].endswith('text line')
+    assert json.loads(lines[-1])['message'] == 'json line'
+
+
+def test_async_logger_queue_size_change(tmp_path):
+    first = IFTLogger(app_name='resize_app', service_name='pricing', log_path=str(tmp_path),
+                      write_file=True, async_mode=True,
+                      queue_options=QueueOptions(size=10))
+    first.info('small queue')
+    second = IFTLogger(app_name='resize_app', service_name='pricing', log_path=str(tmp_path),
+                       write_file=True, async_mode=True,
+                       queue_options=QueueOptions(size=100, policy='block'))
+    assert first._queue_handler is second._queue_handler
+    assert second._queue_handler.queue.maxsize == 100
+    assert second._queue_handler.policy == 'block'
+    assert len(second.logger.handlers) == 1
+    second.info('large queue')
+    first.close()
+    second.close()
+    log_text = (tmp_path / 'resize_app.log').read_text()
+    assert 'small queue' in log_text and 'large queue' in log_text
+
+
+def test_logger_services_use_child_loggers():
+    pricing = IFTLogger(app_name='child_app', service_name='pricing')
+    risk = IFTLogger(app_name='child_app', service_name='risk')
+    assert pricing.logger is not risk.logger
+    assert pricing.logger.parent is risk.logger.parent
+
+
+def test_logger_default_rotation_size(tmp_path):
+    logger = IFTLogger(app_name='size_app', service_name='eod', log_path=str(tmp_path), write_file=True)
+    file_handler = logger.logger.handlers[-1]
+    assert isinstance(file_handler, logging.handlers.RotatingFileHandler)
+    assert file_handler.maxBytes == 10 * 1024 * 1024
+
+
+def test_logger_time_rotation(tmp_path):
+    logger = IFTLogger(app_name='time_app', service_name='eod', log_path=str(tmp_path), write_file=True,
+                       file_options=FileOptions(rotation='time', rotation_when='H', backup_count=24))
+    file_handler = logger.logger.handlers[-1]
+    assert isinstance(file_handler, logging.handlers.TimedRotatingFileHandler)
+    assert file_handler.when == 'H'
+    assert file_handler.backupCount == 24
+
+
+def test_logger_invalid_rotation():
+    with pytest.raises(ValueError):
+        IFTLogger(app_name='test_app', service_name='test_service', file_options=FileOptions(rotation='daily'))
+
+
+def test_logger_buffered_file_flushes_on_error(tmp_path):
+    logger = IFTLogger(app_name='buffer_app', service_name='eod', log_path=str(tmp_path), write_file=True,
+                       file_options=FileOptions(buffer_capacity=100))
+    assert isinstance(logger.logger.handlers[-1], logging.handlers.MemoryHandler)
+    log_file = tmp_path / 'buffer_app.log'
+    logger.info('position loaded')
+    assert 'position loaded' not in log_file.read_text()
+    logger.error('position rejected')
+    content = log_file.read_text()
+    assert 'position loaded' in content and 'position rejected' in content
+
+
+def test_logger_compresses_rotated_files(tmp_path):
+    logger = IFTLogger(app_name='gzip_app', service_name='eod', log_path=str(tmp_path), write_file=True,
+                       file_options=FileOptions(max_bytes=500, compress_rotated=True))
+    file_handler = logger.logger.handlers[-1]
+    assert isinstance(file_handler, GzipRotatingFileHandler)
+    for i in range(20):
+        logger.info('trade %s booked', i)
+    file_handler.wait_compression()
+    rotated = sorted(tmp_path.glob('gzip_app.log.*'))
+    assert rotated and all(x.suffix == '.gz' for x in rotated)
+    lines = [x for log_file in rotated for x in gzip.decompress(log_file.read_bytes()).decode().splitlines()]
+    lines += (tmp_path / 'gzip_app.log').read_text().splitlines()
+    assert len([x for x in lines if 'booked' in x]) == 20
+
+
+def test_logger_json_lines(tmp_path):
+    logger = IFTLogger(app_name='json_app', service_name='pricing', log_path=str(tmp_path), write_file=True,
+                       log_format='json')
+    assert isinstance(logger.logger.handlers[0].formatter, JsonFormatter)
+    expected_line = inspect.currentframe().f_lineno + 1
+    logger.info('priced %s trades', 3, extra={'book': 'rates', 'pv': 1.5})
+    log_line = json.loads((tmp_path / 'json_app.log').read_text().splitlines()[-1])
+    assert log_line['app'] == 'json_app'
+    assert log_line['service'] == 'pricing'
+    assert log_line['level'] == 'INFO'
+    assert log_line['file'] == 'test_logger.py'
+    assert log_line['line'] == expected_line
+    assert log_line['message'] == 'priced 3 trades'
+    assert log_line['book'] == 'rates'
+    assert log_line['pv'] == 1.5
+    assert 'timestamp' in log_line
+
+
+def test_logger_json_exception():
+    formatter = JsonFormatter('json_app', 'pricing')
+    try:
+        raise ValueError('bad trade')
+    except ValueError:
+        record = logging.LogRecord('json', logging.ERROR, __file__, 1, 'failed', None, sys.exc_info())
+    log_line = json.loads(formatter.format(record))
+    assert 'ValueError: bad trade' in log_line['exception']
+
+
+def test_json_dumps_without_orjson(monkeypatch):
+    monkeypatch.setitem(sys.modules, 'orjson', None)
+    _json_dumps.cache_clear()
+    try:
+        assert json.loads(_json_dumps()({'a': datetime.date(2025, 1, 31)})) == {'a': '2025-01-31'}
+    finally:
+        _json_dumps.cache_clear()
+
+
+def test_logger_invalid_log_format():
+    with pytest.raises(ValueError):
+        IFTLogger(app_name='test_app', service_name='test_service', log_format='xml')
+
+
+def _uploaded_lines(client):
+    keys = [x['Key'] for x in client._entries('logs/')]
+    return keys, [json.loads(x) for key in keys for x in gzip.decompress(client._get(key)).splitlines()]
+
+
+def test_logger_ships_batches_to_repo():
+    client = InMemoryS3Client('logs-bucket')
+    repo = in_memory_repo(client)
+    logger = IFTLogger(app_name='remote_app', service_name='worker', remote_options=RemoteOptions(repo))
+    remote_handler = logger.logger.handlers[-1]
+    assert isinstance(remote_handler, BatchUploadHandler)
+    assert remote_handler.prefix == '/logs-bucket/logs/remote_app/worker'
+    for i in range(5):
+        logger.info('trade %s priced', i, extra={'trade_id': i})
+    assert client.requests.get('put_object', 0) == 0
+    logger.close()
+    keys, lines = _uploaded_lines(client)
+    assert len(keys) == 1
+    assert keys[0].startswith('logs/remote_app/worker/') and keys[0].endswith('.jsonl.gz')
+    assert [x['trade_id'] for x in lines] == list(range(5))
+    remote_handler.close()
+
+
+def test_batch_upload_handler_flushes_on_size():
+    client = InMemoryS3Client('logs-bucket')
+    handler = BatchUploadHandler(in_memory_repo(client), '/logs-bucket/logs/size', batch_bytes=200,
+                                 flush_interval=60)
+    handler.setFormatter(JsonFormatter('remote_app', 'worker'))
+    for i in range(10):
+        handler.handle(logging.makeLogRecord({'msg': f'message {i}', 'levelname': 'INFO'}))
+    for _ in range(100):
+        if client.requests.get('put_object'):
+            break
+        threading.Event().wait(0.01)
+    assert client.requests.get('put_object', 0) >= 1
+    handler.close()
+    _, lines = _uploaded_lines(client)
+    assert [x['message'] for x in lines] == [f'message {i}' for i in range(10)]
+
+
+def test_batch_upload_handler_bounded_buffer(mocker):
+    repo = mocker.MagicMock()
+    handler = BatchUploadHandler(repo, '/logs-bucket/logs/bounded', batch_bytes=10 ** 6,
+                                 max_buffer_bytes=10 ** 6, flush_interval=60)
+    handler.max_buffer_bytes = 100
+    for i in range(20):
+        handler.handle(logging.makeLogRecord({'msg': f'message {i}'}))
+    assert handler.dropped > 0
+    repo.put_object.side_effect = RuntimeError('endpoint down')
+    handler.close()
+    assert handler.failed_batches == 1
+    assert handler.dropped == 20
+
+
+def test_logger_rate_limit_per_call_site(caplog):
+    logger = IFTLogger(app_name='storm_app', service_name='ticks',
+                       rate_limit_options=RateLimitOptions(max_per_second=5))
+    logger.logger.addHandler(caplog.handler)
+    for i in range(100):
+        logger.warning('stale tick %s', i)
+    for i in range(3):
+        logger.warning('other site %s', i)
+    messages = [x.getMessage() for x in caplog.records]
+    assert len([x for x in messages if x.startswith('stale tick')]) == 5
+    assert len([x for x in messages if x.startswith('other site')]) == 3
+    logger.close()
+    summary = caplog.records[-1]
+    assert summary.getMessage().startswith('suppressed 95 WARNING messages')
+    assert summary.filename == 'test_logger.py'
+
+
+def test_logger_periodic_suppressed_summary(caplog):
+    logger = IFTLogger(app_name='summary_app', service_name='ticks',
+                       rate_limit_options=RateLimitOptions(max_per_second=1, summary_interval=0))
+    logger.logger.addHandler(caplog.handler)
+    for i in range(3):
+        logger.info('tick %s', i)
+    logger.close()
+    messages = [x.getMessage() for x in caplog.records]
+    assert messages[0] == 'tick 0'
+    assert messages[1].startswith('suppressed 1 INFO messages')
+
+
+def test_logger_summary_after_storm_stops(caplog):
+    logger = IFTLogger(app_name='quiet_app', service_name='ticks',
+                       rate_limit_options=RateLimitOptions(max_per_second=1, summary_interval=0.05))
+    logger.logger.addHandler(caplog.handler)
+    for i in range(10):
+        logger.warning('tick %s', i)
+    deadline = time.monotonic() + 5
+    while len(caplog.records) < 2 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert caplog.records[-1].getMessage().startswith('suppressed 9 WARNING messages')
+    logger.close()
+
+
+def test_logger_rate_limit_deep_stacklevel(caplog):
+    logger = IFTLogger(app_name='deep_app', service_name='ticks',
+                       rate_limit_options=RateLimitOptions(max_per_second=1))
+    logger.logger.addHandler(caplog.handler)
+    for i in range(3):
+        logger.info('tick %s', i, stacklevel=10000)
+    assert [x.getMessage() for x in caplog.records] == ['tick 0', 'tick 1', 'tick 2']
+
+
+def test_logger_sampling(caplog, monkeypatch):
+    draws = iter([0.1, 0.9, 0.2, 0.8])
+    monkeypatch.setattr('ift_global.utils.logger.random.random', lambda: next(draws))
+    logger = IFTLogger(app_name='sample_app', service_name='ticks',
+                       rate_limit_options=RateLimitOptions(sample_rate=0.5))
+    logger.logger.addHandler(caplog.handler)
+    for i in range(4):
+        logger.info('tick %s', i)
+    assert [x.getMessage() for x in caplog.records] == ['tick 0', 'tick 2']
+
+
+def test_rate_limiter_invalid_sample_rate():
+    with pytest.raises(ValueError):
+        CallSiteRateLimiter(sample_rate=0)
+    with pytest.raises(ValueError):
+        RateLimitOptions(sample_rate=1.5)
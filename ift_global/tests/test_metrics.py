@@ -0,0 +1,97 @@
+import io
+import json
+import pickle
+from unittest.mock import patch
+
+import pytest
+
+from ift_global.connectors.metrics import InMemoryCollector, MetricsCollector, retry_attempts
+from ift_global.connectors.minio_fileops import MinioFileSystemRepo
+from ift_global.credentials.minio_cr import MinioVariablesEnv
+
+
+@pytest.fixture
+def mock_boto3_client(monkeypatch):
+    monkeypatch.setenv(MinioVariablesEnv.user.value, "testuser")
+    monkeypatch.setenv(MinioVariablesEnv.password.value, "envpass")
+    monkeypatch.setenv(MinioVariablesEnv.url.value, "http://env.minio.com")
+    with patch('boto3.client') as mock:
+        mock.return_value.list_buckets.return_value = {
+            'ResponseMetadata': {'HTTPStatusCode': 200},
+            'Buckets': [{'Name': 'test-bucket'}]
+        }
+        yield mock
+
+
+def test_retry_attempts():
+    assert retry_attempts({'ResponseMetadata': {'RetryAttempts': 2}}) == 2
+    assert retry_attempts({}) == 0
+    assert retry_attempts(None) == 0
+
+
+def test_base_collector_is_noop():
+    collector = MetricsCollector()
+    with collector.measure('get') as record:
+        record.bytes_in = 10
+
+
+def test_in_memory_collector_aggregates():
+    collector = InMemoryCollector(buckets=(0.1, 1.0))
+    collector.record('get', 0.05, bytes_in=100, retries=1)
+    collector.record('get', 0.5, bytes_in=50)
+    collector.record('get', 5.0, error=True)
+    stats = collector.snapshot()['get']
+    assert stats['count'] == 3
+    assert stats['errors'] == 1
+    assert stats['retries'] == 1
+    assert stats['bytes_in'] == 150
+    assert stats['latency_buckets'] == {'0.1': 1, '1.0': 2, '+Inf': 3}
+    assert stats['latency_sum'] == pytest.approx(5.55)
+
+
+def test_measure_records_errors():
+    collector = InMemoryCollector()
+    with pytest.raises(RuntimeError):
+        with collector.measure('put') as record:
+            record.bytes_out = 10
+            raise RuntimeError('failed')
+    stats = collector.snapshot()['put']
+    assert stats['errors'] == 1
+    assert stats['bytes_out'] == 10
+
+
+def test_to_json_and_reset():
+    collector = InMemoryCollector()
+    collector.record('list', 0.01)
+    assert json.loads(collector.to_json())['list']['count'] == 1
+    collector.reset()
+    assert collector.snapshot() == {}
+
+
+def test_to_prometheus():
+    collector = InMemoryCollector(buckets=(0.1,))
+    collector.record('get', 0.05, bytes_in=100)
+    text = collector.to_prometheus()
+    assert '# TYPE ift_minio_operation_latency_seconds histogram' in text
+    assert 'ift_minio_operation_latency_seconds_bucket{operation="get",le="0.1"} 1' in text
+    assert 'ift_minio_operation_latency_seconds_bucket{operation="get",le="+Inf"} 1' in text
+    assert 'ift_minio_operation_latency_seconds_count{operation="get"} 1' in text
+    assert 'ift_minio_operation_bytes_in_total{operation="get"} 100' in text
+
+
+def test_repo_records_network_and_serialisation_separately(mock_boto3_client):
+    payload = pickle.dumps([1, 2, 3])
+    client = mock_boto3_client.return_value
+    client.list_objects.return_value = {'Contents': [{'Key': 'data/file.pickle', 'Size': len(payload)}]}
+    client.get_object.return_value = {'Body': io.BytesIO(payload), 'ResponseMetadata': {'RetryAttempts': 1}}
+    client.put_object.return_value = {}
+    collector = InMemoryCollector()
+    repo = MinioFileSystemRepo('test-bucket', metrics=collector)
+    repo.read_file('/test-bucket/data/file.pickle', 'pickle')
+    repo.write_file('/test-bucket/data/out.pickle', [1, 2, 3], 'pickle')
+    stats = collector.snapshot()
+    assert stats['list']['count'] == 1
+    assert stats['get']['bytes_in'] == len(payload)
+    assert stats['get']['retries'] == 1
+    assert stats['deserialise']['count'] == 1
+    assert stats['serialise']['bytes_out'] == stats['put']['bytes_out'] > 0
@@ -0,0 +1,171 @@
+import io
+import os
+import re
+import zipfile
+from unittest.mock import patch
+
+import pandas as pd
+import pytest
+
+from ift_global.benchmarks.fake_s3 import InMemoryS3Client, in_memory_repo
+from ift_global.connectors.file_serialiser import serialise_parquet
+from ift_global.connectors.minio_file import MinioObjectReader
+from ift_global.connectors.minio_fileops import MinioFileSystemRepo
+from ift_global.connectors.minio_transfer import ObjectSizeChangedError
+from ift_global.credentials.minio_cr import MinioVariablesEnv
+
+
+def _ranged_get(payload):
+    """Build a get_object side effect serving byte ranges of payload."""
+    def _get_object(Bucket, Key, Range=None, IfMatch=None):
+        if Range is None:
+            return {'Body': io.BytesIO(payload)}
+        first_byte, last_byte = map(int, re.match(r'bytes=(\d+)-(\d+)', Range).groups())
+        return {'Body': io.BytesIO(payload[first_byte:last_byte + 1])}
+    return _get_object
+
+
+@pytest.fixture
+def mock_boto3_client(monkeypatch):
+    monkeypatch.setenv(MinioVariablesEnv.user.value, "testuser")
+    monkeypatch.setenv(MinioVariablesEnv.password.value, "envpass")
+    monkeypatch.setenv(MinioVariablesEnv.url.value, "http://env.minio.com")
+    with patch('boto3.client') as mock:
+        mock.return_value.list_buckets.return_value = {
+            'ResponseMetadata': {'HTTPStatusCode': 200},
+            'Buckets': [{'Name': 'test-bucket'}]
+        }
+        yield mock
+
+
+@pytest.fixture
+def payload():
+    return os.urandom(10_000)
+
+
+def test_reader_sequential_read(mocker, payload):
+    client = mocker.MagicMock()
+    client.get_object.side_effect = _ranged_get(payload)
+    with MinioObjectReader(client, 'test-bucket', 'key.bin', size=len(payload), block_size=1024) as raw:
+        assert raw.read() == payload
+        assert raw.read() == b''
+
+
+def test_reader_seek_and_tell(mocker, payload):
+    client = mocker.MagicMock()
+    client.get_object.side_effect = _ranged_get(payload)
+    raw = MinioObjectReader(client, 'test-bucket', 'key.bin', size=len(payload), block_size=1024, read_ahead=0)
+    assert raw.seek(-100, io.SEEK_END) == len(payload) - 100
+    assert raw.read(100) == payload[-100:]
+    assert raw.tell() == len(payload)
+    raw.seek(1000)
+    raw.seek(50, io.SEEK_CUR)
+    assert raw.read(100) == payload[1050:1150]
+    with pytest.raises(ValueError):
+        raw.seek(-1)
+
+
+def test_reader_fetches_only_touched_blocks(mocker, payload):
+    client = mocker.MagicMock()
+    client.get_object.side_effect = _ranged_get(payload)
+    raw = MinioObjectReader(client, 'test-bucket', 'key.bin', size=len(payload), block_size=1024, read_ahead=0)
+    raw.seek(-10, io.SEEK_END)
+    raw.read(10)
+    raw.seek(-10, io.SEEK_END)
+    raw.read(10)
+    assert client.get_object.call_count == 1
+    assert client.get_object.call_args.kwargs['Range'] == 'bytes=9216-9999'
+
+
+def test_reader_block_cache_eviction(mocker, payload):
+    client = mocker.MagicMock()
+    client.get_object.side_effect = _ranged_get(payload)
+    raw = MinioObjectReader(
+        client, 'test-bucket', 'key.bin', size=len(payload), block_size=1024, cache_blocks=2, read_ahead=0
+    )
+    for position in (0, 2048, 4096, 0):
+        raw.seek(position)
+        raw.read(1)
+    assert client.get_object.call_count == 4
+
+
+def test_reader_head_object_when_size_missing(mocker, payload):
+    client = mocker.MagicMock()
+    client.head_object.return_value = {'ContentLength': len(payload)}
+    raw = MinioObjectReader(client, 'test-bucket', 'key.bin')
+    assert raw.size == len(payload)
+
+
+def test_reader_short_block(mocker, payload):
+    client = mocker.MagicMock()
+    # the object was truncated after its size was taken
+    client.get_object.side_effect = _ranged_get(payload[:5000])
+    raw = MinioObjectReader(client, 'test-bucket', 'key.bin', size=len(payload), block_size=1024, read_ahead=0)
+    with pytest.raises(ObjectSizeChangedError):
+        raw.read()
+
+
+def test_reader_read_ahead_bounded_by_cache(mocker, payload):
+    client = mocker.MagicMock()
+    client.get_object.side_effect = _ranged_get(payload)
+    raw = MinioObjectReader(
+        client, 'test-bucket', 'key.bin', size=len(payload), block_size=1024, cache_blocks=2, read_ahead=8
+    )
+    assert raw.read_ahead == 2
+    for position in (0, 1024, 6144, 7168, 0, 1024):
+        raw.seek(position)
+        raw.read(1)
+        assert len(raw._pending) <= raw.cache_blocks
+    raw.close()
+
+
+def test_repo_open_object_overwritten():
+    client = InMemoryS3Client('test-bucket')
+    repo = in_memory_repo(client)
+    client.put_object(Bucket='test-bucket', Key='data/file.bin', Body=b'a' * 4096)
+    with repo.open('/test-bucket/data/file.bin', block_size=1024, read_ahead=0) as f:
+        assert f.read(1024) == b'a' * 1024
+        # same size, only the ETag tells the versions apart
+        client.put_object(Bucket='test-bucket', Key='data/file.bin', Body=b'b' * 4096)
+        with pytest.raises(ObjectSizeChangedError):
+            f.read()
+
+
+def test_repo_open_parquet(mock_boto3_client):
+    input_df = pd.DataFrame({'a': range(500), 'b': [str(x) for x in range(500)]})
+    payload = serialise_parquet(input_df)
+    client = mock_boto3_client.return_value
+    client.list_objects.return_value = {'Contents': [{'Key': 'data/file.parquet', 'Size': len(payload)}]}
+    client.get_object.side_effect = _ranged_get(payload)
+    repo = MinioFileSystemRepo('test-bucket')
+    with repo.open('/test-bucket/data/file.parquet', block_size=256) as f:
+        result = pd.read_parquet(f)
+    pd.testing.assert_frame_equal(result, input_df)
+
+
+def test_repo_open_zipfile(mock_boto3_client):
+    archive = io.BytesIO()
+    with zipfile.ZipFile(archive, 'w') as zf:
+        zf.writestr('first.txt', 'first file')
+        zf.writestr('second.txt', 'second file')
+    payload = archive.getvalue()
+    client = mock_boto3_client.return_value
+    client.list_objects.return_value = {'Contents': [{'Key': 'data/file.zip', 'Size': len(payload)}]}
+    client.get_object.side_effect = _ranged_get(payload)
+    repo = MinioFileSystemRepo('test-bucket')
+    with repo.open('/test-bucket/data/file.zip') as f, zipfile.ZipFile(f) as zf:
+        assert zf.namelist() == ['first.txt', 'second.txt']
+        assert zf.read('second.txt') == b'second file'
+
+
+def test_repo_open_invalid_mode(mock_boto3_client):
+    repo = MinioFileSystemRepo('test-bucket')
+    with pytest.raises(ValueError):
+        repo.open('/test-bucket/data/file.zip', mode='wb')
+
+
+def test_repo_open_missing_file(mock_boto3_client):
+    mock_boto3_client.return_value.list_objects.return_value = {}
+    repo = MinioFileSystemRepo('test-bucket')
+    with pytest.raises(FileNotFoundError):
+        repo.open('/test-bucket/data/file.zip')
@@ -0,0 +1,262 @@
+from unittest.mock import patch
+
+import pytest
+
+from ift_global.connectors.minio_fileops import MinioFileSystemRepo
+from ift_global.credentials.minio_cr import MinioVariablesEnv
+from ift_global.utils.file_operations import ObjectPath
+
+
+@pytest.fixture
+def mock_boto3_client(monkeypatch):
+    monkeypatch.setenv(MinioVariablesEnv.user.value, "testuser")
+    monkeypatch.setenv(MinioVariablesEnv.password.value, "envpass")
+    monkeypatch.setenv(MinioVariablesEnv.url.value, "http://env.minio.com")
+    with patch('boto3.client') as mock:
+        mock.return_value.list_buckets.return_value = {
+            'ResponseMetadata': {'HTTPStatusCode': 200},
+            'Buckets': [{'Name': 'test-bucket'}]
+        }
+        mock.return_value.delete_objects.return_value = {}
+        yield mock
+
+
+@pytest.fixture
+def client(mock_boto3_client):
+    return mock_boto3_client.return_value
+
+
+def _set_pages(client, pages):
+    client.get_paginator.return_value.paginate.return_value = [{'Contents': page} for page in pages]
+
+
+def test_delete_files_batches_of_1000(client):
+    repo = MinioFileSystemRepo('test-bucket')
+    paths = [f'/test-bucket/data/file_{i}.csv' for i in range(2500)]
+    result = repo.delete_files(paths)
+    assert client.delete_objects.call_count == 3
+    batch_sizes = sorted(len(x.kwargs['Delete']['Objects']) for x in client.delete_objects.call_args_list)
+    assert batch_sizes == [500, 1000, 1000]
+    assert len(result['Deleted']) == 2500
+    assert result['Errors'] == []
+
+
+def test_delete_prefix(client):
+    _set_pages(client, [[{'Key': 'data/a.csv'}, {'Key': 'data/b.csv'}], [{'Key': 'data/sub/c.csv'}]])
+    repo = MinioFileSystemRepo('test-bucket')
+    result = repo.delete_prefix('/test-bucket/data')
+    assert sorted(result['Deleted']) == ['data/a.csv', 'data/b.csv', 'data/sub/c.csv']
+    client.get_paginator.return_value.paginate.assert_called_once_with(Bucket='test-bucket', Prefix='data/')
+
+
+def test_delete_prefix_bucket_root(client):
+    repo = MinioFileSystemRepo('test-bucket')
+    with pytest.raises(ValueError):
+        repo.delete_prefix('/test-bucket/')
+
+
+def test_copy_small_object(client):
+    client.head_object.return_value = {'ContentLength': 100}
+    repo = MinioFileSystemRepo('test-bucket')
+    repo.copy('/test-bucket/data/a.csv', '/test-bucket/archive/a.csv')
+    client.copy_object.assert_called_once_with(
+        Bucket='test-bucket', Key='archive/a.csv', CopySource={'Bucket': 'test-bucket', 'Key': 'data/a.csv'}
+    )
+    client.create_multipart_upload.assert_not_called()
+
+
+def test_copy_large_object_multipart(client):
+    client.head_object.return_value = {'ContentLength': 1000}
+    client.create_multipart_upload.return_value = {'UploadId': 'upload-1'}
+    repo = MinioFileSystemRepo('test-bucket', multipart_copy_threshold=500, multipart_copy_partsize=400)
+    repo.copy('/test-bucket/data/a.parquet', '/test-bucket/archive/a.parquet')
+    client.copy_object.assert_not_called()
+    assert client.upload_part_copy.call_count == 3
+    client.complete_multipart_upload.assert_called_once()
+
+
+def test_copy_files(client):
+    client.head_object.return_value = {'ContentLength': 10}
+    repo = MinioFileSystemRepo('test-bucket')
+    result = repo.copy_files({'/test-bucket/a.csv': '/test-bucket/x/a.csv', '/test-bucket/b.csv': '/test-bucket/x/b.csv'})
+    assert result == ['/test-bucket/x/a.csv', '/test-bucket/x/b.csv']
+    assert client.copy_object.call_count == 2
+
+
+def test_copy_prefix(client):
+    _set_pages(client, [[{'Key': 'data/a.csv', 'Size': 10}, {'Key': 'data/sub/b.csv', 'Size': 10}]])
+    repo = MinioFileSystemRepo('test-bucket')
+    repo.copy_prefix('/test-bucket/data/', '/test-bucket/archive/data/')
+    copied = sorted(x.kwargs['Key'] for x in client.copy_object.call_args_list)
+    assert copied == ['archive/data/a.csv', 'archive/data/sub/b.csv']
+    client.head_object.assert_not_called()
+
+
+def test_move(client):
+    client.head_object.return_value = {'ContentLength': 10}
+    repo = MinioFileSystemRepo('test-bucket')
+    repo.move('/test-bucket/data/a.csv', '/test-bucket/archive/a.csv')
+    client.copy_object.assert_called_once()
+    client.delete_object.assert_called_once_with(Bucket='test-bucket', Key='data/a.csv')
+
+
+def test_move_prefix(client):
+    _set_pages(client, [[{'Key': 'data/a.csv', 'Size': 10}, {'Key': 'data/b.csv', 'Size': 10}]])
+    repo = MinioFileSystemRepo('test-bucket')
+    moved = repo.move_prefix('/test-bucket/data/', '/test-bucket/archive/')
+    assert moved == ['data/a.csv', 'data/b.csv']
+    deleted = client.delete_objects.call_args.kwargs['Delete']['Objects']
+    assert deleted == [{'Key': 'data/a.csv'}, {'Key': 'data/b.csv'}]
+
+
+def test_move_files_delete_errors(client):
+    client.head_object.return_value = {'ContentLength': 10}
+    client.delete_objects.return_value = {'Errors': [{'Key': 'a.csv', 'Code': 'AccessDenied'}]}
+    repo = MinioFileSystemRepo('test-bucket')
+    with pytest.raises(IOError):
+        repo.move_files([('/test-bucket/a.csv', '/test-bucket/x/a.csv')])
+
+
+def test_listing_cache_answers_locally(client):
+    _set_pages(client, [[{'Key': 'data/a.csv', 'Size': 1}, {'Key': 'data/2024/b.csv', 'Size': 2}]])
+    repo = MinioFileSystemRepo('test-bucket', listing_cache_ttl=60)
+    assert repo.list_files('/test-bucket/data/') == ['/test-bucket/data/a.csv']
+    assert repo.file_exists('/test-bucket/data/2024/b.csv')
+    assert repo.list_dirs('/test-bucket/data/') == ['/test-bucket/data/2024/']
+    assert repo.dir_exists('/test-bucket/data/')
+    assert client.get_paginator.return_value.paginate.call_count == 1
+    client.list_objects.assert_not_called()
+
+
+def test_listing_cache_updated_by_writes_and_deletes(client):
+    _set_pages(client, [[{'Key': 'data/a.csv', 'Size': 1}]])
+    repo = MinioFileSystemRepo('test-bucket', listing_cache_ttl=60)
+    assert repo.list_files('/test-bucket/data/') == ['/test-bucket/data/a.csv']
+    repo.write_file('/test-bucket/data/b.csv', [{'a': 1}], 'csv')
+    assert repo.file_exists('/test-bucket/data/b.csv')
+    repo.delete_files(['/test-bucket/data/a.csv'])
+    assert repo.list_files('/test-bucket/data/') == ['/test-bucket/data/b.csv']
+
+
+def test_listing_cache_full_refresh_on_expiry(client):
+    _set_pages(client, [[{'Key': 'data/a.csv', 'Size': 1}]])
+    repo = MinioFileSystemRepo('test-bucket', listing_cache_ttl=0)
+    repo.list_files('/test-bucket/data/')
+    # data/a.csv deleted and data/b.csv written by another client
+    _set_pages(client, [[{'Key': 'data/b.csv', 'Size': 1}]])
+    assert repo.list_files('/test-bucket/data/') == ['/test-bucket/data/b.csv']
+    client.get_paginator.return_value.paginate.assert_called_with(Bucket='test-bucket', Prefix='data/')
+
+
+def test_refresh_listing_incremental(client):
+    _set_pages(client, [[{'Key': 'data/a.csv', 'Size': 1}]])
+    repo = MinioFileSystemRepo('test-bucket', listing_cache_ttl=60)
+    repo.list_files('/test-bucket/data/')
+    _set_pages(client, [[{'Key': 'data/b.csv', 'Size': 1}]])
+    repo.refresh_listing('/test-bucket/data/')
+    assert repo.list_files('/test-bucket/data/') == ['/test-bucket/data/a.csv', '/test-bucket/data/b.csv']
+    client.get_paginator.return_value.paginate.assert_called_with(
+        Bucket='test-bucket', Prefix='data/', StartAfter='data/a.csv'
+    )
+
+
+def test_refresh_listing_full(client):
+    _set_pages(client, [[{'Key': 'data/a.csv', 'Size': 1}]])
+    repo = MinioFileSystemRepo('test-bucket', listing_cache_ttl=60)
+    repo.list_files('/test-bucket/data/')
+    _set_pages(client, [[{'Key': 'data/b.csv', 'Size': 1}]])
+    repo.refresh_listing('/test-bucket/data/', full=True)
+    assert repo.list_files('/test-bucket/data/') == ['/test-bucket/data/b.csv']
+
+
+_TREE = {
+    '': {'CommonPrefixes': [{'Prefix': 'data/'}], 'Contents': [{'Key': 'root.csv'}]},
+    'data/': {'CommonPrefixes': [{'Prefix': 'data/2023/'}, {'Prefix': 'data/2024/'}],
+              'Contents': [{'Key': 'data/'}, {'Key': 'data/a.csv'}]},
+    'data/2023/': {'Contents': [{'Key': 'data/2023/b.csv'}]},
+    'data/2024/': {'CommonPrefixes': [{'Prefix': 'data/2024/01/'}], 'Contents': [{'Key': 'data/2024/c.csv'}]},
+    'data/2024/01/': {'Contents': [{'Key': 'data/2024/01/d.csv'}]},
+}
+
+
+@pytest.fixture
+def tree_client(client):
+    client.get_paginator.return_value.paginate.side_effect = lambda Bucket, Prefix, Delimiter: [_TREE[Prefix]]
+    return client
+
+
+def test_walk(tree_client):
+    repo = MinioFileSystemRepo('test-bucket')
+    result = {dir_path: (subdirs, files) for dir_path, subdirs, files in repo.walk('/test-bucket/data/')}
+    assert result == {
+        '/test-bucket/data/': (['2023', '2024'], ['a.csv']),
+        '/test-bucket/data/2023/': ([], ['b.csv']),
+        '/test-bucket/data/2024/': (['01'], ['c.csv']),
+        '/test-bucket/data/2024/01/': ([], ['d.csv']),
+    }
+
+
+def test_walk_bucket_root(tree_client):
+    repo = MinioFileSystemRepo('test-bucket')
+    dirs = {dir_path for dir_path, _, _ in repo.walk('/test-bucket/')}
+    assert dirs == {'/test-bucket/', '/test-bucket/data/', '/test-bucket/data/2023/',
+                    '/test-bucket/data/2024/', '/test-bucket/data/2024/01/'}
+
+
+def test_walk_max_depth(tree_client):
+    repo = MinioFileSystemRepo('test-bucket')
+    dirs = {dir_path for dir_path, _, _ in repo.walk('/test-bucket/data/', max_depth=1)}
+    assert dirs == {'/test-bucket/data/', '/test-bucket/data/2023/', '/test-bucket/data/2024/'}
+
+
+def test_walk_prune_subdirs(tree_client):
+    repo = MinioFileSystemRepo('test-bucket')
+    dirs = set()
+    for dir_path, subdirs, _ in repo.walk('/test-bucket/data/'):
+        dirs.add(dir_path)
+        if '2024' in subdirs:
+            subdirs.remove('2024')
+    assert dirs == {'/test-bucket/data/', '/test-bucket/data/2023/'}
+
+
+def test_walk_yields_each_page(client):
+    pages = {
+        'data/': [{'CommonPrefixes': [{'Prefix': 'data/2023/'}], 'Contents': [{'Key': 'data/a.csv'}]},
+                  {'CommonPrefixes': [{'Prefix': 'data/2024/'}], 'Contents': [{'Key': 'data/b.csv'}]}],
+        'data/2023/': [{'Contents': [{'Key': 'data/2023/c.csv'}]}],
+        'data/2024/': [{'Contents': [{'Key': 'data/2024/d.csv'}]}],
+    }
+    client.get_paginator.return_value.paginate.side_effect = lambda Bucket, Prefix, Delimiter: pages[Prefix]
+    repo = MinioFileSystemRepo('test-bucket')
+    result = sorted(repo.walk('/test-bucket/data/'))
+    assert result == [
+        ('/test-bucket/data/', ['2023'], ['a.csv']),
+        ('/test-bucket/data/', ['2024'], ['b.csv']),
+        ('/test-bucket/data/2023/', [], ['c.csv']),
+        ('/test-bucket/data/2024/', [], ['d.csv']),
+    ]
+
+
+def test_walk_raises_listing_error(client):
+    client.get_paginator.return_value.paginate.side_effect = ValueError('listing failed')
+    repo = MinioFileSystemRepo('test-bucket')
+    with pytest.raises(ValueError):
+        list(repo.walk('/test-bucket/data/'))
+
+
+def test_paths_accept_object_path_and_key(mock_boto3_client):
+    client = mock_boto3_client.return_value
+    repo = MinioFileSystemRepo('test-bucket')
+    repo.write_file(ObjectPath('test-bucket', 'data/a.pickle'), {'a': 1}, 'pickle')
+    repo.write_file('data/b.pickle', {'a': 1}, 'pickle')
+    repo.write_file('s3://test-bucket/data/c.pickle', {'a': 1}, 'pickle')
+    keys = [x.kwargs['Key'] for x in client.put_object.call_args_list]
+    assert keys == ['data/a.pickle', 'data/b.pickle', 'data/c.pickle']
+
+
+def test_list_files_relative_names(mock_boto3_client):
+    client = mock_boto3_client.return_value
+    client.list_objects.return_value = {'Contents': [{'Key': 'data/a.csv', 'Size': 1}]}
+    repo = MinioFileSystemRepo('test-bucket')
+    assert repo.list_files('/test-bucket/data', full_path=False) == ['a.csv']
+    client.list_objects.assert_called_with(Bucket='test-bucket', Prefix='data/', Delimiter='/')
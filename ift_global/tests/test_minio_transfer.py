@@ -0,0 +1,285 @@
+import io
+import os
+import pickle
+import re
+from unittest.mock import patch
+
+import pandas as pd
+import pytest
+from botocore.exceptions import ClientError
+
+from ift_global.benchmarks.fake_s3 import InMemoryS3Client, in_memory_repo
+from ift_global.connectors.file_serialiser import serialise_parquet
+from ift_global.connectors.minio_fileops import MinioFileSystemRepo
+from ift_global.connectors.minio_transfer import (
+    BufferBody,
+    ObjectSizeChangedError,
+    batched,
+    byte_ranges,
+    content_range_size,
+    delete_object_batch,
+    multipart_copy_object,
+    ranged_get_object,
+)
+from ift_global.credentials.minio_cr import MinioVariablesEnv
+
+
+def _ranged_get(payload):
+    """Build a get_object side effect serving byte ranges of payload."""
+    def _get_object(Bucket, Key, Range=None):
+        if Range is None:
+            return {'Body': io.BytesIO(payload)}
+        first_byte, last_byte = map(int, re.match(r'bytes=(\d+)-(\d+)', Range).groups())
+        return {'Body': io.BytesIO(payload[first_byte:last_byte + 1])}
+    return _get_object
+
+
+@pytest.fixture
+def mock_boto3_client(monkeypatch):
+    monkeypatch.setenv(MinioVariablesEnv.user.value, "testuser")
+    monkeypatch.setenv(MinioVariablesEnv.password.value, "envpass")
+    monkeypatch.setenv(MinioVariablesEnv.url.value, "http://env.minio.com")
+    with patch('boto3.client') as mock:
+        mock.return_value.list_buckets.return_value = {
+            'ResponseMetadata': {'HTTPStatusCode': 200},
+            'Buckets': [{'Name': 'test-bucket'}]
+        }
+        yield mock
+
+
+def test_byte_ranges():
+    assert byte_ranges(10, 4) == [(0, 3), (4, 7), (8, 9)]
+    assert byte_ranges(8, 4) == [(0, 3), (4, 7)]
+    assert byte_ranges(0, 4) == []
+
+
+def test_byte_ranges_invalid_chunk():
+    with pytest.raises(ValueError):
+        byte_ranges(10, 0)
+
+
+def test_buffer_body_read_is_zero_copy():
+    buffer = bytearray(b'abcdef')
+    body = BufferBody(buffer)
+    first = body.read(2)
+    assert isinstance(first, memoryview)
+    assert first.obj is buffer
+    assert bytes(first) == b'ab'
+    assert bytes(body.read()) == b'cdef'
+    assert bytes(body.read()) == b''
+
+
+def test_ranged_get_object(mocker):
+    payload = os.urandom(1000)
+    client = mocker.MagicMock()
+    client.get_object.side_effect = _ranged_get(payload)
+    result = ranged_get_object(client, 'test-bucket', 'key.bin', size=len(payload), chunk_size=64, max_concurrency=4)
+    assert bytes(result) == payload
+    assert client.get_object.call_count == 16
+
+
+def test_ranged_get_object_incomplete_range(mocker):
+    client = mocker.MagicMock()
+    client.get_object.return_value = {'Body': io.BytesIO(b'short')}
+    with pytest.raises(IOError):
+        ranged_get_object(client, 'test-bucket', 'key.bin', size=100, chunk_size=100)
+
+
+def test_content_range_size():
+    assert content_range_size('bytes 0-99/1000') == 1000
+    assert content_range_size('bytes */1000') == 1000
+    assert content_range_size('bytes 0-99/*') is None
+    assert content_range_size(None) is None
+
+
+def test_ranged_get_object_size_changed(mocker):
+    client = mocker.MagicMock()
+    client.get_object.return_value = {'ContentRange': 'bytes 0-99/150', 'Body': io.BytesIO(b'a' * 100)}
+    with pytest.raises(ObjectSizeChangedError) as excinfo:
+        ranged_get_object(client, 'test-bucket', 'key.bin', size=200, chunk_size=100)
+    assert excinfo.value.size == 150
+    client.get_object.side_effect = ClientError({'Error': {'Code': 'InvalidRange'}}, 'GetObject')
+    with pytest.raises(ObjectSizeChangedError):
+        ranged_get_object(client, 'test-bucket', 'key.bin', size=200, chunk_size=100)
+
+
+@pytest.mark.parametrize('new_size', [3000, 5000])
+def test_read_file_object_overwritten_within_cache_ttl(new_size):
+    client = InMemoryS3Client('test-bucket')
+    repo = in_memory_repo(client, listing_cache_ttl=60, ranged_read_threshold=1024, ranged_read_chunksize=512)
+    repo.put_object('/test-bucket/data/file.pickle', pickle.dumps(b'a' * 4000))
+    assert repo.read_file('/test-bucket/data/file.pickle', 'pickle') == b'a' * 4000
+    # overwritten by another process, the listing cache still holds the old size
+    client.put_object(Bucket='test-bucket', Key='data/file.pickle', Body=pickle.dumps(b'b' * new_size))
+    assert repo.read_file('/test-bucket/data/file.pickle', 'pickle') == b'b' * new_size
+    assert repo.stat('/test-bucket/data/file.pickle')['Size'] == len(pickle.dumps(b'b' * new_size))
+
+
+def test_read_file_object_overwritten_between_ranges():
+    client = InMemoryS3Client('test-bucket')
+    repo = in_memory_repo(client, ranged_read_threshold=1024, ranged_read_chunksize=512, max_concurrency=1)
+    repo.put_object('/test-bucket/data/file.pickle', pickle.dumps(b'a' * 4000))
+    get_object = client.get_object
+
+    def _overwrite_after_first_range(**kwargs):
+        response = get_object(**kwargs)
+        if client.requests['get_object'] == 1:
+            # same size, only the ETag tells the versions apart
+            client.put_object(Bucket='test-bucket', Key='data/file.pickle', Body=pickle.dumps(b'b' * 4000))
+        return response
+
+    with patch.object(client, 'get_object', side_effect=_overwrite_after_first_range) as patched:
+        assert repo.read_file('/test-bucket/data/file.pickle', 'pickle') == b'b' * 4000
+    assert all('IfMatch' in x.kwargs for x in patched.call_args_list)
+
+
+def test_ranged_get_object_precondition_failed(mocker):
+    client = mocker.MagicMock()
+    client.get_object.side_effect = ClientError(
+        {'Error': {'Code': 'PreconditionFailed'}, 'ResponseMetadata': {'HTTPStatusCode': 412}}, 'GetObject'
+    )
+    with pytest.raises(ObjectSizeChangedError):
+        ranged_get_object(client, 'test-bucket', 'key.bin', size=200, chunk_size=100, etag='"etag"')
+    assert client.get_object.call_args.kwargs['IfMatch'] == '"etag"'
+
+
+def test_listing_cache_entries_of_writes():
+    client = InMemoryS3Client('test-bucket')
+    repo = in_memory_repo(client, listing_cache_ttl=60)
+    repo.list_files('/test-bucket/data/')
+    repo.put_object('/test-bucket/data/a.txt', 'caf\u00e9')
+    repo.copy('/test-bucket/data/a.txt', '/test-bucket/data/b.txt')
+    listed = client.list_objects(Bucket='test-bucket', Prefix='data/')['Contents']
+    for path, listed_entry in zip(['/test-bucket/data/a.txt', '/test-bucket/data/b.txt'], listed, strict=True):
+        cached_entry = repo.stat(path)
+        assert (cached_entry['Size'], cached_entry['ETag']) == (5, listed_entry['ETag'])
+        assert cached_entry['LastModified'] is not None
+
+
+def test_listing_cache_expired_prefix_listed_again():
+    client = InMemoryS3Client('test-bucket')
+    repo = in_memory_repo(client, listing_cache_ttl=0)
+    repo.put_object('/test-bucket/data/a.txt', b'a')
+    repo.put_object('/test-bucket/data/b.txt', b'b')
+    repo.list_files('/test-bucket/data/')
+    # deleted and overwritten by another process
+    client.delete_object(Bucket='test-bucket', Key='data/a.txt')
+    client.put_object(Bucket='test-bucket', Key='data/b.txt', Body=b'bb')
+    assert repo.list_files('/test-bucket/data/') == ['/test-bucket/data/b.txt']
+    assert repo.stat('/test-bucket/data/b.txt')['Size'] == 2
+
+
+def test_read_file_small_object_single_get(mock_boto3_client):
+    payload = pickle.dumps({'a': [1, 2, 3]})
+    client = mock_boto3_client.return_value
+    client.list_objects.return_value = {'Contents': [{'Key': 'data/file.pickle', 'Size': len(payload)}]}
+    client.get_object.side_effect = _ranged_get(payload)
+    repo = MinioFileSystemRepo('test-bucket')
+    assert repo.read_file('/test-bucket/data/file.pickle', 'pickle') == {'a': [1, 2, 3]}
+    assert 'Range' not in client.get_object.call_args.kwargs
+
+
+def test_read_file_large_object_ranged_get(mock_boto3_client):
+    input_df = pd.DataFrame({'a': range(1000), 'b': [float(x) for x in range(1000)]})
+    payload = serialise_parquet(input_df)
+    client = mock_boto3_client.return_value
+    client.list_objects.return_value = {'Contents': [{'Key': 'data/file.parquet', 'Size': len(payload)}]}
+    client.get_object.side_effect = _ranged_get(payload)
+    repo = MinioFileSystemRepo('test-bucket', ranged_read_threshold=1024, ranged_read_chunksize=512)
+    result = repo.read_file('/test-bucket/data/file.parquet', 'parquet')
+    pd.testing.assert_frame_equal(result, input_df)
+    assert client.get_object.call_count == len(byte_ranges(len(payload), 512))
+
+
+def test_read_file_missing_object(mock_boto3_client):
+    client = mock_boto3_client.return_value
+    client.list_objects.return_value = {'Contents': [{'Key': 'data/other.csv', 'Size': 10}]}
+    repo = MinioFileSystemRepo('test-bucket')
+    with pytest.raises(FileExistsError):
+        repo.read_file('/test-bucket/data/file.csv', 'csv')
+
+
+def test_batched():
+    assert list(batched(['a', 'b', 'c'], 2)) == [['a', 'b'], ['c']]
+    assert list(batched([], 2)) == []
+
+
+def test_delete_object_batch(mocker):
+    client = mocker.MagicMock()
+    client.delete_objects.return_value = {'Errors': [{'Key': 'b', 'Code': 'AccessDenied'}]}
+    result = delete_object_batch(client, 'test-bucket', ['a', 'b', 'c'])
+    assert result == {'Deleted': ['a', 'c'], 'Errors': [{'Key': 'b', 'Code': 'AccessDenied'}]}
+    assert client.delete_objects.call_args.kwargs['Delete']['Objects'] == [{'Key': 'a'}, {'Key': 'b'}, {'Key': 'c'}]
+
+
+def test_multipart_copy_object(mocker):
+    client = mocker.MagicMock()
+    client.head_object.return_value = {'ContentLength': 250, 'ETag': '"etag-src"', 'ContentType': 'text/csv',
+                                       'Metadata': {'owner': 'ift'}}
+    client.create_multipart_upload.return_value = {'UploadId': 'upload-1'}
+    client.upload_part_copy.side_effect = lambda **kwargs: {'CopyPartResult': {'ETag': f"etag-{kwargs['PartNumber']}"}}
+    multipart_copy_object(client, 'test-bucket', 'src.bin', 'dst.bin', size=250, part_size=100)
+    ranges = sorted(x.kwargs['CopySourceRange'] for x in client.upload_part_copy.call_args_list)
+    assert ranges == ['bytes=0-99', 'bytes=100-199', 'bytes=200-249']
+    parts = client.complete_multipart_upload.call_args.kwargs['MultipartUpload']['Parts']
+    assert parts == [{'ETag': 'etag-1', 'PartNumber': 1}, {'ETag': 'etag-2', 'PartNumber': 2},
+                     {'ETag': 'etag-3', 'PartNumber': 3}]
+    client.create_multipart_upload.assert_called_once_with(
+        Bucket='test-bucket', Key='dst.bin', ContentType='text/csv', Metadata={'owner': 'ift'}
+    )
+    assert {x.kwargs['CopySourceIfMatch'] for x in client.upload_part_copy.call_args_list} == {'"etag-src"'}
+
+
+def test_copy_large_object_keeps_headers():
+    client = InMemoryS3Client('test-bucket')
+    repo = in_memory_repo(client, multipart_copy_threshold=100, multipart_copy_partsize=64)
+    client.put_object(Bucket='test-bucket', Key='data/a.csv', Body=b'a' * 250, ContentType='text/csv',
+                      Metadata={'owner': 'ift'})
+    repo.copy('/test-bucket/data/a.csv', '/test-bucket/archive/a.csv')
+    assert client.requests['upload_part_copy'] == 4
+    head = client.head_object(Bucket='test-bucket', Key='archive/a.csv')
+    assert (head['ContentType'], head['Metadata']) == ('text/csv', {'owner': 'ift'})
+    assert head['ETag'] == client.head_object(Bucket='test-bucket', Key='data/a.csv')['ETag']
+
+
+def test_multipart_copy_object_source_overwritten():
+    client = InMemoryS3Client('test-bucket')
+    client.put_object(Bucket='test-bucket', Key='src.bin', Body=b'a' * 250)
+    head = client.head_object(Bucket='test-bucket', Key='src.bin')
+    client.put_object(Bucket='test-bucket', Key='src.bin', Body=b'b' * 250)
+    with pytest.raises(ClientError):
+        multipart_copy_object(client, 'test-bucket', 'src.bin', 'dst.bin', size=250, part_size=100, source_head=head)
+    assert [x['Key'] for x in client.list_objects(Bucket='test-bucket')['Contents']] == ['src.bin']
+
+
+def test_move_prefix_destination_under_source():
+    client = InMemoryS3Client('test-bucket')
+    repo = in_memory_repo(client)
+    for key in ['data/a.csv', 'data/sub/b.csv', 'data/archive/old.csv']:
+        client.put_object(Bucket='test-bucket', Key=key, Body=key.encode())
+    moved = repo.move_prefix('/test-bucket/data/', '/test-bucket/data/archive/')
+    assert sorted(moved) == ['data/a.csv', 'data/sub/b.csv']
+    keys = sorted(x['Key'] for x in client.list_objects(Bucket='test-bucket')['Contents'])
+    assert keys == ['data/archive/a.csv', 'data/archive/old.csv', 'data/archive/sub/b.csv']
+    assert client.get_object(Bucket='test-bucket', Key='data/archive/a.csv')['Body'].read() == b'data/a.csv'
+
+
+def test_move_onto_itself():
+    client = InMemoryS3Client('test-bucket')
+    repo = in_memory_repo(client)
+    client.put_object(Bucket='test-bucket', Key='data/a.csv', Body=b'a')
+    with pytest.raises(ValueError):
+        repo.move('/test-bucket/data/a.csv', '/test-bucket/data/a.csv')
+    with pytest.raises(ValueError):
+        repo.move_prefix('/test-bucket/data/', '/test-bucket/data')
+    assert client.get_object(Bucket='test-bucket', Key='data/a.csv')['Body'].read() == b'a'
+
+
+def test_multipart_copy_object_aborts_on_error(mocker):
+    client = mocker.MagicMock()
+    client.create_multipart_upload.return_value = {'UploadId': 'upload-1'}
+    client.upload_part_copy.side_effect = RuntimeError('part failed')
+    with pytest.raises(RuntimeError):
+        multipart_copy_object(client, 'test-bucket', 'src.bin', 'dst.bin', size=250, part_size=100)
+    client.abort_multipart_upload.assert_called_once_with(Bucket='test-bucket', Key='dst.bin', UploadId='upload-1')
+    client.complete_multipart_upload.assert_not_called()
@@ -1,8 +1,14 @@
+import hashlib
 import pytest
 import os
+import pickle
+import sys
+import threading
+import time
 import yaml
 from ruamel.yaml.scanner import ScannerError
-from ift_global.utils.read_yaml import ReadConfig
+from ift_global.utils import read_yaml
+from ift_global.utils.read_yaml import ReadConfig, clear_config_cache, compile_config
 
 @pytest.fixture
 def valid_yaml_file(tmp_path):
@@ -64,4 +70,139 @@ def test_load_non_existent_env_type(valid_yaml_file):
     # Check if the data attribute is empty or raises KeyError
     with pytest.raises(KeyError):
         config = ReadConfig('non_existent_env', valid_yaml_file)
-        _ = config.data['setting1']  # This should raise KeyError
\ No newline at end of file
+        _ = config.data['setting1']  # This should raise KeyError
+
+def test_parse_cache_reused_across_envs(valid_yaml_file, mocker):
+    clear_config_cache()
+    load_spy = mocker.spy(read_yaml.yaml.YAML, 'load')
+    dev_config = ReadConfig('dev', valid_yaml_file)
+    prod_config = ReadConfig('prod', valid_yaml_file)
+    assert load_spy.call_count == 1
+    assert dev_config['setting1'] == 'value1'
+    assert prod_config['setting1'] == 'prod_value1'
+
+
+def test_parse_cache_invalidated_on_change(valid_yaml_file):
+    ReadConfig('dev', valid_yaml_file)
+    with open(valid_yaml_file, 'w') as f:
+        yaml.dump({'dev': {'setting1': 'new_value1'}}, f)
+    assert ReadConfig('dev', valid_yaml_file)['setting1'] == 'new_value1'
+
+
+def test_config_instances_do_not_share_data(tmp_path):
+    config_file = tmp_path / 'conf.yaml'
+    config_file.write_text('dev:\n  database:\n    url: localhost:9090\n')
+    first = ReadConfig('dev', str(config_file))
+    first['database']['url'] = 'changed'
+    assert ReadConfig('dev', str(config_file))['database']['url'] == 'localhost:9090'
+
+
+def test_config_c_loader(valid_yaml_file):
+    config = ReadConfig('prod', valid_yaml_file, pure=False, use_cache=False)
+    assert config.data == {'setting1': 'prod_value1', 'setting2': 'prod_value2'}
+
+
+def _rewrite(config_file, config_data):
+    previous_mtime = os.stat(config_file).st_mtime_ns
+    with open(config_file, 'w') as f:
+        yaml.dump(config_data, f)
+    os.utime(config_file, ns=(previous_mtime + 10 ** 9, previous_mtime + 10 ** 9))
+
+
+def test_reload_changed_keys(valid_yaml_file):
+    config = ReadConfig('dev', valid_yaml_file)
+    assert config.reload() == set()
+    previous_data = config.data
+    _rewrite(valid_yaml_file, {'dev': {'setting1': 'value1', 'setting2': 'new', 'setting3': 'added'}})
+    assert config.reload() == {'setting2', 'setting3'}
+    assert config.data is not previous_data
+    assert previous_data == {'setting1': 'value1', 'setting2': 'value2'}
+
+
+def test_reload_keeps_config_on_invalid_file(valid_yaml_file):
+    config = ReadConfig('dev', valid_yaml_file)
+    _rewrite(valid_yaml_file, {'prod': {'setting1': 'prod_value1'}})
+    assert config.reload() == set()
+    assert config['setting1'] == 'value1'
+
+
+def test_watch_mode_fires_callbacks(valid_yaml_file, monkeypatch):
+    monkeypatch.setitem(sys.modules, 'inotify_simple', None)
+    reloaded = threading.Event()
+    changes = []
+    with ReadConfig('dev', valid_yaml_file, watch=True, poll_interval=0.01) as config:
+        config.add_callback(lambda cfg, changed_keys: (changes.append(changed_keys), reloaded.set()))
+        _rewrite(valid_yaml_file, {'dev': {'setting1': 'reloaded', 'setting2': 'value2'}})
+        assert reloaded.wait(5)
+        assert config['setting1'] == 'reloaded'
+    assert changes == [{'setting1'}]
+    assert config._watch_thread is None
+
+
+def test_watch_mode_survives_invalid_yaml(valid_yaml_file, monkeypatch, capsys):
+    monkeypatch.setitem(sys.modules, 'inotify_simple', None)
+    reloaded = threading.Event()
+    with ReadConfig('dev', valid_yaml_file, watch=True, poll_interval=0.01) as config:
+        config.add_callback(lambda cfg, changed_keys: reloaded.set())
+        previous_mtime = os.stat(valid_yaml_file).st_mtime_ns
+        with open(valid_yaml_file, 'w') as f:
+            f.write('dev:\n  setting1: [value1,\n')
+        os.utime(valid_yaml_file, ns=(previous_mtime + 10 ** 9, previous_mtime + 10 ** 9))
+        deadline = time.monotonic() + 5
+        while config._failed_version is None and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert config['setting1'] == 'value1'
+        assert config._watch_thread.is_alive()
+        _rewrite(valid_yaml_file, {'dev': {'setting1': 'fixed', 'setting2': 'value2'}})
+        assert reloaded.wait(5)
+        assert config['setting1'] == 'fixed'
+    assert 'previous configuration kept' in capsys.readouterr().err
+
+
+def test_compile_config_snapshot(valid_yaml_file, mocker):
+    snapshot_path = compile_config(valid_yaml_file)
+    assert snapshot_path == valid_yaml_file + '.snapshot'
+    with open(snapshot_path, 'rb') as f:
+        snapshot = pickle.load(f)
+    with open(valid_yaml_file, 'rb') as f:
+        assert snapshot['source_sha256'] == hashlib.sha256(f.read()).hexdigest()
+    clear_config_cache()
+    load_spy = mocker.spy(read_yaml.yaml.YAML, 'load')
+    assert ReadConfig('prod', valid_yaml_file)['setting1'] == 'prod_value1'
+    assert load_spy.call_count == 0
+
+
+def test_snapshot_older_than_yaml_is_ignored(valid_yaml_file):
+    compile_config(valid_yaml_file)
+    _rewrite(valid_yaml_file, {'dev': {'setting1': 'edited'}})
+    clear_config_cache()
+    assert ReadConfig('dev', valid_yaml_file)['setting1'] == 'edited'
+
+
+def test_same_size_edit_older_than_snapshot_is_detected(tmp_path):
+    config_file = tmp_path / 'conf.yaml'
+    config_file.write_text('dev:\n  url: aaa\n')
+    compile_config(str(config_file))
+    snapshot_mtime = os.stat(str(config_file) + '.snapshot').st_mtime_ns
+    config_file.write_text('dev:\n  url: bbb\n')
+    os.utime(config_file, ns=(snapshot_mtime - 10 ** 9, snapshot_mtime - 10 ** 9))
+    clear_config_cache()
+    assert ReadConfig('dev', str(config_file))['url'] == 'bbb'
+
+
+def test_snapshot_used_for_same_content_with_new_mtime(valid_yaml_file, mocker):
+    compile_config(valid_yaml_file)
+    file_mtime = os.stat(valid_yaml_file).st_mtime_ns
+    os.utime(valid_yaml_file, ns=(file_mtime + 10 ** 9, file_mtime + 10 ** 9))
+    clear_config_cache()
+    load_spy = mocker.spy(read_yaml.yaml.YAML, 'load')
+    assert ReadConfig('dev', valid_yaml_file)['setting1'] == 'value1'
+    assert load_spy.call_count == 0
+
+
+def test_corrupt_snapshot_falls_back_to_yaml(valid_yaml_file):
+    snapshot_path = compile_config(valid_yaml_file)
+    with open(snapshot_path, 'wb') as f:
+        f.write(b'not a pickle')
+    clear_config_cache()
+    assert ReadConfig('dev', valid_yaml_file)['setting1'] == 'value1'
@@ -0,0 +1,106 @@
+import numpy as np
+import pytest
+
+from ift_global.business_date.business_calendar import BusinessCalendar
+from ift_global.business_date.calendar_exclusions import Country
+from ift_global.business_date.schedules import (
+    add_months,
+    generate_schedules,
+    imm_dates,
+    is_month_end,
+    next_imm_date,
+)
+
+
+def _dates(*values):
+    return np.array(values, dtype='datetime64[D]')
+
+
+@pytest.fixture
+def calendar():
+    return BusinessCalendar({Country.US: ['2025-07-04', '2025-09-01'], Country.ALL: ['2025-12-25']})
+
+
+@pytest.mark.parametrize('convention, expected', [
+    ('following', ['2025-06-02', '2025-07-07', '2025-07-03']),
+    ('modified_following', ['2025-05-30', '2025-07-07', '2025-07-03']),
+    ('preceding', ['2025-05-30', '2025-07-03', '2025-07-03']),
+    ('modified_preceding', ['2025-05-30', '2025-07-03', '2025-07-03']),
+    ('end_of_month', ['2025-05-30', '2025-07-31', '2025-07-31']),
+    ('unadjusted', ['2025-05-31', '2025-07-04', '2025-07-03']),
+])
+def test_adjust_conventions(calendar, convention, expected):
+    adjusted = calendar.adjust(['2025-05-31', '2025-07-04', '2025-07-03'], convention, Country.US)
+    np.testing.assert_array_equal(adjusted, _dates(*expected))
+
+
+def test_adjust_unexpected_convention(calendar):
+    with pytest.raises(ValueError):
+        calendar.adjust('2025-07-04', 'nearest')
+
+
+def test_add_months_clips_to_month_end():
+    np.testing.assert_array_equal(
+        add_months(['2025-01-31', '2024-02-29', '2025-03-15'], [1, 12, -3]),
+        _dates('2025-02-28', '2025-02-28', '2024-12-15')
+    )
+    np.testing.assert_array_equal(
+        add_months(['2025-02-28', '2025-02-27'], 1, end_of_month=True), _dates('2025-03-31', '2025-03-27')
+    )
+    np.testing.assert_array_equal(is_month_end(['2024-02-28', '2024-02-29']), [False, True])
+
+
+def test_imm_dates():
+    np.testing.assert_array_equal(
+        next_imm_date(['2025-01-01', '2025-03-19', '2025-12-31']), _dates('2025-03-19', '2025-06-18', '2026-03-18')
+    )
+    np.testing.assert_array_equal(next_imm_date('2025-03-19', inclusive=True), np.datetime64('2025-03-19'))
+    np.testing.assert_array_equal(
+        imm_dates('2025-03-19', '2025-12-16'), _dates('2025-03-19', '2025-06-18', '2025-09-17')
+    )
+
+
+def test_generate_quarterly_schedules(calendar):
+    schedule = generate_schedules(
+        ['2025-01-31', '2025-04-04'], ['2025-08-31', '2025-10-04'], 'quarterly', calendar, Country.US,
+        end_of_month=True
+    )
+    np.testing.assert_array_equal(schedule.instrument, [0, 0, 0, 0, 1, 1, 1])
+    unadjusted, other_unadjusted = schedule.split(adjusted=False)
+    np.testing.assert_array_equal(unadjusted, _dates('2025-01-31', '2025-04-30', '2025-07-31', '2025-08-31'))
+    np.testing.assert_array_equal(other_unadjusted, _dates('2025-04-04', '2025-07-04', '2025-10-04'))
+    adjusted, other_adjusted = schedule.split()
+    np.testing.assert_array_equal(adjusted, _dates('2025-01-31', '2025-04-30', '2025-07-31', '2025-08-29'))
+    np.testing.assert_array_equal(other_adjusted, _dates('2025-04-04', '2025-07-07', '2025-10-06'))
+
+
+def test_generate_imm_schedules():
+    schedule = generate_schedules(['2025-01-10', '2025-03-19'], ['2025-12-17', '2025-06-18'], 'imm')
+    first, second = schedule.split(adjusted=False)
+    np.testing.assert_array_equal(
+        first, _dates('2025-01-10', '2025-03-19', '2025-06-18', '2025-09-17', '2025-12-17')
+    )
+    np.testing.assert_array_equal(second, _dates('2025-03-19', '2025-06-18'))
+
+
+def test_generate_schedules_matches_per_instrument():
+    rng = np.random.default_rng(0)
+    start_dates = np.datetime64('2020-01-01') + rng.integers(0, 2000, 500)
+    end_dates = start_dates + rng.integers(1, 4000, 500)
+    schedule = generate_schedules(start_dates, end_dates, 'monthly', convention='following')
+    assert len(schedule) == len(schedule.adjusted)
+    for start_date, end_date, dates in zip(start_dates, end_dates, schedule.split(adjusted=False), strict=True):
+        n_months = 0
+        expected = [start_date]
+        while (date := add_months(start_date, n_months + 1)) < end_date:
+            expected.append(date)
+            n_months += 1
+        expected.append(end_date)
+        np.testing.assert_array_equal(dates, np.array(expected, dtype='datetime64[D]'))
+
+
+def test_generate_schedules_invalid():
+    with pytest.raises(ValueError):
+        generate_schedules('2025-01-01', '2026-01-01', 'weekly')
+    with pytest.raises(ValueError):
+        generate_schedules(['2025-01-01', '2025-06-01'], ['2026-01-01', '2025-06-01'])
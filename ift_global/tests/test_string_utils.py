@@ -1,6 +1,11 @@
 import pytest
 
-from ift_global.utils.string_utils import trim_string
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute
+
+from ift_global.utils.string_utils import _compiled_trim_pattern, trim_string, trim_strings
 
 
 def test_trim_string_space_start():
@@ -62,6 +67,10 @@ def test_trim_string_none():
     with pytest.raises(ValueError):
         trim_string(input_string, 'nonea')
 
+def test_trim_string_what_none():
+    assert trim_string(' Hello World ', 'none') == ' Hello World '
+
+
 def test_trim_string_invalid_what():
     # Test with an invalid value for 'what' (should raise an error)
     input_string = "Hello World"
@@ -87,4 +96,88 @@ def test_trim_string_no_match():
     input_string = "Hello World"
     expected_output = "Hello World"
     result = trim_string(input_string, 'both', action_regex='[^a-zA-Z0-9 ]+')
-    assert result == expected_output
\ No newline at end of file
+    assert result == expected_output
+
+def test_trim_strings_list():
+    assert trim_strings(['  a ', 'b  ', None], 'both') == ['a', 'b', None]
+    assert trim_strings(('00123', '0456'), 'leading', action_regex='0') == ['123', '456']
+
+
+def test_trim_strings_series():
+    values = pd.Series(['  a ', 'b  ', None])
+    result = trim_strings(values, 'trailing')
+    assert result.tolist()[:2] == ['  a', 'b']
+    assert pd.isna(result.iloc[2])
+    object_values = pd.Series(['!!x!!', '!y'], dtype=object)
+    assert trim_strings(object_values, 'both', action_regex='!').tolist() == ['x', 'y']
+
+
+def test_trim_strings_object_series_uses_arrow(mocker):
+    kernel_spy = mocker.spy(pa.compute, 'replace_substring_regex')
+    values = pd.Series(['  a ', None, ' b', np.nan], dtype=object, index=[3, 1, 2, 0], name='code')
+    result = trim_strings(values, 'both')
+    assert kernel_spy.call_count == 1
+    assert result.dtype == object
+    assert result.name == 'code'
+    assert result.index.tolist() == [3, 1, 2, 0]
+    assert result.tolist()[:3] == ['a', None, 'b']
+    assert np.isnan(result.iloc[3])
+    python_strings = pd.Series(['  a ', None], dtype='string[python]')
+    result = trim_strings(python_strings, 'both')
+    assert kernel_spy.call_count == 2
+    assert result.dtype == python_strings.dtype
+    assert result.iloc[0] == 'a' and pd.isna(result.iloc[1])
+
+
+def test_trim_strings_mixed_object_series():
+    assert trim_strings(pd.Series([' a ', 1], dtype=object), 'both').iloc[0] == 'a'
+
+
+def test_trim_strings_arrow():
+    values = pa.array(['/ift/test/', '/data/', None])
+    result = trim_strings(values, 'both', action_regex='/')
+    assert isinstance(result, pa.Array)
+    assert result.to_pylist() == ['ift/test', 'data', None]
+    chunked = pa.chunked_array([['  a '], [' b']])
+    assert trim_strings(chunked, 'leading').to_pylist() == ['a ', 'b']
+
+
+@pytest.mark.parametrize('action_regex', ['\\s+', '\\d', '\\w', '\\S'])
+def test_trim_strings_matches_trim_string(action_regex):
+    # unicode whitespace and digits, that the ASCII classes of the arrow regex engine do not match
+    values = ['   Hello World   ', '!!!Hello!!!', '', 'Hello World', '\xa0abc\u2003', '\x85\u3000x\x1f',
+              '\u0663a1\u0661', '\u00e9t\u00e9']
+    for what in ('both', 'leading', 'trailing', 'none'):
+        expected = [trim_string(x, what, action_regex) for x in values]
+        assert trim_strings(values, what, action_regex) == expected
+        assert trim_strings(pa.array(values), what, action_regex).to_pylist() == expected
+        assert trim_strings(pd.Series(values), what, action_regex).tolist() == expected
+        assert trim_strings(pd.Series(values, dtype=object), what, action_regex).tolist() == expected
+
+
+def test_trim_strings_python_regex_fallback():
+    # named unicode escapes are python only, arrow regex engine (RE2) rejects them
+    action_regex = '\\N{DIGIT ZERO}'
+    values = pa.chunked_array([['00123', '0456']])
+    result = trim_strings(values, 'leading', action_regex=action_regex)
+    assert isinstance(result, pa.ChunkedArray)
+    assert result.to_pylist() == ['123', '456']
+    assert trim_strings(pd.Series(['00123', '0456']), 'leading', action_regex=action_regex).tolist() == ['123', '456']
+    arrow_strings = pd.Series(['00123', None], dtype='string[pyarrow]')
+    result = trim_strings(arrow_strings, 'leading', action_regex=action_regex)
+    assert result.dtype == arrow_strings.dtype
+    assert result.iloc[0] == '123' and pd.isna(result.iloc[1])
+
+
+def test_trim_strings_invalid_input():
+    with pytest.raises(ValueError):
+        trim_strings(['a'], 'invalid')
+    with pytest.raises(TypeError):
+        trim_strings('a', 'both')
+
+
+def test_trim_pattern_compiled_once():
+    _compiled_trim_pattern.cache_clear()
+    for _ in range(10):
+        trim_string(' a ', 'both')
+    assert _compiled_trim_pattern.cache_info().misses == 1
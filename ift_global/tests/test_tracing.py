@@ -0,0 +1,163 @@
+import io
+import json
+import os
+import pickle
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+
+import pytest
+
+from ift_global.connectors.minio_fileops import MinioFileSystemRepo
+from ift_global.credentials.minio_cr import MinioVariablesEnv
+from ift_global.utils import tracing
+
+
+@pytest.fixture
+def sink():
+    buffer = io.StringIO()
+    previous = tracing.set_tracer(tracing.JsonLinesTracer(buffer))
+    yield buffer
+    tracing.set_tracer(previous)
+
+
+def _spans(sink):
+    return [json.loads(x) for x in sink.getvalue().splitlines()]
+
+
+def test_default_tracer_is_noop():
+    assert tracing.get_tracer().enabled is False
+    with tracing.span('noop', a=1):
+        pass
+
+
+def test_set_tracer_returns_previous():
+    previous = tracing.set_tracer(tracing.JsonLinesTracer(io.StringIO()))
+    assert tracing.set_tracer(previous).enabled is True
+    assert tracing.get_tracer() is previous
+
+
+def test_json_lines_nested_spans(sink):
+    with tracing.span('outer', path='/bucket/a.csv'):
+        with tracing.span('inner'):
+            pass
+    inner, outer = _spans(sink)
+    assert outer['name'] == 'outer'
+    assert outer['parent_id'] is None
+    assert outer['attributes'] == {'path': '/bucket/a.csv'}
+    assert inner['parent_id'] == outer['span_id']
+    assert inner['trace_id'] == outer['trace_id']
+    assert outer['duration'] >= inner['duration']
+
+
+def test_json_lines_span_error(sink):
+    with pytest.raises(KeyError):
+        with tracing.span('failing'):
+            raise KeyError('missing')
+    assert _spans(sink)[0]['error'] == 'KeyError'
+
+
+def test_traced_decorator(sink):
+    @tracing.traced()
+    def add_one(x):
+        return x + 1
+
+    assert add_one(1) == 2
+    assert _spans(sink)[0]['name'] == 'add_one'
+
+
+def test_profile_block_writes_profiles(tmp_path):
+    with tracing.profile_block('unit_block', mode='both', output_dir=str(tmp_path)):
+        sum(range(1000))
+    files = os.listdir(tmp_path)
+    assert any(x.startswith('unit_block') and x.endswith('.prof') for x in files)
+    assert any(x.startswith('unit_block') and x.endswith('.tracemalloc.txt') for x in files)
+
+
+def test_configure_profiling_profiles_named_spans(tmp_path):
+    tracing.configure_profiling(names='profiled_span', mode='cprofile', output_dir=str(tmp_path))
+    try:
+        with tracing.span('profiled_span'):
+            pass
+        with tracing.span('other_span'):
+            pass
+    finally:
+        tracing.configure_profiling(names='')
+    files = os.listdir(tmp_path)
+    assert len(files) == 1
+    assert files[0].startswith('profiled_span')
+
+
+def test_nested_profiled_spans(tmp_path):
+    tracing.configure_profiling(names='outer_span,inner_span', mode='cprofile', output_dir=str(tmp_path))
+    try:
+        with tracing.span('outer_span'):
+            with tracing.span('inner_span'):
+                sum(range(1000))
+            with tracing.profile_block('inner_block'):
+                sum(range(1000))
+    finally:
+        tracing.configure_profiling(names='')
+    files = os.listdir(tmp_path)
+    assert len(files) == 1
+    assert files[0].startswith('outer_span')
+    assert sys.getprofile() is None
+
+
+def _peak_bytes(tmp_path, name):
+    (profile,) = tmp_path.glob(f'{name}_*.tracemalloc.txt')
+    return int(profile.read_text().splitlines()[0].split(': ')[1])
+
+
+def test_nested_profile_block_keeps_outer_peak(tmp_path):
+    with tracing.profile_block('outer_block', mode='tracemalloc', output_dir=str(tmp_path)):
+        buffer = bytearray(10_000_000)
+        del buffer
+        with tracing.profile_block('inner_block', mode='tracemalloc', output_dir=str(tmp_path)):
+            sum(range(1000))
+    assert _peak_bytes(tmp_path, 'outer_block') >= 10_000_000
+    assert _peak_bytes(tmp_path, 'inner_block') < 10_000_000
+
+
+def test_submit_keeps_parent_span(sink):
+    with ThreadPoolExecutor(max_workers=2) as executor, tracing.span('parent'):
+        futures = [tracing.submit(executor, _child_span, x) for x in range(2)]
+        assert [x.result() for x in futures] == [0, 1]
+    *children, parent = _spans(sink)
+    assert [x['parent_id'] for x in children] == [parent['span_id']] * 2
+
+
+def _child_span(x):
+    with tracing.span('child'):
+        return x
+
+
+def test_profile_block_does_not_raise_on_write_error(tmp_path, capsys):
+    output_file = tmp_path / 'not_a_directory'
+    output_file.write_text('')
+    with tracing.profile_block('unwritable_block', mode='both', output_dir=str(output_file)):
+        result = sum(range(10))
+    assert result == 45
+    assert 'Profiles of unwritable_block not written' in capsys.readouterr().err
+
+
+def test_configure_profiling_invalid_mode():
+    with pytest.raises(ValueError):
+        tracing.configure_profiling(mode='perf')
+
+
+def test_read_file_spans(sink, monkeypatch):
+    monkeypatch.setenv(MinioVariablesEnv.user.value, "testuser")
+    monkeypatch.setenv(MinioVariablesEnv.password.value, "envpass")
+    monkeypatch.setenv(MinioVariablesEnv.url.value, "http://env.minio.com")
+    payload = pickle.dumps([1, 2, 3])
+    with patch('boto3.client') as mock:
+        client = mock.return_value
+        client.list_buckets.return_value = {'ResponseMetadata': {'HTTPStatusCode': 200},
+                                            'Buckets': [{'Name': 'test-bucket'}]}
+        client.list_objects.return_value = {'Contents': [{'Key': 'data/file.pickle', 'Size': len(payload)}]}
+        client.get_object.return_value = {'Body': io.BytesIO(payload)}
+        MinioFileSystemRepo('test-bucket').read_file('/test-bucket/data/file.pickle', 'pickle')
+    spans = {x['name']: x for x in _spans(sink)}
+    assert spans['get_object']['parent_id'] == spans['read_file']['span_id']
+    assert spans['deserialise_pickle']['parent_id'] == spans['read_file']['span_id']
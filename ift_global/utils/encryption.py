@@ -1,9 +1,16 @@
 import base64
 import hashlib
 import os
-from cryptography.hazmat.backends import default_backend
-from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
-from cryptography.hazmat.primitives import padding
+
+AES_BLOCK_SIZE = 128  # AES block size in bits
+
+
+def _aes_cbc_cipher(key: bytes, iv: bytes):
+    """AES CBC cipher, cryptography is imported on first use to keep the import of this module cheap."""
+    from cryptography.hazmat.backends import default_backend
+    from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
+
+    return Cipher(algorithms.AES(key), modes.CBC(iv), backend=default_backend())
 
 
 def create_ash_key(key_size: int):
@@ -82,7 +89,7 @@ class EncryptDecrypt:
         :param internal_key: Internal key as hex representation.
         :type internal_key: str
         """
-        self.block_size = algorithms.AES.block_size // 8  # Block size in bytes (AES block size is in bits)
+        self.block_size = AES_BLOCK_SIZE // 8  # Block size in bytes (AES block size is in bits)
         self.key = self._load_key(internal_key)
 
     @staticmethod
@@ -100,13 +107,15 @@ class EncryptDecrypt:
         :return: Base64 encoded string.
         :rtype: str
         """
+        from cryptography.hazmat.primitives import padding
+
         # Pad the input string
-        padder = padding.PKCS7(algorithms.AES.block_size).padder()
+        padder = padding.PKCS7(AES_BLOCK_SIZE).padder()
         padded_data = padder.update(encrypt_str.encode()) + padder.finalize()
         
         iv = os.urandom(self.block_size)  # Generate a random IV (initialization vector)
 
-        cipher = Cipher(algorithms.AES(self.key), modes.CBC(iv), backend=default_backend())
+        cipher = _aes_cbc_cipher(self.key, iv)
         
         encryptor = cipher.encryptor()
         
@@ -123,17 +132,19 @@ class EncryptDecrypt:
         :return: Decrypted string.
         :rtype: str
         """
+        from cryptography.hazmat.primitives import padding
+
         enc = base64.b64decode(decrypt_str.encode('utf-8'))
         
         iv = enc[:self.block_size]
         
-        cipher = Cipher(algorithms.AES(self.key), modes.CBC(iv), backend=default_backend())
+        cipher = _aes_cbc_cipher(self.key, iv)
         
         decryptor = cipher.decryptor()
         
         decrypted_data = decryptor.update(enc[self.block_size:]) + decryptor.finalize()
         
         # Unpad the decrypted data
-        unpadder = padding.PKCS7(algorithms.AES.block_size).unpadder()
+        unpadder = padding.PKCS7(AES_BLOCK_SIZE).unpadder()
         
         return (unpadder.update(decrypted_data) + unpadder.finalize()).decode('utf-8')
\ No newline at end of file
@@ -1,6 +1,162 @@
+import functools
 import platform
+from typing import Optional, Union
+
 from pydantic import validate_call
 
+
+class ObjectPath:
+    """
+    Object Storage Path.
+
+    Immutable path to an object, or to a prefix, within a bucket. The path is parsed once with
+    :meth:`parse`, which caches the result, and is then handled without further validation.
+
+    Keys of prefixes (directories) end with '/', the root of the bucket has the empty key.
+
+    :param bucket: name of the bucket
+    :type bucket: str
+    :param key: object key or prefix within the bucket, defaults to ''
+    :type key: str, optional
+
+    :Example:
+        >>> path = ObjectPath.parse('/ift-bigdata-dev/input/2024/trades.parquet')
+        >>> path.bucket, path.key, path.name, path.suffix
+        ('ift-bigdata-dev', 'input/2024/trades.parquet', 'trades.parquet', '.parquet')
+        >>> str(path.parent / 'positions.csv')
+        '/ift-bigdata-dev/input/2024/positions.csv'
+    """
+
+    __slots__ = ('bucket', 'key')
+
+    def __init__(self, bucket: str, key: str = ''):
+        """Constructor method."""
+        object.__setattr__(self, 'bucket', bucket)
+        object.__setattr__(self, 'key', key.lstrip('/'))
+
+    @classmethod
+    def parse(cls, path: Union[str, 'ObjectPath'], bucket_name: Optional[str] = None) -> 'ObjectPath':
+        """
+        Parse a path as /bucket/key, bucket/key or s3://bucket/key.
+
+        :param path: path to parse
+        :type path: Union[str, ObjectPath]
+        :param bucket_name: if set, the bucket of the path, and a path not starting with it is read
+            as a key within it, i.e. `input/trades.csv`. Defaults to None, bucket read from the path.
+        :type bucket_name: str, optional
+        :raises ValueError: if the path has no bucket, or is an ObjectPath in another bucket
+        :return: parsed path, results are cached so parsing the same path again is a lookup
+        :rtype: ObjectPath
+        """
+        if isinstance(path, ObjectPath):
+            if bucket_name is not None and path.bucket != bucket_name:
+                raise ValueError(f'Path {path} is not in bucket {bucket_name}')
+            return path
+        return _parse_object_path(path, bucket_name)
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f'{type(self).__name__} is immutable')
+
+    def __delattr__(self, name):
+        raise AttributeError(f'{type(self).__name__} is immutable')
+
+    def __reduce__(self):
+        return (ObjectPath, (self.bucket, self.key))
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, ObjectPath):
+            return NotImplemented
+        return self.bucket == other.bucket and self.key == other.key
+
+    def __hash__(self) -> int:
+        return hash((self.bucket, self.key))
+
+    def __str__(self) -> str:
+        return f'/{self.bucket}/{self.key}'
+
+    def __repr__(self) -> str:
+        return f"ObjectPath('/{self.bucket}/{self.key}')"
+
+    def __truediv__(self, other: str) -> 'ObjectPath':
+        base = self.key if self.is_dir else f'{self.key}/'
+        return ObjectPath(self.bucket, base + str(other).lstrip('/'))
+
+    @property
+    def is_dir(self) -> bool:
+        """True if the path is a prefix, its key is empty or ends with '/'."""
+        return not self.key or self.key[-1] == '/'
+
+    @property
+    def name(self) -> str:
+        """Last component of the key, i.e. `trades.parquet` or `2024` for `input/2024/`."""
+        return self.key.rstrip('/').rpartition('/')[2]
+
+    @property
+    def suffix(self) -> str:
+        """File extension of the name including the dot, empty string if none."""
+        name = self.name
+        dot = name.rfind('.')
+        return name[dot:] if 0 < dot < len(name) - 1 else ''
+
+    @property
+    def stem(self) -> str:
+        """Name without the suffix."""
+        name, suffix = self.name, self.suffix
+        return name[:-len(suffix)] if suffix else name
+
+    @property
+    def prefix(self) -> str:
+        """Key of the directory of the path, the key itself for a prefix, i.e. `input/2024/`."""
+        if self.is_dir:
+            return self.key
+        return self.key[:self.key.rfind('/') + 1]
+
+    @property
+    def parent(self) -> 'ObjectPath':
+        """Path of the parent prefix, the bucket root is its own parent."""
+        head = self.key.rstrip('/').rpartition('/')[0]
+        return ObjectPath(self.bucket, f'{head}/' if head else '')
+
+    def as_dir(self) -> 'ObjectPath':
+        """
+        Path as a prefix.
+
+        :return: the path with a key ending with '/', the bucket root is unchanged
+        :rtype: ObjectPath
+        """
+        return self if self.is_dir else ObjectPath(self.bucket, f'{self.key}/')
+
+    def relative_to(self, other: Union[str, 'ObjectPath']) -> str:
+        """
+        Key relative to a prefix.
+
+        :param other: prefix, as ObjectPath or key
+        :type other: Union[str, ObjectPath]
+        :raises ValueError: if the path is not under the prefix
+        :return: the key without the prefix
+        :rtype: str
+        """
+        prefix = other.as_dir().key if isinstance(other, ObjectPath) else other
+        if not self.key.startswith(prefix):
+            raise ValueError(f'{self} is not under {prefix}')
+        return self.key[len(prefix):]
+
+
+@functools.lru_cache(maxsize=65536)
+def _parse_object_path(path: str, bucket_name: Optional[str]) -> ObjectPath:
+    if path[:4].lower() == 's3:/':
+        path = path[4:]
+    path = path.lstrip('/')
+    if bucket_name is None:
+        bucket, _, key = path.partition('/')
+        if not bucket:
+            raise ValueError('Path does not include a bucket, provide bucket_name.')
+        return ObjectPath(bucket, key)
+    if path == bucket_name or path.startswith(bucket_name + '/'):
+        path = path[len(bucket_name) + 1:]
+    return ObjectPath(bucket_name, path)
+
+
 @validate_call
 def check_path(path: str, bucket_name: str, path_with_file : bool = False):
     """
@@ -14,6 +170,8 @@ def check_path(path: str, bucket_name: str, path_with_file : bool = False):
     :type path_with_file: bool, optional
     :return: file path
     :rtype: str
+
+    .. seealso:: :class:`ObjectPath`, parsing the path once without validation overhead.
     """
     if path[0:4].lower() == 's3:/':
         path = path[4:]
@@ -1,23 +1,573 @@
+import atexit
 import datetime
-import inspect
+import functools
+import gzip
+import json
 import logging
 import logging.handlers
 import os
+import queue
+import random
+import shutil
+import socket
+import sys
+import threading
+import time
+import weakref
+from dataclasses import dataclass
 from typing import Literal, Optional
 
+# listeners of the loggers in async mode, stopped at exit so queued records are written
+_active_listeners = weakref.WeakSet()
 
-class IFTLogger:
-    """IFT Logging functionality."""
+# handlers shared by the IFTLogger instances of the same application and service,
+# keyed by (app_name, service_name, sink), so each record is formatted and written once
+_handler_registry = {}
+_registry_lock = threading.RLock()
+
+
+class _QueueListener(logging.handlers.QueueListener):
+    """Queue listener waiting for space to enqueue the stop sentinel, the bounded queue may be full."""
+
+    def enqueue_sentinel(self):
+        self.queue.put(self._sentinel)
+
+    def handle(self, record):
+        # flush barrier enqueued by flush, all the records enqueued before it are handled
+        if isinstance(record, threading.Event):
+            record.set()
+            return
+        super().handle(record)
+
+    def flush(self):
+        """Wait until the records enqueued before the call are handled."""
+        if self._thread is None:
+            return
+        handled = threading.Event()
+        self.queue.put(handled)
+        handled.wait()
+
+
+def _stop_listener(listener: logging.handlers.QueueListener):
+    if listener._thread is not None:
+        listener.stop()
+
+
+def _close_handler(handler: logging.Handler):
+    """Close a handler replaced in the registry, with the file handler of a memory handler."""
+    target = getattr(handler, 'target', None)
+    handler.close()
+    if target is not None:
+        target.close()
+
+
+@atexit.register
+def _stop_active_listeners():
+    for listener in list(_active_listeners):
+        _stop_listener(listener)
+
+
+class BoundedQueueHandler(logging.handlers.QueueHandler):
+    """
+    Queue Handler with a full queue policy.
+
+    Enqueues records for a :class:`logging.handlers.QueueListener`. When the queue is full,
+    the record is dropped and counted if the policy is `drop`, or the caller waits for space
+    if the policy is `block`.
+
+    :param log_queue: bounded queue shared with the listener
+    :type log_queue: queue.Queue
+    :param policy: `drop` or `block`, defaults to 'drop'
+    :type policy: str, optional
+    """
+
+    def __init__(self, log_queue: queue.Queue, policy: Literal['drop', 'block'] = 'drop'):
+        """Constructor method."""
+        if policy not in ('drop', 'block'):
+            raise ValueError('Only "drop" and "block" are accepted for queue policy')
+        super().__init__(log_queue)
+        self.policy = policy
+        self.dropped = 0
+        self._dropped_lock = threading.Lock()
+
+    def enqueue(self, record: logging.LogRecord):
+        if self.policy == 'block':
+            self.queue.put(record)
+            return
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            with self._dropped_lock:
+                self.dropped += 1
+
+
+# attributes set on every LogRecord, the others are extra fields passed by the caller
+_RECORD_ATTRIBUTES = frozenset(vars(logging.makeLogRecord({}))) | {'message', 'asctime', 'taskName'}
+
+
+@functools.lru_cache(maxsize=1)
+def _json_dumps() -> callable:
+    """Fastest JSON encoder available, orjson if installed else the standard library."""
+    try:
+        import orjson
+    except ImportError:
+        return functools.partial(json.dumps, default=str, separators=(',', ':'), ensure_ascii=False)
+
+    def dumps(obj) -> str:
+        return orjson.dumps(obj, default=str).decode()
+    return dumps
+
+
+class JsonFormatter(logging.Formatter):
+    """
+    JSON Lines Formatter.
+
+    Formats each record as one JSON object with timestamp (UTC, ISO 8601), app, service, level,
+    logger, file, line, message and the extra fields passed with `extra`.
+    The object is only built when a handler emits the record.
+
+    :param app_name: name of the application
+    :type app_name: str
+    :param service_name: name of the service
+    :type service_name: str
+
+    :Example:
+        >>> my_logger = IFTLogger('trade_ingestion', 'data_input', log_format='json')
+        >>> my_logger.info('trades loaded', extra={'book': 'rates', 'n_trades': 1200})
+        {"timestamp":"2025-01-31T17:02:11.418+00:00","app":"trade_ingestion", ... ,"book":"rates","n_trades":1200}
+    """
+
+    def __init__(self, app_name : str, service_name : str):
+        """Constructor method."""
+        super().__init__()
+        self.app_name = app_name
+        self.service_name = service_name
+        self._dumps = _json_dumps()
+
+    def format(self, record : logging.LogRecord) -> str:
+        timestamp = datetime.datetime.fromtimestamp(record.created, datetime.timezone.utc)
+        log_line = {
+            'timestamp': timestamp.isoformat(timespec='milliseconds'),
+            'app': self.app_name,
+            'service': self.service_name,
+            'level': record.levelname,
+            'logger': record.name,
+            'file': record.filename,
+            'line': record.lineno,
+            'message': record.getMessage(),
+        }
+        log_line.update(
+            (key, value) for key, value in record.__dict__.items() if key not in _RECORD_ATTRIBUTES
+        )
+        if record.exc_info:
+            log_line['exception'] = self.formatException(record.exc_info)
+        if record.stack_info:
+            log_line['stack'] = self.formatStack(record.stack_info)
+        return self._dumps(log_line)
+
+
+class BatchUploadHandler(logging.Handler):
+    """
+    Batch Upload Handler.
+
+    Buffers the formatted records in memory and writes them as gzipped JSON lines objects
+    `<prefix>/<YYYY-MM-DD>/<host>_<pid>_<timestamp>_<sequence>.jsonl.gz` with `repo.put_object`,
+    i.e. a :class:`MinioFileSystemRepo`.
+
+    A background thread uploads a batch when the buffer holds `batch_bytes`, every `flush_interval`
+    seconds, and on :meth:`flush` or :meth:`close`. The buffer holds at most `max_buffer_bytes`,
+    records arriving while it is full are dropped, as are the records of failed uploads,
+    and counted in `dropped`.
+
+    :param repo: repository with a `put_object(path, body, **kwargs)` method
+    :type repo: MinioFileSystemRepo
+    :param prefix: path where the batches are written, including the bucket as /iftbigdata/logs/pricing
+    :type prefix: str
+    :param batch_bytes: uncompressed size of a batch triggering an upload, defaults to 1MB
+    :type batch_bytes: int, optional
+    :param flush_interval: maximum seconds between uploads of a non empty buffer, defaults to 30.0
+    :type flush_interval: float, optional
+    :param max_buffer_bytes: maximum uncompressed size of the buffer, defaults to 16MB
+    :type max_buffer_bytes: int, optional
+
+    :ivar dropped: number of records dropped
+    :vartype dropped: int
+    :ivar failed_batches: number of batches which failed to upload
+    :vartype failed_batches: int
+    """
 
     def __init__(
+            self,
+            repo,
+            prefix : str,
+            *,
+            batch_bytes : int = 1024 * 1024,
+            flush_interval : float = 30.0,
+            max_buffer_bytes : int = 16 * 1024 * 1024
+        ):
+        """Constructor method."""
+        super().__init__()
+        self.repo = repo
+        self.prefix = prefix.rstrip('/')
+        self.batch_bytes = batch_bytes
+        self.flush_interval = flush_interval
+        self.max_buffer_bytes = max(max_buffer_bytes, batch_bytes)
+        self.dropped = 0
+        self.failed_batches = 0
+        self._buffer = []
+        self._buffer_bytes = 0
+        self._sequence = 0
+        self._buffer_lock = threading.Lock()
+        self._upload_lock = threading.Lock()
+        self._flush_event = threading.Event()
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, name='ift-log-upload', daemon=True)
+        self._thread.start()
+
+    def emit(self, record : logging.LogRecord):
+        try:
+            line = self.format(record).encode('utf-8') + b'\n'
+        except Exception:
+            self.handleError(record)
+            return
+        with self._buffer_lock:
+            if self._buffer_bytes + len(line) > self.max_buffer_bytes:
+                self.dropped += 1
+                return
+            self._buffer.append(line)
+            self._buffer_bytes += len(line)
+            batch_full = self._buffer_bytes >= self.batch_bytes
+        if batch_full:
+            self._flush_event.set()
+
+    def flush(self):
+        """Upload the records buffered, in the calling thread."""
+        with self._upload_lock:
+            self._upload()
+
+    def close(self):
+        """Stop the background thread and upload the records buffered."""
+        if not self._closed:
+            self._closed = True
+            self._flush_event.set()
+            self._thread.join()
+            self.flush()
+        super().close()
+
+    def _run(self):
+        while not self._closed:
+            self._flush_event.wait(self.flush_interval)
+            self._flush_event.clear()
+            self.flush()
+
+    def _batch_path(self) -> str:
+        now = time.time()
+        self._sequence += 1
+        return '/'.join((
+            self.prefix,
+            time.strftime('%Y-%m-%d', time.gmtime(now)),
+            f'{socket.gethostname()}_{os.getpid()}_{int(now * 1000)}_{self._sequence:06d}.jsonl.gz',
+        ))
+
+    def _upload(self):
+        with self._buffer_lock:
+            lines, self._buffer, self._buffer_bytes = self._buffer, [], 0
+        if not lines:
+            return
+        batch_path = self._batch_path()
+        try:
+            self.repo.put_object(
+                batch_path,
+                gzip.compress(b''.join(lines), compresslevel=6),
+                ContentType='application/x-ndjson',
+                ContentEncoding='gzip'
+            )
+        except Exception as exc:
+            with self._buffer_lock:
+                self.dropped += len(lines)
+                self.failed_batches += 1
+            print(f'Failed to upload log batch {batch_path}: {exc}', file=sys.stderr)
+
+
+class CallSiteRateLimiter:
+    """
+    Call Site Rate Limiter.
+
+    Decides if a message is logged from its call site, the (file, line, level) key.
+    Messages are sampled with probability `sample_rate`, then at most `max_per_second`
+    messages per call site are logged in each second. The messages discarded are counted
+    per call site until collected with :meth:`pop_suppressed`.
+
+    :param max_per_second: maximum messages logged per call site and second, defaults to None (unlimited)
+    :type max_per_second: int, optional
+    :param sample_rate: probability of logging a message, defaults to 1.0
+    :type sample_rate: float, optional
+    :param summary_interval: seconds between the summaries of suppressed messages, defaults to 60.0
+    :type summary_interval: float, optional
+    :raises ValueError: if sample_rate is not in (0, 1]
+
+    :Example:
+        >>> limiter = CallSiteRateLimiter(max_per_second=10, sample_rate=0.5)
+        >>> limiter.allow(('pricer.py', 120, logging.WARNING))
+        True
+    """
+
+    def __init__(
+            self,
+            max_per_second : Optional[int] = None,
+            sample_rate : float = 1.0,
+            summary_interval : float = 60.0
+        ):
+        """Constructor method."""
+        if not 0 < sample_rate <= 1:
+            raise ValueError('sample_rate must be in (0, 1]')
+        self.max_per_second = max_per_second
+        self.sample_rate = sample_rate
+        self.summary_interval = summary_interval
+        self._windows = {}
+        self._suppressed = {}
+        self._last_summary = time.monotonic()
+        self._lock = threading.Lock()
+
+    def allow(self, call_site : tuple) -> bool:
+        """
+        Check if a message from call_site is logged, counting it as suppressed if not.
+
+        :param call_site: (file, line, level) of the logging call
+        :type call_site: tuple
+        :return: True if the message is logged
+        :rtype: bool
+        """
+        if self.sample_rate < 1.0 and random.random() >= self.sample_rate:  # nosec B311
+            self._suppress(call_site)
+            return False
+        if self.max_per_second is None:
+            return True
+        now = time.monotonic()
+        with self._lock:
+            window = self._windows.get(call_site)
+            if window is None or now - window[0] >= 1.0:
+                self._windows[call_site] = [now, 1]
+                return True
+            if window[1] < self.max_per_second:
+                window[1] += 1
+                return True
+        self._suppress(call_site)
+        return False
+
+    def _suppress(self, call_site : tuple):
+        with self._lock:
+            self._suppressed[call_site] = self._suppressed.get(call_site, 0) + 1
+
+    def summary_due(self) -> bool:
+        """True if messages were suppressed and the last summary is older than summary_interval."""
+        return bool(self._suppressed) and self.seconds_to_summary() <= 0
+
+    def seconds_to_summary(self) -> float:
+        """Seconds until the next summary is due, negative if overdue."""
+        return self.summary_interval - (time.monotonic() - self._last_summary)
+
+    def pop_suppressed(self) -> tuple:
+        """
+        Collect the counts of suppressed messages since the last call.
+
+        :return: seconds since the last call and dictionary of {(file, line, level): count}
+        :rtype: tuple
+        """
+        with self._lock:
+            now = time.monotonic()
+            suppressed, self._suppressed = self._suppressed, {}
+            elapsed, self._last_summary = now - self._last_summary, now
+        return elapsed, suppressed
+
+
+def _gzip_file(source : str, dest : str):
+    with open(source, 'rb') as f_in, gzip.open(dest, 'wb') as f_out:
+        shutil.copyfileobj(f_in, f_out)
+    os.remove(source)
+
+
+class _GzipRotationMixin:
+    """
+    Gzip the rotated log files in a background thread.
+
+    The rotated file is renamed, which is cheap, and compressed to `<name>.gz` by a thread.
+    A rollover waits for the previous compression, so the backups are shifted in order.
+    """
+
+    def _init_compression(self):
+        self.namer = self._gzip_name
+        self.rotator = self._gzip_rotate
+        self._compression = None
+
+    @staticmethod
+    def _gzip_name(name : str) -> str:
+        return name + '.gz'
+
+    def _gzip_rotate(self, source : str, dest : str):
+        rotated = dest + '.rotating'
+        os.rename(source, rotated)
+        self._compression = threading.Thread(target=_gzip_file, args=(rotated, dest), name='ift-log-gzip')
+        self._compression.start()
+
+    def wait_compression(self):
+        """Wait for the rotated file being compressed, if any."""
+        if self._compression is not None:
+            self._compression.join()
+
+    def doRollover(self):  # noqa: N802
+        self.wait_compression()
+        super().doRollover()
+
+
+class GzipRotatingFileHandler(_GzipRotationMixin, logging.handlers.RotatingFileHandler):
+    """Rotating File Handler by size, rotated files are gzipped in a background thread."""
+
+    def __init__(self, *args, **kwargs):
+        """Constructor method."""
+        super().__init__(*args, **kwargs)
+        self._init_compression()
+
+
+class GzipTimedRotatingFileHandler(_GzipRotationMixin, logging.handlers.TimedRotatingFileHandler):
+    """Rotating File Handler by time, rotated files are gzipped in a background thread."""
+
+    def __init__(self, *args, **kwargs):
+        """Constructor method."""
+        super().__init__(*args, **kwargs)
+        self._init_compression()
+
+
+@dataclass(frozen=True)
+class QueueOptions:
+    """
+    Queue of :class:`IFTLogger` in async mode.
+
+    :param size: maximum number of records waiting to be written, defaults to 10000
+    :type size: int, optional
+    :param policy: when the queue is full, `drop` discards the record and counts it in
+        `dropped_messages`, `block` waits for space, defaults to 'drop'
+    :type policy: str, optional
+    :raises ValueError: if policy is not accepted
+    """
+
+    size: int = 10000
+    policy: Literal['drop', 'block'] = 'drop'
+
+    def __post_init__(self):
+        if self.policy not in ('drop', 'block'):
+            raise ValueError('Only "drop" and "block" are accepted for queue policy')
+
+
+@dataclass(frozen=True)
+class FileOptions:
+    """
+    Rotation and buffering of the log file of :class:`IFTLogger`.
+
+    :param rotation: rotate the log file by `size` or by `time`, defaults to 'size'
+    :type rotation: str, optional
+    :param max_bytes: size of the log file before rotating, with size rotation, defaults to 10MB
+    :type max_bytes: int, optional
+    :param backup_count: number of rotated log files kept, defaults to 10
+    :type backup_count: int, optional
+    :param rotation_when: interval of the time rotation as in
+        :class:`logging.handlers.TimedRotatingFileHandler`, i.e. `H`, `midnight`, defaults to 'midnight'
+    :type rotation_when: str, optional
+    :param buffer_capacity: if positive, records are buffered in memory and written when the buffer
+        holds buffer_capacity records or an error is logged, defaults to 0
+    :type buffer_capacity: int, optional
+    :param compress_rotated: if True, rotated log files are gzipped in a background thread, defaults to False
+    :type compress_rotated: bool, optional
+    :raises ValueError: if rotation is not accepted
+    """
+
+    rotation: Literal['size', 'time'] = 'size'
+    max_bytes: int = 10 * 1024 * 1024
+    backup_count: int = 10
+    rotation_when: str = 'midnight'
+    buffer_capacity: int = 0
+    compress_rotated: bool = False
+
+    def __post_init__(self):
+        if self.rotation not in ('size', 'time'):
+            raise ValueError('Only "size" and "time" are accepted for log file rotation')
+
+
+@dataclass(frozen=True)
+class RemoteOptions:
+    """
+    Remote sink of :class:`IFTLogger`, records are shipped as gzipped JSON lines batches.
+
+    :param repo: repository the batches are written to, i.e. a :class:`MinioFileSystemRepo`,
+        see :class:`BatchUploadHandler`
+    :type repo: MinioFileSystemRepo
+    :param prefix: path where the batches are written, defaults to /<bucket_name>/logs/<app_name>/<service_name>
+    :type prefix: str, optional
+    :param batch_bytes: uncompressed size of a batch triggering an upload, defaults to 1MB
+    :type batch_bytes: int, optional
+    :param flush_interval: maximum seconds between uploads, defaults to 30.0
+    :type flush_interval: float, optional
+    """
+
+    repo: object
+    prefix: Optional[str] = None
+    batch_bytes: int = 1024 * 1024
+    flush_interval: float = 30.0
+
+
+@dataclass(frozen=True)
+class RateLimitOptions:
+    """
+    Rate limiting and sampling of the messages of :class:`IFTLogger`, see :class:`CallSiteRateLimiter`.
+
+    :param max_per_second: maximum messages per second logged from each call site (file, line, level)
+        by the `debug` ... `critical` methods, defaults to None (unlimited)
+    :type max_per_second: int, optional
+    :param sample_rate: probability of logging a message from the `debug` ... `critical` methods,
+        defaults to 1.0
+    :type sample_rate: float, optional
+    :param summary_interval: seconds between the warnings summarising the messages suppressed
+        per call site, defaults to 60.0
+    :type summary_interval: float, optional
+    :raises ValueError: if sample_rate is not in (0, 1]
+    """
+
+    max_per_second: Optional[int] = None
+    sample_rate: float = 1.0
+    summary_interval: float = 60.0
+
+    def __post_init__(self):
+        if not 0 < self.sample_rate <= 1:
+            raise ValueError('sample_rate must be in (0, 1]')
+
+
+class IFTLogger:
+    """
+    IFT Logging functionality.
+
+    Records are logged to the child logger `ift_global.utils.logger.<app_name>.<service_name>`.
+    Instances with the same application and service share the logger and its console, file
+    and queue handlers, the last instance created sets the level, the sinks and their options,
+    i.e. its format and rotation replace those of the handlers created by previous instances.
+    """
+
+    def __init__(  # noqa: PLR0913
             self,
             app_name : str,
             service_name : str,
             log_level: Optional[Literal['debug', 'warning', 'info', 'critical']] = 'debug',
             log_path : str = None,
-            write_file : bool = False
+            write_file : bool = False,
+            *,
+            log_format : Literal['text', 'json'] = 'text',
+            async_mode : bool = False,
+            queue_options : Optional[QueueOptions] = None,
+            file_options : Optional[FileOptions] = None,
+            remote_options : Optional[RemoteOptions] = None,
+            rate_limit_options : Optional[RateLimitOptions] = None
         ) -> None:
-        """Constructor method.
+        """
+        Constructor method.
 
         :param app_name: name of the application i.e. MyApp etc ...
         :type app_name: str
@@ -27,6 +577,21 @@ class IFTLogger:
         :type log_path: str, optional
         :param write_file: if the log messages should be sink to a file, defaults to False
         :type write_file: bool, optional
+        :param log_format: `text` for pipe delimited lines, `json` for JSON lines as in
+            :class:`JsonFormatter`, defaults to 'text'
+        :type log_format: str, optional
+        :param async_mode: if True, log calls only enqueue the record and a background thread
+            writes to the sinks, defaults to False
+        :type async_mode: bool, optional
+        :param queue_options: size and full queue policy of the queue in async mode, defaults to QueueOptions()
+        :type queue_options: QueueOptions, optional
+        :param file_options: rotation and buffering of the log file, defaults to FileOptions()
+        :type file_options: FileOptions, optional
+        :param remote_options: if set, records are also shipped to a repository, defaults to None
+        :type remote_options: RemoteOptions, optional
+        :param rate_limit_options: if set, messages are rate limited or sampled per call site, defaults to None
+        :type rate_limit_options: RateLimitOptions, optional
+        :raises ValueError: if log_format is not accepted
         :Examples:
             >>> from ift_global import IFTLogger
             >>> my_logger = IFTLogger(
@@ -37,12 +602,38 @@ class IFTLogger:
             >>> my_logger.logger.error('This is an error message')
             >>> my_logger.logger.info('This is an info message')
             >>> my_logger.logger = 'ift_common.this_module.this_file.py'
+            >>> pricing_logger = IFTLogger('pricing', 'worker', write_file=True, async_mode=True)
+            >>> pricing_logger.info('priced book')
+            >>> pricing_logger.close()
+            >>> batch_logger = IFTLogger('positions', 'eod', write_file=True, file_options=FileOptions(
+            ...     rotation='time', buffer_capacity=500, compress_rotated=True))
+            >>> worker_logger = IFTLogger(
+            ...     'pricing', 'worker', remote_options=RemoteOptions(MinioFileSystemRepo('iftbigdata')))
+            >>> tick_logger = IFTLogger(
+            ...     'market_data', 'ticks', rate_limit_options=RateLimitOptions(max_per_second=10, sample_rate=0.1))
         """
+        if log_format not in ('text', 'json'):
+            raise ValueError('Only "text" and "json" are accepted for log format')
         self.app_name = app_name
         self.service_name = service_name
         self.write_file = write_file
         self.log_level = log_level
         self.log_path = log_path
+        self.async_mode = async_mode
+        self.log_format = log_format
+        self.queue_options = queue_options or QueueOptions()
+        self.file_options = file_options or FileOptions()
+        self.remote_options = remote_options
+        self._rate_limiter = None
+        self._summary_timer = None
+        self._summary_lock = threading.Lock()
+        if rate_limit_options is not None:
+            self._rate_limiter = CallSiteRateLimiter(
+                rate_limit_options.max_per_second, rate_limit_options.sample_rate, rate_limit_options.summary_interval
+            )
+        self._queue_acquired = False
+        self._handlers = []
+        self._sinks = []
         self._logger = self._init_logger()
 
     @property
@@ -51,9 +642,88 @@ class IFTLogger:
 
     @logger.setter
     def logger(self, value):
+        self.close()
         self._logger = self._init_logger(value=value)
         self._remove_old_handlers()
 
+    @property
+    def _queue_handler(self) -> Optional[BoundedQueueHandler]:
+        """Queue handler shared by the async instances of the application and service, None if not async."""
+        if not self._queue_acquired:
+            return None
+        return _handler_registry.get((self.app_name, self.service_name, 'queue'))
+
+    @property
+    def _listener(self) -> Optional[logging.handlers.QueueListener]:
+        queue_handler = self._queue_handler
+        return queue_handler.listener if queue_handler is not None else None
+
+    @property
+    def dropped_messages(self) -> int:
+        """Number of records dropped because the queue was full, always 0 unless in async mode."""
+        return self._queue_handler.dropped if self._queue_handler else 0
+
+    def close(self):
+        """
+        Write the records queued or buffered and stop the background thread of async mode.
+
+        The queue and its thread are shared by the async instances of the application and
+        service, they are stopped by the last instance closed, the others only wait for
+        their records to be written. Records logged after the queue is stopped are written
+        synchronously by the sinks. Called at exit for the loggers still open.
+        """
+        if self._summary_timer is not None:
+            self._summary_timer.cancel()
+        self._log_suppressed()
+        self._release_queue_handler()
+        for handler in self._sinks:
+            handler.flush()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def _release_queue_handler(self):
+        """
+        Release the shared queue handler, stopping its listener if this instance was its last user.
+
+        The sinks of the stopped listener are attached to the logger, so that later records are not dropped.
+        """
+        queue_handler = self._queue_handler
+        if not self._queue_acquired:
+            return
+        self._queue_acquired = False
+        if queue_handler is None:
+            return
+        with _registry_lock:
+            queue_handler.users -= 1
+            last_user = queue_handler.users <= 0
+            if last_user:
+                del _handler_registry[(self.app_name, self.service_name, 'queue')]
+                self._logger.removeHandler(queue_handler)
+                self._handlers = list(queue_handler.listener.handlers)
+                for handler in self._handlers:
+                    if handler not in self._logger.handlers:
+                        self._logger.addHandler(handler)
+        if last_user:
+            self._stop_listener(queue_handler, self._logger)
+        else:
+            queue_handler.listener.flush()
+
+    def _stop_listener(self, queue_handler : BoundedQueueHandler, logger : logging.Logger):
+        listener = queue_handler.listener
+        _stop_listener(listener)
+        if queue_handler.dropped:
+            record = logger.makeRecord(
+                logger.name, logging.WARNING, __file__, 0,
+                f'{queue_handler.dropped} log messages dropped, logging queue full', None, None
+            )
+            for handler in listener.handlers:
+                handler.handle(record)
+        _active_listeners.discard(listener)
+
     def _get_log_level(self):
         log_levels = {
             'debug': logging.DEBUG,
@@ -73,18 +743,137 @@ class IFTLogger:
         if value:
             logger = logging.getLogger(value)
         else:
-            logger = logging.getLogger(__name__)
-        console_handler = self._config_console_handler()
-        logger.addHandler(console_handler)
-
+            logger = logging.getLogger(f'{__name__}.{self.app_name}.{self.service_name}')
+        logger.setLevel(self._get_log_level())
+        replaced = []
+        handlers = [
+            self._registered_handler('console', self._config_console_handler, (self.log_format,), replaced)
+        ]
         if self.write_file:
-            file_handler = self._config_logfile_handler()
-            logger.addHandler(file_handler)
+            file_sink = ('file', os.path.abspath(self._log_file_name()))
+            file_sink_options = (self.file_options, self.log_format)
+            handlers.append(
+                self._registered_handler(file_sink, self._config_logfile_handler, file_sink_options, replaced)
+            )
+        if self.remote_options is not None:
+            remote_sink = ('remote', self._remote_prefix())
+            remote_options = (
+                id(self.remote_options.repo), self.remote_options.batch_bytes, self.remote_options.flush_interval
+            )
+            handlers.append(
+                self._registered_handler(remote_sink, self._config_remote_handler, remote_options, replaced)
+            )
+        self._sinks = handlers
+
+        if self.async_mode:
+            handlers = [self._acquire_queue_handler(handlers, logger)]
+
+        with _registry_lock:
+            service_handlers = [
+                handler for key, handler in _handler_registry.items()
+                if key[:2] == (self.app_name, self.service_name)
+            ]
+            for handler in service_handlers + replaced:
+                if handler not in handlers:
+                    logger.removeHandler(handler)
+            for handler in handlers:
+                if handler not in logger.handlers:
+                    logger.addHandler(handler)
+        self._handlers = handlers
+        for handler in replaced:
+            _close_handler(handler)
         logger.propagate = False
         return logger
 
+    def _registered_handler(self, sink, factory : callable, options : tuple, replaced : list) -> logging.Handler:
+        """
+        Get the handler of sink for this application and service, created with factory if not registered.
+
+        A registered handler created with other options is replaced by a new handler, as the
+        last instance created sets the sinks.
+
+        :param sink: `console`, ('file', path to the log file) or ('remote', prefix)
+        :type sink: Union[str, tuple]
+        :param factory: function creating the handler
+        :type factory: callable
+        :param options: options of the handler, i.e. format and rotation of a log file
+        :type options: tuple
+        :param replaced: list where the replaced handler is appended, to be removed and closed
+        :type replaced: list
+        :return: handler shared by the loggers of the application and service
+        :rtype: logging.Handler
+        """
+        key = (self.app_name, self.service_name, sink)
+        with _registry_lock:
+            handler = _handler_registry.get(key)
+            if handler is not None and handler.options != options:
+                replaced.append(handler)
+                handler = None
+            if handler is None:
+                handler = _handler_registry[key] = factory()
+                handler.options = options
+            else:
+                handler.setLevel(self._get_log_level())
+        return handler
+
+    def _acquire_queue_handler(self, handlers : list, logger : logging.Logger) -> BoundedQueueHandler:
+        """
+        Get the queue handler of this application and service, counting this instance as a user.
+
+        The listener of a registered queue handler writes to the given handlers from now on,
+        as the last instance created sets the sinks.
+
+        :param handlers: handlers writing the records
+        :type handlers: list
+        :param logger: logger of the instance
+        :type logger: logging.Logger
+        :return: handler enqueueing the records, with the listener as `listener` attribute
+        :rtype: BoundedQueueHandler
+        """
+        key = (self.app_name, self.service_name, 'queue')
+        with _registry_lock:
+            queue_handler = _handler_registry.get(key)
+            if queue_handler is not None and queue_handler.queue.maxsize != self.queue_options.size:
+                # the records queued are written before the users move to a queue of the new size
+                logger.removeHandler(queue_handler)
+                self._stop_listener(queue_handler, logger)
+                users, queue_handler = queue_handler.users, None
+            else:
+                users = 0
+            if queue_handler is None:
+                queue_handler = _handler_registry[key] = self._config_queue_handler(handlers)
+                queue_handler.users = users
+            else:
+                queue_handler.listener.handlers = tuple(handlers)
+                queue_handler.setLevel(self._get_log_level())
+                queue_handler.policy = self.queue_options.policy
+            if not self._queue_acquired:
+                queue_handler.users += 1
+                self._queue_acquired = True
+        return queue_handler
+
+    def _config_queue_handler(self, handlers : list) -> BoundedQueueHandler:
+        """
+        Config queue handler, the handlers are moved to a listener thread.
+
+        :param handlers: handlers writing the records
+        :type handlers: list
+        :return: handler enqueueing the records, with the listener as `listener` attribute
+        :rtype: BoundedQueueHandler
+        """
+        log_queue = queue.Queue(maxsize=self.queue_options.size)
+        queue_handler = BoundedQueueHandler(log_queue, policy=self.queue_options.policy)
+        queue_handler.setLevel(self._get_log_level())
+        queue_handler.set_name(f'{self._logger_uid}_queue')
+        queue_handler.users = 0
+        queue_handler.listener = _QueueListener(log_queue, *handlers, respect_handler_level=True)
+        queue_handler.listener.start()
+        _active_listeners.add(queue_handler.listener)
+        return queue_handler
+
     def _log_file_name(self):
-        """Builds file path to log file.
+        """
+        Builds file path to log file.
 
         :return: file path to log file
         :rtype: str
@@ -96,35 +885,70 @@ class IFTLogger:
             return os.path.join(self.log_path, log_file)
 
     def _config_logfile_handler(self) -> logging.handlers:
-        """Config write log file.
+        """
+        Config write log file.
 
-        :return: handlers to write to .log file
+        :return: handlers to write to .log file, a memory handler wrapping it if buffered
         :rtype: logging.handlers
         """
-        fh = logging.handlers.RotatingFileHandler(
-            self._log_file_name(), mode='a', maxBytes=2000, backupCount=10
-        )
-        formatter = logging.Formatter(
-            fmt=f'%(asctime)s | {self.app_name} | {self.service_name} | %(levelname)-8s | %(message)s',
-            datefmt='%Y-%m-%d %H:%M:%S')
-
-        fh.setFormatter(formatter)
+        options = self.file_options
+        if options.rotation == 'time':
+            handler_class = (
+                GzipTimedRotatingFileHandler if options.compress_rotated
+                else logging.handlers.TimedRotatingFileHandler
+            )
+            fh = handler_class(self._log_file_name(), when=options.rotation_when, backupCount=options.backup_count)
+        else:
+            handler_class = (
+                GzipRotatingFileHandler if options.compress_rotated
+                else logging.handlers.RotatingFileHandler
+            )
+            fh = handler_class(
+                self._log_file_name(), mode='a', maxBytes=options.max_bytes, backupCount=options.backup_count
+            )
+        fh.setFormatter(self._formatter())
         fh.setLevel(self._get_log_level())
         fh.set_name(f'{self._logger_uid}_writer')
-        return fh
+        if options.buffer_capacity <= 0:
+            return fh
+        mh = logging.handlers.MemoryHandler(options.buffer_capacity, flushLevel=logging.ERROR, target=fh)
+        mh.setLevel(self._get_log_level())
+        mh.set_name(f'{self._logger_uid}_buffer')
+        return mh
+
+    def _remote_prefix(self) -> str:
+        if self.remote_options.prefix:
+            return self.remote_options.prefix
+        return f'/{self.remote_options.repo.bucket_name}/logs/{self.app_name}/{self.service_name}'
+
+    def _config_remote_handler(self) -> BatchUploadHandler:
+        """
+        Config handler shipping the records to the remote repository.
+
+        :return: handler uploading batches of JSON lines
+        :rtype: BatchUploadHandler
+        """
+        rh = BatchUploadHandler(
+            self.remote_options.repo,
+            self._remote_prefix(),
+            batch_bytes=self.remote_options.batch_bytes,
+            flush_interval=self.remote_options.flush_interval
+        )
+        rh.setFormatter(JsonFormatter(self.app_name, self.service_name))
+        rh.setLevel(self._get_log_level())
+        rh.set_name(f'{self._logger_uid}_remote')
+        return rh
 
     def _config_console_handler(self) -> logging.handlers:
-        """Config console handler.
+        """
+        Config console handler.
 
         :return: returns stream handler for print to console log
         :rtype: logging.StreamHandler
         """
         ch = logging.StreamHandler()
         ch.setLevel(self._get_log_level())
-        formatter = logging.Formatter(
-            fmt=f'%(asctime)s | {self.app_name} | {self.service_name} | %(levelname)-8s | %(message)s',
-            datefmt='%Y-%m-%d %H:%M:%S')
-        ch.setFormatter(formatter)
+        ch.setFormatter(self._formatter())
         ch.set_name(f'{self._logger_uid}_console')
         return ch
 
@@ -138,12 +962,13 @@ class IFTLogger:
                 time_tostr,
             )
         )
+
     def _remove_old_handlers(self):
 
         log_remove = [
             han
             for han in self._logger.handlers
-            if not han.name.startswith(self._logger_uid)
+            if han not in self._handlers
         ]
         if not log_remove:
             return True
@@ -153,44 +978,87 @@ class IFTLogger:
             self._logger.removeHandler(lg)
 
     def _standard_logging_line(self):
+        """Format of the log lines, the caller file and line are filled in by the logging module."""
+        return (
+            f'%(asctime)s | {self.app_name} | {self.service_name} | %(levelname)-8s | '
+            '%(filename)s | line: %(lineno)d | %(message)s'
+        )
 
-        return f'%(asctime)s | {self.app_name} | {self.service_name} | %(levelname)-8s | %(message)s'
+    def _formatter(self) -> logging.Formatter:
+        """Formatter of the console and file handlers, as set by log_format."""
+        if self.log_format == 'json':
+            return JsonFormatter(self.app_name, self.service_name)
+        return logging.Formatter(fmt=self._standard_logging_line(), datefmt='%Y-%m-%d %H:%M:%S')
 
-    def _standard_logging_message(self):
+    def _log(self, level : int, message, args : tuple, kwargs : dict):
+        """
+        Log a message if level is enabled, the record is attributed to the caller of the level method.
 
-        return f'%(asctime)s | {self.app_name} | {self.service_name} | %(levelname)-8s | %(message)s'
+        `message % args` is only built when a handler formats the record, so disabled levels
+        cost a single level check, and messages discarded by the rate limiter a frame lookup.
+        Messages with a stacklevel deeper than the stack are not rate limited.
+        """
+        if not self._logger.isEnabledFor(level):
+            return
+        stacklevel = kwargs.get('stacklevel', 1)
+        if self._rate_limiter is not None:
+            try:
+                caller = sys._getframe(stacklevel + 1)
+            except ValueError:
+                caller = None
+            if self._rate_limiter.summary_due():
+                self._log_suppressed()
+            if caller is not None and not self._rate_limiter.allow(
+                    (caller.f_code.co_filename, caller.f_lineno, level)):
+                self._schedule_summary()
+                return
+        kwargs['stacklevel'] = stacklevel + 2
+        self._logger.log(level, message, *args, **kwargs)
 
-    def _get_caller_info(self):
-        # Get the caller's frame
-        try:
-            frame = inspect.stack()[2]
-            filename = os.path.basename(frame.filename)
-            return filename, frame.lineno
-        except IndexError:
-            print('Index Error inspect stack out of range')
-            return 'unknown_file', 'unknow_line'
-
-    def debug(self, message):
-        """Log a debug message."""
-        filename, lineno = self._get_caller_info()
-        self.logger.debug(f"{filename} | line: {lineno} | {message}")
-
-    def info(self, message):
+    def _schedule_summary(self):
+        """
+        Start a timer logging the suppressed messages when the summary is due, if not started.
+
+        The summary is written even if the call sites stop logging, i.e. at the end of a storm.
+        """
+        with self._summary_lock:
+            if self._summary_timer is not None and self._summary_timer.is_alive():
+                return
+            self._summary_timer = threading.Timer(
+                max(self._rate_limiter.seconds_to_summary(), 0), self._log_suppressed
+            )
+            self._summary_timer.daemon = True
+            self._summary_timer.start()
+
+    def _log_suppressed(self):
+        """Log a warning per call site with messages suppressed by the rate limiter."""
+        if self._rate_limiter is None:
+            return
+        elapsed, suppressed = self._rate_limiter.pop_suppressed()
+        for (filename, lineno, level), count in suppressed.items():
+            record = self._logger.makeRecord(
+                self._logger.name, logging.WARNING, filename, lineno,
+                'suppressed %d %s messages in the last %.0f seconds',
+                (count, logging.getLevelName(level), elapsed), None
+            )
+            self._logger.handle(record)
+
+    def debug(self, message, *args, **kwargs):
+        """Log a debug message, i.e. `my_logger.debug('priced %s trades', n_trades)`."""
+        self._log(logging.DEBUG, message, args, kwargs)
+
+    def info(self, message, *args, **kwargs):
         """Log an info message."""
-        filename, lineno = self._get_caller_info()
-        self.logger.info(f"{filename} | line: {lineno} | {message}")
+        self._log(logging.INFO, message, args, kwargs)
 
-    def warning(self, message):
+    def warning(self, message, *args, **kwargs):
         """Log a warning message."""
-        filename, lineno = self._get_caller_info()
-        self.logger.warning(f"{filename} | line: {lineno} | {message}")
+        self._log(logging.WARNING, message, args, kwargs)
 
-    def error(self, message):
+    def error(self, message, *args, **kwargs):
         """Log an error message."""
-        filename, lineno = self._get_caller_info()
-        self.logger.error(f"{filename} | line: {lineno} | {message}")
+        self._log(logging.ERROR, message, args, kwargs)
 
-    def critical(self, message):
+    def critical(self, message, *args, **kwargs):
         """Log a critical message."""
-        filename, lineno = self._get_caller_info()
-        self.logger.critical(f"{filename} | line: {lineno} | {message}")
+        self._log(logging.CRITICAL, message, args, kwargs)
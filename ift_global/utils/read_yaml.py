@@ -1,10 +1,144 @@
+import copy
+import hashlib
 import os
+import pickle
 import sys
+import threading
 from collections import UserDict
 
 from ruamel import yaml
 from ruamel.yaml.scanner import ScannerError
 
+# parsed YAML documents by real path, as (mtime_ns, size, document), shared by all ReadConfig
+# instances so a file is parsed again only when it changes
+_parse_cache = {}
+_parse_cache_lock = threading.Lock()
+
+SNAPSHOT_SUFFIX = '.snapshot'
+SNAPSHOT_FORMAT = 2
+
+
+def clear_config_cache():
+    """Discard the parsed YAML documents cached by :class:`ReadConfig`."""
+    with _parse_cache_lock:
+        _parse_cache.clear()
+
+
+def _file_version(config_path: str) -> tuple:
+    """Modification time and size of a file, None if it does not exist."""
+    try:
+        file_stat = os.stat(config_path)
+    except FileNotFoundError:
+        return None
+    return file_stat.st_mtime_ns, file_stat.st_size
+
+
+def compile_config(config_path: str, pure: bool = True) -> str:
+    """
+    Compile a YAML config file into a snapshot loaded by :class:`ReadConfig` without parsing YAML.
+
+    The snapshot is a pickle of the parsed document, with the modification time, the size and
+    the sha256 hash of the YAML content. It is written next to the YAML file as
+    `<config_path>.snapshot` and used while it matches the YAML file, i.e. run it again after
+    editing the YAML. Snapshots are unpickled, so they must be written by trusted processes only.
+
+    :param config_path: path to the YAML file
+    :type config_path: str
+    :param pure: if False, parse with the C loader of ruamel.yaml when available, defaults to True
+    :type pure: bool, optional
+    :return: path of the snapshot
+    :rtype: str
+
+    :Example:
+        >>> compile_config('./properties/conf.yaml')
+        './properties/conf.yaml.snapshot'
+    """
+    config_path = os.path.expanduser(config_path)
+    snapshot_path = config_path + SNAPSHOT_SUFFIX
+    # stat before reading: if the file changes meanwhile, its mtime differs and the hash is checked
+    source_mtime_ns = os.stat(config_path).st_mtime_ns
+    with open(config_path, 'rb') as f:
+        content = f.read()
+    snapshot = {
+        'format': SNAPSHOT_FORMAT,
+        'source_sha256': hashlib.sha256(content).hexdigest(),
+        'source_size': len(content),
+        'source_mtime_ns': source_mtime_ns,
+        'document': yaml.YAML(typ='safe', pure=pure).load(content),
+    }
+    temp_path = f'{snapshot_path}.{os.getpid()}.tmp'
+    with open(temp_path, 'wb') as f:
+        pickle.dump(snapshot, f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(temp_path, snapshot_path)
+    return snapshot_path
+
+
+def _load_snapshot(config_path: str, file_version: tuple):
+    """
+    Load the snapshot of a YAML file if present and matching the file.
+
+    The snapshot matches when the file has the size and modification time recorded at compile
+    time, or else when the sha256 hash of its content is the recorded one, i.e. a file copied
+    or checked out again with the same content.
+
+    :param config_path: path to the YAML file
+    :type config_path: str
+    :param file_version: modification time and size of the YAML file
+    :type file_version: tuple
+    :return: parsed document, None if there is no valid snapshot
+    :rtype: dict
+    """
+    try:
+        with open(config_path + SNAPSHOT_SUFFIX, 'rb') as f:
+            snapshot = pickle.load(f)  # nosec B301
+    except FileNotFoundError:
+        return None
+    except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ImportError) as e:
+        print(f'Config snapshot of {config_path} not loaded: {e!r}', file=sys.stderr)
+        return None
+    if not isinstance(snapshot, dict) or snapshot.get('format') != SNAPSHOT_FORMAT \
+            or snapshot.get('source_size') != file_version[1]:
+        return None
+    if snapshot.get('source_mtime_ns') != file_version[0]:
+        with open(config_path, 'rb') as f:
+            if hashlib.sha256(f.read()).hexdigest() != snapshot.get('source_sha256'):
+                return None
+    return snapshot['document']
+
+
+def _parse_yaml(config_path: str, pure: bool = True, use_cache: bool = True, use_snapshot: bool = True):
+    """
+    Parse a YAML file, reusing the cached document if the file has the same mtime and size.
+
+    :param config_path: path to the YAML file
+    :type config_path: str
+    :param pure: if False, use the C loader of ruamel.yaml when available, defaults to True
+    :type pure: bool, optional
+    :param use_cache: if False, parse the file even if cached, defaults to True
+    :type use_cache: bool, optional
+    :param use_snapshot: if True, load the snapshot written by :func:`compile_config` instead of
+        parsing the file when it matches the file, defaults to True
+    :type use_snapshot: bool, optional
+    :raises FileNotFoundError: if the file does not exist
+    :return: parsed document, shared with the cache so it must not be modified
+    :rtype: dict
+    """
+    real_path = os.path.realpath(config_path)
+    file_stat = os.stat(real_path)
+    file_version = (file_stat.st_mtime_ns, file_stat.st_size)
+    if use_cache:
+        with _parse_cache_lock:
+            cached = _parse_cache.get(real_path)
+        if cached is not None and cached[:2] == file_version:
+            return cached[2]
+    document = _load_snapshot(config_path, file_version) if use_snapshot else None
+    if document is None:
+        with open(real_path, 'r') as f:
+            document = yaml.YAML(typ='safe', pure=pure).load(f)
+    with _parse_cache_lock:
+        _parse_cache[real_path] = (*file_version, document)
+    return document
+
 
 class ReadConfig(UserDict):
     """
@@ -12,10 +146,26 @@ class ReadConfig(UserDict):
 
     This class loads configuration from a YAML file.
 
+    Parsed files are cached for the process by path, modification time and size, so further
+    instances on an unchanged file, for any environment, do not read it again. The first read
+    loads the snapshot written by :func:`compile_config` instead of parsing YAML, when it
+    matches the file.
+
     :param env_type: The environment type to load from the config file
     :type env_type: str
     :param config_path: Path to the configuration file, defaults to './properties/conf.yaml'
     :type config_path: str, optional
+    :param pure: if False, parse with the C loader of ruamel.yaml when available, defaults to True
+    :type pure: bool, optional
+    :param use_cache: if False, always parse the file, defaults to True
+    :type use_cache: bool, optional
+    :param use_snapshot: if True, load the snapshot written by :func:`compile_config` when it matches
+        the file, defaults to True
+    :type use_snapshot: bool, optional
+    :param watch: if True, reload the configuration when the file changes, see :meth:`watch`, defaults to False
+    :type watch: bool, optional
+    :param poll_interval: seconds between checks of the file in watch mode, defaults to 1.0
+    :type poll_interval: float, optional
 
     :ivar config_path: Path to the configuration file
     :ivar data: Program configuration (inherited from UserDict)
@@ -23,9 +173,22 @@ class ReadConfig(UserDict):
     :Example:
         >>> from ift_global import ReadConfig
         >>> config = ReadConfig('dev', './properties/conf.yaml')
+        >>> prod_config = ReadConfig('prod', './properties/conf.yaml', pure=False)
+        >>> live_config = ReadConfig('prod', './properties/conf.yaml', watch=True)
+        >>> live_config.add_callback(lambda config, changed_keys: print(changed_keys))
     """
 
-    def __init__(self, env_type: str, config_path: str = './properties/conf.yaml'):
+    def __init__(  # noqa: PLR0913
+            self,
+            env_type: str,
+            config_path: str = './properties/conf.yaml',
+            *,
+            pure: bool = True,
+            use_cache: bool = True,
+            use_snapshot: bool = True,
+            watch: bool = False,
+            poll_interval: float = 1.0
+        ):
         """
         Initialize the ReadConfig instance.
 
@@ -33,32 +196,163 @@ class ReadConfig(UserDict):
         :type env_type: str
         :param config_path: Path to the configuration file, defaults to './properties/conf.yaml'
         :type config_path: str, optional
+        :param pure: if False, parse with the C loader of ruamel.yaml when available, defaults to True
+        :type pure: bool, optional
+        :param use_cache: if False, always parse the file, defaults to True
+        :type use_cache: bool, optional
+        :param use_snapshot: if True, load the snapshot written by :func:`compile_config` when it matches
+            the file, defaults to True
+        :type use_snapshot: bool, optional
+        :param watch: if True, reload the configuration when the file changes, defaults to False
+        :type watch: bool, optional
+        :param poll_interval: seconds between checks of the file in watch mode, defaults to 1.0
+        :type poll_interval: float, optional
         """
         self.config_path = os.path.expanduser(config_path)
+        self.pure = pure
+        self.use_cache = use_cache
+        self.use_snapshot = use_snapshot
+        self._callbacks = []
+        self._watch_thread = None
+        self._stop_watch = threading.Event()
         self.load(env_type)
+        if watch:
+            self.watch(poll_interval)
 
     def load(self, env_type: str):
         """
         Load configuration from YAML file.
 
         This method reads the YAML file, extracts the configuration for the specified
-        environment type, and stores it in the `data` attribute.
+        environment type, and stores a copy of it in the `data` attribute.
 
         :param env_type: The environment type to load from the config file
         :type env_type: str
         :raises ScannerError: If there's an error parsing the YAML file or if the file is not found
         """
+        self.env_type = env_type
+        self._file_version = _file_version(self.config_path)
+        self._failed_version = None
+        self.data = self._read_env(env_type)
+
+    def _read_env(self, env_type: str) -> dict:
         try:
-            with open(os.path.expanduser(self.config_path), 'r') as f:
-                try:
-                    yaml_conn = yaml.YAML(typ='safe', pure=True)
-                    cfg_data = yaml_conn.load(f)
-                    self.data = cfg_data[env_type]
-                except ScannerError as e:
-                    raise ScannerError('Error parsing YAML config file {}: {}'.format(
-                            e.problem_mark,
-                            e.problem,
-                        )
+            try:
+                cfg_data = _parse_yaml(
+                    self.config_path, pure=self.pure, use_cache=self.use_cache, use_snapshot=self.use_snapshot
+                )
+            except ScannerError as e:
+                raise ScannerError('Error parsing YAML config file {}: {}'.format(
+                        e.problem_mark,
+                        e.problem,
                     )
+                )
         except FileNotFoundError:
-            raise ScannerError('YAML file not found in {}'.format(self.config_path))
\ No newline at end of file
+            raise ScannerError('YAML file not found in {}'.format(self.config_path))
+        # the cached document is shared, each instance owns a copy of its environment
+        return copy.deepcopy(cfg_data[env_type])
+
+    def add_callback(self, callback: callable):
+        """
+        Register a function called after each reload in watch mode.
+
+        :param callback: function called as `callback(config, changed_keys)` from the watching thread,
+            changed_keys being the set of top level keys added, removed or modified
+        :type callback: callable
+        """
+        self._callbacks.append(callback)
+
+    def watch(self, poll_interval: float = 1.0):
+        """
+        Reload the configuration when the file changes, in a background thread.
+
+        Changes are detected with inotify if `inotify_simple` is installed, else by polling the
+        modification time and size of the file every poll_interval seconds. The file is parsed
+        only when it changed, and `data` is replaced by the new configuration in a single
+        assignment, so readers never wait and never see a partially loaded configuration.
+        If the new file cannot be loaded, the previous configuration is kept.
+
+        :param poll_interval: seconds between checks of the file, defaults to 1.0
+        :type poll_interval: float, optional
+        """
+        if self._watch_thread is not None:
+            return
+        self._stop_watch.clear()
+        self._watch_thread = threading.Thread(
+            target=self._watch_loop, args=(poll_interval,), name='ift-config-watch', daemon=True
+        )
+        self._watch_thread.start()
+
+    def close(self):
+        """Stop watching the file."""
+        if self._watch_thread is not None:
+            self._stop_watch.set()
+            self._watch_thread.join()
+            self._watch_thread = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def _watch_loop(self, poll_interval: float):
+        try:
+            import inotify_simple
+        except ImportError:
+            inotify_simple = None
+        if inotify_simple is not None:
+            try:
+                self._watch_inotify(inotify_simple, poll_interval)
+                return
+            except OSError as e:
+                print(f'Config {self.config_path} not watched with inotify, polling: {e!r}', file=sys.stderr)
+        while not self._stop_watch.wait(poll_interval):
+            self._watch_reload()
+
+    def _watch_inotify(self, inotify_simple, poll_interval: float):
+        # editors often replace the file, the directory is watched for writes and renames
+        watch_flags = inotify_simple.flags.CLOSE_WRITE | inotify_simple.flags.MOVED_TO | inotify_simple.flags.CREATE
+        with inotify_simple.INotify() as inotify:
+            inotify.add_watch(os.path.dirname(os.path.abspath(self.config_path)), watch_flags)
+            while not self._stop_watch.is_set():
+                inotify.read(timeout=int(poll_interval * 1000))
+                self._watch_reload()
+
+    def _watch_reload(self):
+        """Reload in the watching thread, which must survive any error to pick up the next change."""
+        try:
+            self.reload()
+        except Exception as e:
+            print(f'Config {self.config_path} not reloaded: {e!r}', file=sys.stderr)
+
+    def reload(self) -> set:
+        """
+        Load the configuration again if the file changed since it was loaded.
+
+        :return: top level keys added, removed or modified, empty if the file did not change
+        :rtype: set
+        """
+        file_version = _file_version(self.config_path)
+        if file_version is None or file_version in (self._file_version, self._failed_version):
+            return set()
+        try:
+            new_data = self._read_env(self.env_type)
+        except (yaml.YAMLError, KeyError, TypeError, OSError) as e:
+            # a half saved file is reported once, and loaded when written again
+            self._failed_version = file_version
+            print(f'Config {self.config_path} not reloaded, previous configuration kept: {e!r}', file=sys.stderr)
+            return set()
+        self._file_version = file_version
+        old_data, self.data = self.data, new_data
+        changed_keys = {
+            key for key in old_data.keys() | new_data.keys()
+            if key not in old_data or key not in new_data or old_data[key] != new_data[key]
+        }
+        if changed_keys:
+            for callback in list(self._callbacks):
+                try:
+                    callback(self, changed_keys)
+                except Exception as e:
+                    print(f'Config reload callback {callback!r} failed: {e!r}', file=sys.stderr)
+        return changed_keys
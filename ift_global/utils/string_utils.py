@@ -1,12 +1,60 @@
+import functools
 import re
+import sys
+from typing import Optional
 
 from pydantic import validate_call
 
+TRIM_WHAT = ('both', 'leading', 'trailing', 'none')
+# classes of the arrow regex engine (RE2) are ASCII only, these match the unicode classes of python
+_RE2_UNICODE_CLASSES = {
+	's': r'\s\x{1c}-\x{1f}\x{85}\p{Z}',
+	'd': r'\p{Nd}',
+	'w': r'\p{L}\p{N}_',
+}
+_RE2_NEGATED_CLASSES = ('S', 'D', 'W')
+_ESCAPE = re.compile(r'\\(.)', re.DOTALL)
+
+
+@functools.lru_cache(maxsize=256)
+def _trim_pattern(what: str, action_regex: str) -> Optional[str]:
+	"""Regex removing the characters matched by action_regex at the start and/or end of a string."""
+	if what not in TRIM_WHAT:
+		raise ValueError('Only "both", "leading" and "trailing" are accepted for "what" argument')
+
+	match what:
+		case 'both':
+			return f'^[{action_regex}]+|[{action_regex}]+$'
+		case 'leading':
+			return f'^[{action_regex}]+'
+		case 'trailing':
+			return f'[{action_regex}]+$'
+	return None
+
+
+@functools.lru_cache(maxsize=256)
+def _arrow_trim_pattern(what: str, action_regex: str) -> Optional[str]:
+	"""Trim pattern for the arrow regex engine, None if its classes cannot match as the python ones."""
+	if any(x.group(1) in _RE2_NEGATED_CLASSES for x in _ESCAPE.finditer(action_regex)):
+		return None
+	# action_regex is always used inside a character class, where the unicode classes can be inlined
+	unicode_regex = _ESCAPE.sub(lambda x: _RE2_UNICODE_CLASSES.get(x.group(1), x.group(0)), action_regex)
+	return _trim_pattern(what, unicode_regex)
+
+
+@functools.lru_cache(maxsize=256)
+def _compiled_trim_pattern(what: str, action_regex: str) -> Optional[re.Pattern]:
+	pattern = _trim_pattern(what, action_regex)
+	return re.compile(pattern) if pattern is not None else None
+
 
 @validate_call
 def trim_string(x: str, what: str, action_regex: str = '\\s+') -> str:
 	r"""Trim end and/or start of a string based on regex expr
 
+	The regex is compiled once per (what, action_regex) and cached,
+	use :func:`trim_strings` to trim many strings at once.
+
 	:param x: a string to be cleaned
 	:type x: str
 	:param what: either leading (start), trailing (end) or both
@@ -15,16 +63,111 @@ def trim_string(x: str, what: str, action_regex: str = '\\s+') -> str:
 	:param action_regex: a regex expression, defaults to '\s+'
 	:type action_regex: str, optional
 	:raises ValueError: if the what argument is not in the specified
-	:return: trimmed string
+	:return: trimmed string, unchanged if what is none
 	:rtype: str
 	"""
-	if what not in ('both', 'leading', 'trailing', 'none'):
-		raise ValueError('Only "both", "leading" and "trailing" are accepted for "what" argument')
+	pattern = _compiled_trim_pattern(what, action_regex)
+	if pattern is None:
+		return x
+	return pattern.sub('', x)
 
-	match what:
-		case 'both':
-			return re.sub(f'^[{action_regex}]+|[{action_regex}]+$', '', x)
-		case 'leading':
-			return re.sub(f'^[{action_regex}]+', '', x)
-		case 'trailing':
-			return re.sub(f'[{action_regex}]+$', '', x)
+
+def _arrow_trim_series(values, pattern: str):
+	"""Trim a Series of python strings with the arrow kernel, None if arrow is missing or cannot run it."""
+	try:
+		import pyarrow
+		import pyarrow.compute as pc
+	except ImportError:
+		return None
+	try:
+		strings = pyarrow.array(values.to_numpy(), type=pyarrow.string(), from_pandas=True)
+		trimmed = pc.replace_substring_regex(strings, pattern=pattern, replacement='')
+	except (pyarrow.ArrowInvalid, pyarrow.ArrowTypeError):
+		return None
+	# missing values are kept as they are, NaN or None
+	present = values.notna().to_numpy()
+	result = values.copy()
+	result.iloc[present] = trimmed.to_numpy(zero_copy_only=False)[present]
+	return result
+
+
+def _trim_series(values, what: str, action_regex: str):
+	"""Trim a Series with the arrow kernel when the dtype and pattern allow it, else with the python regex."""
+	import pandas
+
+	compiled = _compiled_trim_pattern(what, action_regex)
+	arrow_pattern = _arrow_trim_pattern(what, action_regex)
+	storage = getattr(values.dtype, 'storage', None)
+	if values.dtype == object or storage == 'python':
+		trimmed = _arrow_trim_series(values, arrow_pattern) if arrow_pattern is not None else None
+		return trimmed if trimmed is not None else values.str.replace(compiled, '', regex=True)
+	if storage != 'pyarrow' and not isinstance(values.dtype, pandas.ArrowDtype):
+		return values.str.replace(compiled, '', regex=True)
+	if arrow_pattern is not None:
+		try:
+			return values.str.replace(arrow_pattern, '', regex=True)
+		except ValueError:
+			pass
+	# pattern not supported by the arrow regex engine, pandas runs the compiled pattern in python
+	return values.astype(object).str.replace(compiled, '', regex=True).astype(values.dtype)
+
+
+def trim_strings(values, what: str, action_regex: str = '\\s+'):
+	r"""
+	Trim end and/or start of many strings based on regex expr.
+
+	Vectorised :func:`trim_string`, values keep their container type:
+
+	- pyarrow Array or ChunkedArray: trimmed by the arrow compute kernel `replace_substring_regex`
+	- pandas Series: trimmed by the arrow kernel, through an arrow array for object strings, dtype kept
+	- list or tuple: trimmed with the compiled regex, returned as list
+
+	Arrow uses the RE2 regex syntax, where the classes \s, \d and \w are translated to
+	their unicode equivalent so that results match :func:`trim_string`. Patterns RE2 does
+	not support, i.e. lookarounds or negated classes, fall back to the python regex, as do
+	object Series holding values other than strings. Missing values are kept.
+
+	:param values: strings to be cleaned
+	:type values: Union[pd.Series, pyarrow.Array, pyarrow.ChunkedArray, list, tuple]
+	:param what: either leading (start), trailing (end), both or none
+	:type what: str
+	:param action_regex: a regex expression, defaults to '\s+'
+	:type action_regex: str, optional
+	:raises ValueError: if the what argument is not in the specified
+	:raises TypeError: if values is not a Series, arrow array, list or tuple
+	:return: trimmed strings
+	:rtype: Union[pd.Series, pyarrow.Array, pyarrow.ChunkedArray, list]
+	:Examples:
+		>>> trades['counterparty'] = trim_strings(trades['counterparty'], 'both')
+		>>> trim_strings(['00123', '0456'], 'leading', action_regex='0')
+		['123', '456']
+	"""  # noqa: D206
+	compiled = _compiled_trim_pattern(what, action_regex)
+	pandas = sys.modules.get('pandas')
+	pyarrow = sys.modules.get('pyarrow')
+
+	if pandas is not None and isinstance(values, pandas.Series):
+		if compiled is None:
+			return values.copy()
+		return _trim_series(values, what, action_regex)
+
+	if pyarrow is not None and isinstance(values, (pyarrow.Array, pyarrow.ChunkedArray)):
+		if compiled is None:
+			return values
+		import pyarrow.compute as pc
+
+		arrow_pattern = _arrow_trim_pattern(what, action_regex)
+		try:
+			if arrow_pattern is None:
+				raise pyarrow.ArrowInvalid(f'{action_regex} has no RE2 equivalent')
+			return pc.replace_substring_regex(values, pattern=arrow_pattern, replacement='')
+		except pyarrow.ArrowInvalid:
+			trimmed = pyarrow.array(trim_strings(values.to_pylist(), what, action_regex), type=values.type)
+			return pyarrow.chunked_array([trimmed]) if isinstance(values, pyarrow.ChunkedArray) else trimmed
+
+	if isinstance(values, (list, tuple)):
+		if compiled is None:
+			return list(values)
+		return [compiled.sub('', x) if x is not None else None for x in values]
+
+	raise TypeError('Accepted values are only pd.Series, pyarrow arrays, lists or tuples of strings')
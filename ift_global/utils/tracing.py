@@ -0,0 +1,389 @@
+"""
+Opt-in tracing spans and profiling hooks.
+
+Spans are emitted through a module level tracer, by default a no-op :class:`Tracer`
+that costs one function call per span. Enable tracing with :func:`set_tracer`, or by
+exporting `IFT_TRACE_FILE` to write JSON lines to a file.
+
+Any span, or any block wrapped in :func:`profile_block`, can be profiled with cProfile
+and/or tracemalloc by naming it in the `IFT_PROFILE` environment variable:
+
+- IFT_PROFILE: comma separated span names to profile, i.e. `read_file,deserialise_parquet`.
+- IFT_PROFILE_MODE: `cprofile` (default), `tracemalloc` or `both`.
+- IFT_PROFILE_DIR: directory where the profiles are written, defaults to the temporary directory.
+"""
+import contextvars
+import cProfile
+import functools
+import itertools
+import json
+import os
+import sys
+import tempfile
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager, nullcontext
+from contextvars import ContextVar
+from typing import Optional
+
+_NOOP_SPAN = nullcontext()
+_current_span = ContextVar('ift_current_span', default=None)
+_span_ids = itertools.count(1)
+# peaks of the blocks traced with tracemalloc, carried over when a nested block resets the peak
+_memory_peaks = []
+_memory_peaks_lock = threading.Lock()
+
+
+class Tracer:
+    """
+    No-op Tracer.
+
+    Base class and default tracer, spans are discarded.
+    Subclasses set `enabled` to True and implement :meth:`span`.
+    """
+
+    enabled = False
+
+    def span(self, name: str, **attributes):
+        """
+        Open a span.
+
+        :param name: name of the span, i.e. read_file
+        :type name: str
+        :param attributes: attributes attached to the span
+        :return: context manager timing the block
+        """
+        return _NOOP_SPAN
+
+
+class JsonLinesTracer(Tracer):
+    """
+    JSON Lines Tracer.
+
+    Writes one JSON line per span when the span ends, with name, span_id, parent_id,
+    trace_id, start (epoch seconds), duration (seconds), error and attributes.
+    Spans nest following the calling context.
+
+    :param sink: file path to append to, or a writable text file object
+    :type sink: Union[str, io.TextIOBase]
+
+    :Example:
+        >>> from ift_global.utils import tracing
+        >>> tracing.set_tracer(tracing.JsonLinesTracer('./trace.jsonl'))
+        >>> minio_repo.read_file('/iftbigdata/input/trades.parquet', 'parquet')
+    """
+
+    enabled = True
+
+    def __init__(self, sink):
+        """Constructor method."""
+        self._owns_sink = isinstance(sink, (str, os.PathLike))
+        self._sink = open(sink, 'a', encoding='utf-8') if self._owns_sink else sink
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def span(self, name: str, **attributes):
+        parent = _current_span.get()
+        span_id = next(_span_ids)
+        trace_id = parent[1] if parent else span_id
+        token = _current_span.set((span_id, trace_id))
+        start, start_counter = time.time(), time.perf_counter()
+        error = None
+        try:
+            yield
+        except Exception as exc:
+            error = type(exc).__name__
+            raise
+        finally:
+            _current_span.reset(token)
+            record = {
+                'name': name,
+                'span_id': span_id,
+                'parent_id': parent[0] if parent else None,
+                'trace_id': trace_id,
+                'start': start,
+                'duration': time.perf_counter() - start_counter,
+                'error': error,
+                'attributes': attributes,
+            }
+            line = json.dumps(record, default=str)
+            with self._lock:
+                self._sink.write(line + '\n')
+                self._sink.flush()
+
+    def close(self):
+        """Close the sink if it was opened by the tracer."""
+        if self._owns_sink:
+            self._sink.close()
+
+
+class OpenTelemetryTracer(Tracer):
+    """
+    OpenTelemetry Tracer.
+
+    Emits spans through the OpenTelemetry API, export is configured on the tracer provider,
+    i.e. with a local SDK exporter. Requires the `opentelemetry-api` package.
+
+    :param tracer_provider: OpenTelemetry tracer provider, defaults to the global provider
+    :type tracer_provider: opentelemetry.trace.TracerProvider, optional
+    :param name: instrumentation name, defaults to 'ift_global'
+    :type name: str, optional
+
+    :Example:
+        >>> from opentelemetry.sdk.trace import TracerProvider
+        >>> from opentelemetry.sdk.trace.export import ConsoleSpanExporter, SimpleSpanProcessor
+        >>> provider = TracerProvider()
+        >>> provider.add_span_processor(SimpleSpanProcessor(ConsoleSpanExporter()))
+        >>> tracing.set_tracer(tracing.OpenTelemetryTracer(provider))
+    """
+
+    enabled = True
+
+    def __init__(self, tracer_provider=None, name: str = 'ift_global'):
+        """Constructor method."""
+        from opentelemetry import trace
+
+        self._tracer = trace.get_tracer(name, tracer_provider=tracer_provider)
+
+    def span(self, name: str, **attributes):
+        return self._tracer.start_as_current_span(name, attributes=attributes)
+
+
+class _TracingState:
+    """Module level tracing configuration."""
+
+    __slots__ = ('tracer', 'profile_names', 'profile_mode', 'profile_dir')
+
+    def __init__(self):
+        self.tracer = Tracer()
+        self.profile_names = frozenset()
+        self.profile_mode = 'cprofile'
+        self.profile_dir = None
+
+
+_state = _TracingState()
+
+
+def set_tracer(tracer: Optional[Tracer] = None) -> Tracer:
+    """
+    Set the tracer receiving the spans.
+
+    :param tracer: tracer instance, if None tracing is disabled
+    :type tracer: Tracer, optional
+    :return: the previous tracer
+    :rtype: Tracer
+    """
+    previous, _state.tracer = _state.tracer, tracer or Tracer()
+    return previous
+
+
+def get_tracer() -> Tracer:
+    """
+    Get the tracer receiving the spans.
+
+    :return: current tracer
+    :rtype: Tracer
+    """
+    return _state.tracer
+
+
+def configure_profiling(
+        names: Optional[str] = None,
+        mode: Optional[str] = None,
+        output_dir: Optional[str] = None
+    ):
+    """
+    Configure which spans are profiled, defaults are read from the environment.
+
+    :param names: comma separated span names, defaults to os.getenv('IFT_PROFILE')
+    :type names: str, optional
+    :param mode: `cprofile`, `tracemalloc` or `both`, defaults to os.getenv('IFT_PROFILE_MODE', 'cprofile')
+    :type mode: str, optional
+    :param output_dir: directory for the profiles, defaults to os.getenv('IFT_PROFILE_DIR')
+    :type output_dir: str, optional
+    :raises ValueError: if mode is not accepted
+    """
+    names = os.getenv('IFT_PROFILE', '') if names is None else names
+    mode = mode or os.getenv('IFT_PROFILE_MODE', 'cprofile')
+    if mode not in ('cprofile', 'tracemalloc', 'both'):
+        raise ValueError('Only "cprofile", "tracemalloc" and "both" are accepted for profiling mode')
+    _state.profile_names = frozenset(x.strip() for x in names.split(',') if x.strip())
+    _state.profile_mode = mode
+    _state.profile_dir = output_dir or os.getenv('IFT_PROFILE_DIR')
+
+
+def _profiler_active() -> bool:
+    """True if a profiler runs, process wide from Python 3.12, in the current thread before."""
+    monitoring = getattr(sys, 'monitoring', None)
+    if monitoring is not None:
+        return monitoring.get_tool(monitoring.PROFILER_ID) is not None
+    return sys.getprofile() is not None
+
+
+def _start_profiler() -> Optional[cProfile.Profile]:
+    """Start a cProfile profiler, None if another profiler is active, i.e. in a profiled outer block."""
+    if _profiler_active():
+        return None
+    profiler = cProfile.Profile()
+    try:
+        profiler.enable()
+    except ValueError:
+        # another thread started a profiler meanwhile
+        return None
+    return profiler
+
+
+@contextmanager
+def profile_block(name: str, mode: Optional[str] = None, output_dir: Optional[str] = None):
+    """
+    Profile a named block of code.
+
+    Writes `<name>_<pid>_<timestamp>.prof` (cProfile, readable with `pstats`) and/or
+    `<name>_<pid>_<timestamp>.tracemalloc.txt` (top allocations and peak memory).
+    cProfile is skipped when another profiler is active, as in a block nested in a profiled
+    block, or from Python 3.12 in another thread: the outer profile includes the block.
+    Blocks nested in a tracemalloc block report their own peak, the outer peak covers the whole block.
+    Profiling errors are printed to stderr, never raised into the profiled code.
+
+    :param name: name of the block, used in the output file names
+    :type name: str
+    :param mode: `cprofile`, `tracemalloc` or `both`, defaults to the configured mode
+    :type mode: str, optional
+    :param output_dir: directory for the profiles, defaults to the configured directory
+    :type output_dir: str, optional
+
+    :Example:
+        >>> with profile_block('build_positions', mode='both', output_dir='./profiles'):
+        ...     positions = build_positions(trades)
+    """
+    mode = mode or _state.profile_mode
+    output_dir = output_dir or _state.profile_dir or tempfile.gettempdir()
+    file_stem = os.path.join(output_dir, f"{name}_{os.getpid()}_{time.time_ns()}")
+    profiler = None
+    trace_memory = mode in ('tracemalloc', 'both')
+    started_tracemalloc = trace_memory and not tracemalloc.is_tracing()
+    if started_tracemalloc:
+        tracemalloc.start()
+    peak = [0]
+    if trace_memory:
+        _reset_memory_peak(peak)
+    if mode in ('cprofile', 'both'):
+        profiler = _start_profiler()
+    try:
+        yield
+    finally:
+        if profiler:
+            profiler.disable()
+        memory_stats = None
+        if trace_memory:
+            memory_stats = _pop_memory_peak(peak), tracemalloc.take_snapshot().statistics('lineno')[:25]
+            if started_tracemalloc:
+                tracemalloc.stop()
+        try:
+            _write_profiles(file_stem, profiler, memory_stats)
+        except OSError as e:
+            print(f'Profiles of {name} not written: {e!r}', file=sys.stderr)
+
+
+def _reset_memory_peak(peak: list):
+    """Reset the tracemalloc peak for a new block, keeping the peak reached so far by the enclosing blocks."""
+    with _memory_peaks_lock:
+        current_peak = tracemalloc.get_traced_memory()[1]
+        for outer_peak in _memory_peaks:
+            outer_peak[0] = max(outer_peak[0], current_peak)
+        tracemalloc.reset_peak()
+        _memory_peaks.append(peak)
+
+
+def _pop_memory_peak(peak: list) -> int:
+    """Peak traced memory of a block, including the peaks reached before resets by nested blocks."""
+    with _memory_peaks_lock:
+        _memory_peaks.remove(peak)
+        return max(peak[0], tracemalloc.get_traced_memory()[1])
+
+
+def _write_profiles(file_stem: str, profiler: Optional[cProfile.Profile], memory_stats: Optional[tuple]):
+    os.makedirs(os.path.dirname(file_stem), exist_ok=True)
+    if profiler:
+        profiler.dump_stats(f'{file_stem}.prof')
+    if memory_stats:
+        peak, top_stats = memory_stats
+        with open(f'{file_stem}.tracemalloc.txt', 'w', encoding='utf-8') as f:
+            f.write(f'peak_bytes: {peak}\n')
+            f.writelines(f'{stat}\n' for stat in top_stats)
+
+
+def span(name: str, **attributes):
+    """
+    Open a span with the current tracer, profiling it if named in `IFT_PROFILE`.
+
+    :param name: name of the span, i.e. read_file
+    :type name: str
+    :param attributes: attributes attached to the span
+    :return: context manager
+
+    :Example:
+        >>> with tracing.span('build_positions', book='rates'):
+        ...     positions = build_positions(trades)
+    """
+    if name in _state.profile_names:
+        return _profiled_span(name, attributes)
+    return _state.tracer.span(name, **attributes)
+
+
+def submit(executor, fn, *args, **kwargs):
+    """
+    Submit a call to an executor in a copy of the current context.
+
+    Spans opened by the call keep the span open at submission as parent.
+
+    :param executor: executor, i.e. a ThreadPoolExecutor
+    :type executor: concurrent.futures.Executor
+    :param fn: callable to run
+    :param args: positional arguments of fn
+    :param kwargs: keyword arguments of fn
+    :return: future of the call
+    :rtype: concurrent.futures.Future
+
+    :Example:
+        >>> futures = [tracing.submit(executor, fetch, key) for key in keys]
+    """
+    return executor.submit(contextvars.copy_context().run, fn, *args, **kwargs)
+
+
+@contextmanager
+def _profiled_span(name: str, attributes: dict):
+    with _state.tracer.span(name, **attributes), profile_block(name):
+        yield
+
+
+def traced(name: Optional[str] = None):
+    """
+    Decorator opening a span around each call of the function.
+
+    :param name: name of the span, defaults to the function name
+    :type name: str, optional
+    :return: decorator
+
+    :Example:
+        >>> @traced()
+        ... def deserialise_parquet(response_body):
+        ...     ...
+    """
+    def decorator(func):
+        span_name = name or func.__name__
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not _state.tracer.enabled and not _state.profile_names:
+                return func(*args, **kwargs)
+            with span(span_name):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+configure_profiling()
+if os.getenv('IFT_TRACE_FILE'):
+    set_tracer(JsonLinesTracer(os.environ['IFT_TRACE_FILE']))